@@ -524,8 +524,18 @@ export class DentsiAgentService {
 
   /**
    * Process user input and generate response
+   *
+   * When onToken is given, the final reply is streamed from OpenAI and each
+   * text delta is passed to it as it arrives; the full response is still
+   * returned at the end. Text streamed by an iteration that then calls tools
+   * is not part of the reply: onReset is called so the caller can drop it.
    */
-  async processUserInput(callSid: string, userMessage: string): Promise<AgentResponse> {
+  async processUserInput(
+    callSid: string,
+    userMessage: string,
+    onToken?: (delta: string) => void,
+    onReset?: () => void,
+  ): Promise<AgentResponse> {
     const session = this.sessions.get(callSid);
     
     if (!session) {
@@ -553,7 +563,7 @@ export class DentsiAgentService {
     try {
       // Call OpenAI with tools
       const startTime = Date.now();
-      const response = await this.runAgentLoop(session);
+      const response = await this.runAgentLoop(session, onToken, onReset);
       const latencyMs = Date.now() - startTime;
       
       // Add assistant response to history
@@ -580,7 +590,11 @@ export class DentsiAgentService {
   /**
    * Main agent loop - handles tool calls iteratively
    */
-  private async runAgentLoop(session: CallSession): Promise<AgentResponse> {
+  private async runAgentLoop(
+    session: CallSession,
+    onToken?: (delta: string) => void,
+    onReset?: () => void,
+  ): Promise<AgentResponse> {
     const maxIterations = 5; // Prevent infinite loops
     let iterations = 0;
 
@@ -604,21 +618,28 @@ export class DentsiAgentService {
         });
 
       // Call OpenAI
-      const completion = await this.openai.chat.completions.create({
+      const request = {
         model: this.configService.get<string>('OPENAI_MODEL') || 'gpt-4',
         messages,
         tools: TOOL_DEFINITIONS,
-        tool_choice: 'auto',
+        tool_choice: 'auto' as const,
         temperature: 0.7,
         max_tokens: 300, // Keep responses concise for voice
-      });
+      };
 
-      const assistantMessage = completion.choices[0].message;
+      const assistantMessage = onToken
+        ? await this.streamCompletion(request, onToken)
+        : (await this.openai.chat.completions.create(request)).choices[0].message;
 
       // Check if there are tool calls to process
       if (assistantMessage.tool_calls && assistantMessage.tool_calls.length > 0) {
         this.logger.log(`Processing ${assistantMessage.tool_calls.length} tool calls`);
 
+        // Only the final iteration's text is the reply; take back what this one streamed
+        if (onToken && assistantMessage.content) {
+          onReset?.();
+        }
+
         // Add assistant message with tool calls to history (for context)
         session.conversationHistory.push({
           role: 'assistant',
@@ -682,6 +703,45 @@ export class DentsiAgentService {
     };
   }
 
+  /**
+   * Streamed completion, reassembled into a regular assistant message.
+   * Text deltas are forwarded to onToken; tool call fragments are
+   * accumulated by index until the stream ends.
+   */
+  private async streamCompletion(
+    request: OpenAI.Chat.Completions.ChatCompletionCreateParamsNonStreaming,
+    onToken: (delta: string) => void,
+  ): Promise<{ content: string | null; tool_calls?: ToolCall[] }> {
+    const stream = await this.openai.chat.completions.create({ ...request, stream: true });
+
+    let content = '';
+    const toolCalls: ToolCall[] = [];
+    for await (const chunk of stream) {
+      const delta = chunk.choices[0]?.delta;
+      if (!delta) continue;
+
+      if (delta.content) {
+        content += delta.content;
+        onToken(delta.content);
+      }
+      for (const tc of delta.tool_calls || []) {
+        const call = (toolCalls[tc.index] ??= {
+          id: '',
+          type: 'function',
+          function: { name: '', arguments: '' },
+        } as ToolCall);
+        if (tc.id) call.id = tc.id;
+        if (tc.function?.name) call.function.name += tc.function.name;
+        if (tc.function?.arguments) call.function.arguments += tc.function.arguments;
+      }
+    }
+
+    return {
+      content: content || null,
+      tool_calls: toolCalls.length > 0 ? toolCalls.filter(Boolean) : undefined,
+    };
+  }
+
   /**
    * Execute a tool call
    */
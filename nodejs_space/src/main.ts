@@ -16,6 +16,25 @@ async function bootstrap() {
     credentials: true,
   });
 
+  // Log the W3C trace context the Streamlit dashboards send, so a slow
+  // request can be matched with the dashboard rerun (trace) that made it
+  const httpLogger = new Logger('HTTP');
+  app.use((req: Request, res: Response, next: NextFunction) => {
+    const traceparent = req.headers['traceparent'];
+    if (typeof traceparent !== 'string') {
+      return next();
+    }
+    const match = /^[\da-f]{2}-([\da-f]{32})-([\da-f]{16})-[\da-f]{2}$/.exec(traceparent);
+    const started = Date.now();
+    res.on('finish', () => {
+      httpLogger.log(
+        `${req.method} ${req.originalUrl} ${res.statusCode} ${Date.now() - started}ms ` +
+          (match ? `trace_id=${match[1]} parent_id=${match[2]}` : `traceparent=invalid`),
+      );
+    });
+    next();
+  });
+
   // Serve dashboard static files
   const dashboardPath = join(__dirname, '..', 'public', 'dashboard');
   
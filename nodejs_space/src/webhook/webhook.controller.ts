@@ -6,8 +6,10 @@ import {
   Logger,
   HttpCode,
   Header,
+  Res,
 } from '@nestjs/common';
 import { ApiTags, ApiOperation, ApiBody } from '@nestjs/swagger';
+import type { Response } from 'express';
 import { WebhookService } from './webhook.service';
 import { OutboundCallService, OutboundCallType } from '../outbound/outbound-call.service';
 import { PrismaService } from '../prisma/prisma.service';
@@ -101,6 +103,87 @@ export class WebhookController {
     }
   }
 
+  /**
+   * Streaming variant of the demo endpoint (Server-Sent Events)
+   *
+   * Emits `token` events with text deltas as the reply is generated, then a
+   * single `done` event carrying the same payload as POST /webhook/demo.
+   * A `reset` event means the text streamed so far preceded a tool call and
+   * is not part of the reply; clients discard it.
+   */
+  @Post('demo/stream')
+  @ApiOperation({ summary: 'Demo conversation endpoint, streamed as Server-Sent Events' })
+  @ApiBody({ type: DemoConversationDto })
+  async handleDemoConversationStream(
+    @Body() body: DemoConversationDto,
+    @Res() res: Response,
+  ): Promise<void> {
+    const sessionId = body.sessionId || `demo-${Date.now()}`;
+    this.logger.log(`🎬 Demo conversation (stream): ${sessionId} - "${body.userMessage}"`);
+
+    res.status(200);
+    res.setHeader('Content-Type', 'text/event-stream');
+    res.setHeader('Cache-Control', 'no-cache');
+    res.setHeader('Connection', 'keep-alive');
+    res.setHeader('X-Accel-Buffering', 'no');
+    res.flushHeaders();
+
+    const send = (event: string, data: unknown) => {
+      res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+    };
+
+    try {
+      let clinicId = body.clinicId;
+      if (!clinicId) {
+        const firstClinic = await this.prisma.clinic.findFirst();
+        clinicId = firstClinic?.id;
+      }
+
+      if (!clinicId) {
+        send('done', {
+          success: false,
+          sessionId,
+          response: 'No clinic configured. Please add a clinic first.',
+        });
+        return;
+      }
+
+      if (!this.dentsiAgent.getSession(sessionId)) {
+        await this.dentsiAgent.initializeSession(
+          sessionId,
+          clinicId,
+          body.callerPhone || '+15551234567',
+        );
+      }
+
+      const result = await this.dentsiAgent.processUserInput(
+        sessionId,
+        body.userMessage,
+        (delta) => send('token', { text: delta }),
+        () => send('reset', {}),
+      );
+      const session = this.dentsiAgent.getSession(sessionId);
+
+      send('done', {
+        success: true,
+        sessionId,
+        response: result.message,
+        intent: result.intent,
+        patientInfo: session?.patientContext,
+        appointmentBooked: result.bookingConfirmation,
+      });
+    } catch (error) {
+      this.logger.error(`Demo stream error: ${error.message}`);
+      send('done', {
+        success: false,
+        sessionId,
+        response: `Error: ${error.message}`,
+      });
+    } finally {
+      res.end();
+    }
+  }
+
   /**
    * Start a new demo session
    */
@@ -0,0 +1,364 @@
+"""
+Render benchmarks for the Dentsi dashboards.
+
+Each page of the multipage app is run headless with Streamlit's AppTest against a local
+stub_api.py server holding 100, 10k or 100k rows, fully offline. Pages
+whose fetches are all capped by the API's `limit` read the same rows from
+any stub and are measured at the smallest size only; the others are run
+with the widget settings that make their fetches grow with the data
+(SCENARIOS). Per app and data size it records:
+
+    cold_s      median first run with empty st.cache_data / st.cache_resource
+                and fetcher cache (sized_cache.py)
+    warm_s      median rerun after that (caches filled)
+    peak_mb     peak Python heap during a cold run (tracemalloc)
+    elements    elements on the page after the run
+    tabs        warm wall time and element count per tab
+
+and compares them with the budgets in bench_budgets.json, exiting 1 if
+any budget is exceeded. Timing budgets are relative to the machine they
+were recorded on: the file keeps that machine's time for a fixed CPU
+workload (calibration_s), and on another machine the time budgets are
+scaled by the ratio of the two.
+
+    python bench.py                                    # every page at every size
+    python bench.py --apps pages/app.py --sizes 100    # one page, one size
+    python bench.py --update-budgets                   # re-baseline after an intended change
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import streamlit as st
+from streamlit.elements.lib.mutable_tab_container import TabContainer
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block, Tab
+
+import sized_cache
+
+HERE = Path(__file__).resolve().parent
+
+APPS = ["pages/app.py", "pages/dentra_app.py", "pages/dentsi_app.py", "pages/dentsi_complete.py",
+        "pages/dentsi_overview.py"]
+SIZES = [100, 10_000, 100_000]
+RERUNS = 3
+
+# Every fetch of these pages is capped by `limit`, so larger stubs change nothing
+CAPPED_APPS = {"pages/app.py", "pages/dentra_app.py", "pages/dentsi_overview.py"}
+
+# Widget state set before the first run, so the rows a page reads grow with the stub
+SCENARIOS = {
+    # Revenue over 12 months plus the previous 12: every appointment page in that window
+    "pages/dentsi_app.py": {"revenue_period": "Last 12 Months"},
+}
+TIMEOUT = 600
+
+BUDGETS_FILE = HERE / "bench_budgets.json"
+
+# Budgets written by --update-budgets are the measurement times HEADROOM,
+# and at least SLACK_S seconds / SLACK_MB above it so millisecond timings
+# and small heaps are not failed by scheduler or allocator noise
+HEADROOM = {"cold_s": 1.5, "warm_s": 1.5, "peak_mb": 1.5, "elements": 1.25}
+SLACK_S = 0.05
+SLACK_MB = 0.5
+TIMINGS = ("cold_s", "warm_s")
+
+
+# ============================================================================
+# STUB API
+# ============================================================================
+
+class StubServer:
+    """stub_api.py in a child process, so its memory stays out of the measurements."""
+
+    def __init__(self, rows, extra_args=()):
+        self.rows = rows
+        self.extra_args = list(extra_args)
+        self.process = None
+        self.url = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, str(HERE / "stub_api.py"), "--port", "0", "--rows", str(self.rows)] + self.extra_args,
+            stdout=subprocess.PIPE, text=True, cwd=HERE,
+        )
+        line = self.process.stdout.readline()
+        if " on " not in line:
+            self.process.kill()
+            raise RuntimeError(f"stub_api.py did not start: {line!r}")
+        self.url = line.rsplit(" on ", 1)[1].strip()
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.wait()
+        return False
+
+
+def offline_env(api_base):
+    """Point the apps at the stub; anything else fails fast instead of reaching the network"""
+    return {
+        "DENTSI_API_BASE": api_base,
+        "HTTP_PROXY": "http://127.0.0.1:9",
+        "HTTPS_PROXY": "http://127.0.0.1:9",
+        "NO_PROXY": "127.0.0.1,localhost",
+    }
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+class TabTimer:
+    """Wall time spent inside each `with tab:` block, keyed by the tab's delta path."""
+
+    def __init__(self):
+        self.times = {}
+        self._stack = []
+        self._enter = TabContainer.__enter__
+        self._exit = TabContainer.__exit__
+
+    def __enter__(self):
+        timer, enter, exit_ = self, self._enter, self._exit
+
+        def timed_enter(tab):
+            timer._stack.append((tuple(tab._cursor.delta_path[:-1]), time.perf_counter()))
+            return enter(tab)
+
+        def timed_exit(tab, *exc):
+            path, started = timer._stack.pop()
+            timer.times[path] = timer.times.get(path, 0.0) + time.perf_counter() - started
+            return exit_(tab, *exc)
+
+        TabContainer.__enter__, TabContainer.__exit__ = timed_enter, timed_exit
+        return self
+
+    def __exit__(self, *exc):
+        TabContainer.__enter__, TabContainer.__exit__ = self._enter, self._exit
+        return False
+
+    def reset(self):
+        self.times = {}
+
+
+def count_elements(node):
+    if isinstance(node, Block):
+        return sum(count_elements(child) for child in node.children.values())
+    return 1
+
+
+def tab_elements(at):
+    """{delta path: (label, element count)} for every tab on the page"""
+    found = {}
+
+    def walk(node, path):
+        if isinstance(node, Tab):
+            found[path] = (node.label, count_elements(node))
+        if isinstance(node, Block):
+            for k, child in node.children.items():
+                walk(child, path + (k,))
+
+    for k, child in at._tree.children.items():
+        walk(child, (k,))
+    return found
+
+
+def clear_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    sized_cache.clear()
+
+
+def calibrate(rounds=9):
+    """Fastest of `rounds` timings of a fixed workload (JSON round trip and sort of 20k records)"""
+    records = [{"id": i, "name": f"Patient {i}", "price": (i * 37) % 500} for i in range(20_000)]
+    times = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        sorted(json.loads(json.dumps(records)), key=lambda r: (r["price"], r["name"]))
+        times.append(time.perf_counter() - started)
+    return round(min(times), 4)
+
+
+def run_once(at):
+    started = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def new_test(app):
+    """AppTest for one app with its SCENARIOS widget state applied"""
+    at = AppTest.from_file(str(HERE / app), default_timeout=TIMEOUT)
+    for key, value in SCENARIOS.get(app, {}).items():
+        at.session_state[key] = value
+    return at
+
+
+def bench_app(app, reruns=RERUNS):
+    """Measurements for one app against whatever DENTSI_API_BASE points at"""
+    # Untimed first run so module imports are not billed to whichever app runs first
+    new_test(app).run()
+
+    clear_caches()
+    tracemalloc.start()
+    run_once(new_test(app))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    cold = []
+    for _ in range(reruns):
+        clear_caches()
+        at = new_test(app)
+        cold.append(run_once(at))
+    with TabTimer() as tabs:
+        warm, tab_times = [], []
+        for _ in range(reruns):
+            tabs.reset()
+            warm.append(run_once(at))
+            tab_times.append(tabs.times)
+
+    tab_stats = {}
+    for tab_path, (label, elements) in tab_elements(at).items():
+        times = [t.get(tab_path, 0.0) for t in tab_times]
+        tab_stats[label] = {"warm_s": round(statistics.median(times), 4), "elements": elements}
+    return {
+        "cold_s": round(statistics.median(cold), 4),
+        "warm_s": round(statistics.median(warm), 4),
+        "peak_mb": round(peak / 2 ** 20, 2),
+        "elements": sum(count_elements(child) for child in at._tree.children.values()),
+        "tabs": tab_stats,
+    }
+
+
+# ============================================================================
+# BUDGETS
+# ============================================================================
+
+def load_budgets(path=BUDGETS_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def over_budget(results, budgets, scale=1.0):
+    """Human-readable list of every measurement above its budget (time budgets x `scale`)"""
+    failures = []
+    for app, by_size in results.items():
+        for size, result in by_size.items():
+            budget = budgets.get(app, {}).get(size)
+            if budget is None:
+                failures.append(f"{app} @ {size} rows: no budget (run with --update-budgets)")
+                continue
+            for metric in HEADROOM:
+                if metric not in budget:
+                    continue
+                limit = round(budget[metric] * scale, 3) if metric in TIMINGS else budget[metric]
+                if result[metric] > limit:
+                    failures.append(f"{app} @ {size} rows: {metric} {result[metric]} > budget {limit}")
+            for label, tab in result["tabs"].items():
+                limit = budget.get("tabs", {}).get(label)
+                if limit is not None and tab["warm_s"] > round(limit * scale, 3):
+                    failures.append(f"{app} @ {size} rows: tab {label} warm_s {tab['warm_s']} > budget {round(limit * scale, 3)}")
+    return failures
+
+
+def time_budget(seconds, metric):
+    return round(max(seconds * HEADROOM[metric], seconds + SLACK_S), 3)
+
+
+def budgets_from(results, budgets, calibration_s, scale=1.0):
+    """budgets with every measured (app, size) replaced by measurement x HEADROOM.
+
+    Budgets kept from an earlier recording are rescaled (by `scale`) to
+    this machine, whose calibration_s the file then records.
+    """
+    budgets = dict(budgets)
+    if scale != 1.0:
+        for app, by_size in budgets.items():
+            if not isinstance(by_size, dict) or app in results:
+                continue
+            for budget in by_size.values():
+                for metric in TIMINGS:
+                    budget[metric] = round(budget[metric] * scale, 3)
+                budget["tabs"] = {label: round(limit * scale, 3) for label, limit in budget.get("tabs", {}).items()}
+    budgets["calibration_s"] = calibration_s
+    for app, by_size in results.items():
+        app_budgets = budgets.setdefault(app, {})
+        for size, result in by_size.items():
+            budget = {metric: time_budget(result[metric], metric) for metric in TIMINGS}
+            budget["peak_mb"] = round(max(result["peak_mb"] * HEADROOM["peak_mb"], result["peak_mb"] + SLACK_MB), 2)
+            budget["elements"] = int(result["elements"] * HEADROOM["elements"]) + 1
+            budget["tabs"] = {label: time_budget(tab["warm_s"], "warm_s") for label, tab in result["tabs"].items()}
+            app_budgets[size] = budget
+    return budgets
+
+
+def print_results(results):
+    print(f"{'app':<28}{'rows':>8}{'cold s':>9}{'warm s':>9}{'peak MB':>10}{'elements':>10}")
+    for app, by_size in results.items():
+        for size, r in by_size.items():
+            print(f"{app:<28}{size:>8}{r['cold_s']:>9.3f}{r['warm_s']:>9.3f}{r['peak_mb']:>10.1f}{r['elements']:>10}")
+            for label, tab in r["tabs"].items():
+                print(f"    {label:<32}{tab['warm_s']:>19.3f}{tab['elements']:>20}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Dentsi dashboard reruns against the stub API")
+    parser.add_argument("--apps", nargs="+", default=APPS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--reruns", type=int, default=RERUNS)
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_FILE)
+    parser.add_argument("--update-budgets", "--write-budgets", dest="update_budgets", action="store_true", help="write measured budgets instead of checking")
+    parser.add_argument("--json", type=Path, default=None, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    os.chdir(HERE)
+    # Streamlit's deprecation and "no runtime" warnings would drown the report
+    logging.disable(logging.WARNING)
+    calibration_s = calibrate()
+    results = {app: {} for app in args.apps}
+    for size in args.sizes:
+        with StubServer(size) as stub:
+            os.environ.update(offline_env(stub.url))
+            # Nothing fetched from the previous size's stub may answer for this one
+            clear_caches()
+            for app in args.apps:
+                if app in CAPPED_APPS and size != min(args.sizes):
+                    continue
+                print(f"... {app} @ {size} rows", file=sys.stderr, flush=True)
+                results[app][str(size)] = bench_app(app, args.reruns)
+
+    print_results(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    budgets = load_budgets(args.budgets)
+    # Time budgets scale with how much slower (or faster) this machine is than the recording one
+    scale = calibration_s / budgets["calibration_s"] if budgets.get("calibration_s") else 1.0
+    print(f"calibration {calibration_s:.3f}s, time budgets x {scale:.2f}")
+    if args.update_budgets:
+        budgets = budgets_from(results, budgets, calibration_s, scale)
+        args.budgets.write_text(json.dumps(budgets, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Budgets written to {args.budgets}")
+        return 0
+    failures = over_budget(results, budgets, scale)
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
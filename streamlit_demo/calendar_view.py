@@ -0,0 +1,224 @@
+"""
+Month calendar view model and cached HTML renderer for the Dentsi dashboards.
+
+Booked appointments are kept in a date-sorted index so a month (or any
+other date range) is two bisects and a slice. Pages index the appointments
+fetched for the range on screen; rendered month grids are cached per
+(clinic, month, data version, today) and the months either side of the
+one on screen are loaded and rendered in the background, so paging is a
+cache hit.
+"""
+
+import calendar
+import html
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pricing
+
+MAX_PER_DAY = 3
+CACHE_SIZE = 48
+
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Substring of the lowercased service -> extra CSS class, first match wins
+SERVICE_CLASSES = [
+    ("clean", "calendar-apt-cleaning"),
+    ("crown", "calendar-apt-crown"),
+    ("extract", "calendar-apt-extraction"),
+    ("whiten", "calendar-apt-whitening"),
+    ("canal", "calendar-apt-canal"),
+]
+
+
+def _service_class(service):
+    service = service.lower()
+    for needle, css in SERVICE_CLASSES:
+        if needle in service:
+            return "calendar-apt " + css
+    return "calendar-apt"
+
+
+def shift_month(year, month, delta):
+    """(year, month) moved by delta months"""
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def month_bounds(year, month):
+    """(first, last) day of the month"""
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+class DateIndex:
+    """Booked appointments sorted by date, answering date-range queries by bisection."""
+
+    def __init__(self, appointments, engine=None):
+        engine = engine or pricing.default_engine()
+        entries = []
+        for apt in appointments or []:
+            patient = apt.get("patient")
+            date_str = (apt.get("appointment_date") or "")[:10]
+            if not patient or not date_str:
+                continue
+            service = apt.get("service_type") or "Appointment"
+            entries.append((date_str, {
+                "patient": (patient.get("name") or "Unknown")[:15],
+                "phone": (patient.get("phone") or "")[-4:],
+                "service": service[:12],
+                "price": engine.price(service),
+                "css": _service_class(service),
+            }))
+        entries.sort(key=lambda e: e[0])
+        self.dates = [d for d, _ in entries]
+        self.entries = [e for _, e in entries]
+
+    def __len__(self):
+        return len(self.dates)
+
+    def _bounds(self, start, end):
+        return bisect_left(self.dates, str(start)), bisect_right(self.dates, str(end))
+
+    def count(self, start, end):
+        """Number of appointments with start <= date <= end (ISO dates)"""
+        lo, hi = self._bounds(start, end)
+        return hi - lo
+
+    def range(self, start, end):
+        """(date, entry) pairs with start <= date <= end, in date order"""
+        lo, hi = self._bounds(start, end)
+        return list(zip(self.dates[lo:hi], self.entries[lo:hi]))
+
+    def by_day(self, start, end):
+        """{date: [entries]} for start <= date <= end"""
+        days = {}
+        for date_str, entry in self.range(start, end):
+            days.setdefault(date_str, []).append(entry)
+        return days
+
+
+def render_month(index, year, month, today=None):
+    """HTML for one month grid (day headers plus all weeks) as a single string"""
+    today = today or date.today()
+    days = index.by_day(*month_bounds(year, month))
+
+    parts = ['<div class="calendar-grid">']
+    parts.extend(f'<div class="calendar-header">{d}</div>' for d in DAY_NAMES)
+    for week in calendar.Calendar(firstweekday=0).monthdayscalendar(year, month):
+        for day in week:
+            if day == 0:
+                parts.append('<div class="calendar-day" style="opacity: 0.3;"></div>')
+                continue
+            current = date(year, month, day)
+            day_class = "calendar-day calendar-day-today" if current == today else "calendar-day"
+            parts.append(f'<div class="{day_class}"><div class="calendar-day-num">{day}</div>')
+            apts = days.get(current.isoformat(), [])
+            for apt in apts[:MAX_PER_DAY]:
+                parts.append(
+                    f'<div class="{apt["css"]}">'
+                    f'<div style="font-weight: 600;">{html.escape(apt["patient"])}</div>'
+                    f'<div style="opacity: 0.8;">{html.escape(apt["service"])} · ${apt["price"]}</div>'
+                    '</div>'
+                )
+            if len(apts) > MAX_PER_DAY:
+                parts.append(
+                    f'<div style="color: #6C63FF; font-size: 0.7rem; text-align: center;">'
+                    f'+{len(apts) - MAX_PER_DAY} more</div>'
+                )
+            parts.append('</div>')
+    parts.append('</div>')
+    return "".join(parts)
+
+
+class CalendarRenderer:
+    """LRU cache of rendered months with background prefetch of adjacent months."""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar-prefetch")
+
+    def _get(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        return None
+
+    def _put(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+
+    def render(self, index, clinic, version, year, month, today=None):
+        """Cached HTML for one month"""
+        today = today or date.today()
+        key = (clinic, version, year, month, today)
+        cached = self._get(key)
+        if cached is None:
+            cached = render_month(index, year, month, today)
+            self._put(key, cached)
+        return cached
+
+    def prefetch(self, load, clinic, year, month, today=None, radius=1):
+        """Load and render the months around (year, month) in the background.
+
+        load(year, month) returns that month's (index, version).
+        """
+        today = today or date.today()
+        for delta in range(-radius, radius + 1):
+            if delta == 0:
+                continue
+            y, m = shift_month(year, month, delta)
+            self._executor.submit(self._prefetch_one, load, clinic, y, m, today)
+
+    def _prefetch_one(self, load, clinic, year, month, today):
+        try:
+            index, version = load(year, month)
+            self.render(index, clinic, version, year, month, today)
+        except Exception:
+            pass
+
+
+def _slot_html(apt, show_doctor=False):
+    when = f'{apt["start"]:%H:%M}-{apt["end"]:%H:%M}'
+    who = f' · {html.escape(apt["doctor"])}' if show_doctor else ""
+    return (
+        f'<div class="{_service_class(apt["service"])}">'
+        f'<div style="font-weight: 600;">{when} {html.escape(apt["patient"][:15])}</div>'
+        f'<div style="opacity: 0.8;">{html.escape(apt["service"][:18])}{who}</div>'
+        '</div>'
+    )
+
+
+def render_week(week, today=None):
+    """HTML for a {date: [appointments]} week from schedule.ScheduleIndex.week"""
+    today = today or date.today()
+    parts = ['<div class="calendar-grid">']
+    for day, apts in week.items():
+        day_class = "calendar-day calendar-day-today" if day == today else "calendar-day"
+        parts.append(f'<div class="{day_class}"><div class="calendar-day-num">{DAY_NAMES[day.weekday()]} {day.day}</div>')
+        parts.extend(_slot_html(apt) for apt in apts)
+        parts.append('</div>')
+    parts.append('</div>')
+    return "".join(parts)
+
+
+def render_day(apts):
+    """HTML for one day's appointments (schedule.ScheduleIndex.day), in time order"""
+    if not apts:
+        return '<div class="calendar-day" style="min-height: 0; text-align: center; color: #9CA3AF;">No appointments</div>'
+    return "".join(_slot_html(apt, show_doctor=True) for apt in apts)
+
+
+def week_bounds(today=None):
+    """(monday, sunday) of the week containing today"""
+    today = today or date.today()
+    monday = today - timedelta(days=today.weekday())
+    return monday, monday + timedelta(days=6)
@@ -0,0 +1,101 @@
+"""
+Response cache for the browser demo chat.
+
+Demo conversations repeat the same quick messages over and over, and each
+one costs a full LLM turn on the backend. Replies are cached under
+(clinic, normalized utterance, conversation-state fingerprint), where the
+fingerprint covers every earlier user turn, so the same message only hits
+the cache when it arrives at the same point in the same conversation.
+
+Entries expire after a TTL and the cache is LRU-bounded. One instance is
+shared by all sessions in the process (st.cache_resource).
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAXSIZE = 512
+DEFAULT_TTL = 60 * 60
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_utterance(text):
+    """'  I'd like to schedule a CLEANING!' -> 'id like to schedule a cleaning'"""
+    text = _PUNCT_RE.sub("", (text or "").lower())
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def state_fingerprint(history):
+    """Digest of the user turns so far in a conversation history"""
+    # transcript.Transcript keeps this digest up to date as turns are added
+    if hasattr(history, "fingerprint"):
+        return history.fingerprint()
+    digest = hashlib.sha1()
+    for turn in history or []:
+        if turn.get("role") == "user":
+            digest.update(normalize_utterance(turn.get("message")).encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """TTL + LRU cache of chat replies."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> (expires_at, response)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(clinic_id, utterance, history):
+        return (clinic_id, normalize_utterance(utterance), state_fingerprint(history))
+
+    def get(self, key):
+        """Cached reply or None (expired entries are dropped)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, response):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,96 @@
+"""
+Background worker pool for browser demo chat turns.
+
+A backend chat turn can take up to the 30 s request timeout. Run on the
+Streamlit script thread, it freezes that session's page until it returns
+and ties up a script thread the whole time. Turns are submitted to a
+small process-wide thread pool instead and the page polls for the result
+from a fragment, so many sessions can wait on the LLM at once.
+
+Workers only get plain arguments (never st.session_state). Progress and
+the result are written to the turn's ChatJob, which the polling fragment
+reads by id. One instance is shared by all sessions (st.cache_resource).
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 16
+
+# Finished jobs nobody collected (closed tabs) are dropped after this long
+JOB_TTL = 10 * 60
+
+
+class ChatJob:
+    """One chat turn running in the pool."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.text = ""          # reply so far, for streamed turns
+        self.result = None
+        self.error = None
+        self.started = time.monotonic()
+        self.finished = None
+        self._done = threading.Event()
+
+    def append(self, delta):
+        self.text += delta
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+
+class ChatWorker:
+    """Thread pool plus a registry of jobs by id."""
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, ttl=JOB_TTL):
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chat-worker")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """Run fn(job, *args, **kwargs) in the pool; its return value becomes job.result"""
+        job = ChatJob()
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        try:
+            job.result = fn(job, *args, **kwargs)
+        except Exception as e:
+            job.error = e
+        finally:
+            job.finished = time.monotonic()
+            job._done.set()
+
+    def _prune(self):
+        now = time.monotonic()
+        stale = [k for k, job in self._jobs.items() if job.finished and now - job.finished > self.ttl]
+        for k in stale:
+            del self._jobs[k]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def discard(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        running = sum(1 for job in jobs if not job.done())
+        return {"running": running, "finished": len(jobs) - running}
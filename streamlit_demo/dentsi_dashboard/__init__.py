@@ -0,0 +1,14 @@
+"""
+Shared code for the Dentsi multipage app (streamlit_app.py, pages/).
+
+    client      backend API: one pooled session per process, cached fetchers,
+                demo chat and admin calls
+    cache       process-wide engines and indexes built from that data
+    models      record shaping and the demo rosters pages fall back to
+    renderers   page stylesheets and small shared page elements
+    templates   HTML card templates; a card grid renders as one element
+
+Every page imports these modules instead of declaring its own copies, so
+one server process keeps one warm fetcher cache and one connection pool
+for all views.
+"""
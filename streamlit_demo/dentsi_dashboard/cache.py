@@ -0,0 +1,77 @@
+"""
+Process-wide engines and indexes shared by every page.
+
+Fetched data lives in the fetcher cache (sized_cache.py, filled through
+client.py). The objects built from it - pricing, revenue rollups,
+calendar and schedule indexes, slot engines, the chat worker and caches -
+are st.cache_resource singletons declared once here, so every page and
+session of the process uses the same instances instead of one set per
+app.
+"""
+
+import streamlit as st
+
+import calendar_view
+import chat_cache
+import chat_worker
+import knowledge
+import pricing
+import rollups
+import schedule
+import sized_cache
+import slots
+import transcript
+
+
+def clear():
+    """Drop every cached fetch (e.g. after a write to the backend)"""
+    sized_cache.clear()
+
+
+# Service prices (loaded once per process from knowledge_base/service_catalog.txt)
+@st.cache_resource
+def get_pricing_engine():
+    return pricing.load_engine()
+
+# Revenue rollups (clinic x doctor x service x day), kept for the whole process
+@st.cache_resource
+def get_revenue_rollup():
+    return rollups.RevenueRollup(get_pricing_engine())
+
+# Calendar: date index per (clinic, data version) and a process-wide month cache
+@st.cache_resource(max_entries=8)
+def get_date_index(clinic_id, version, _appointments):
+    return calendar_view.DateIndex(_appointments, get_pricing_engine())
+
+@st.cache_resource
+def get_calendar_renderer():
+    return calendar_view.CalendarRenderer()
+
+@st.cache_resource(max_entries=8)
+def get_schedule_index(clinic_id, version, doctors_version, _appointments, _doctor_names=None):
+    return schedule.ScheduleIndex(_appointments, _doctor_names)
+
+# Free-slot finder per (clinic, doctors version, appointments version)
+@st.cache_resource(max_entries=8)
+def get_slot_engine(clinic_id, doctors_version, appointments_version, _doctors, _appointments):
+    return slots.SlotEngine(_doctors, _appointments)
+
+# Chat turns evicted from the bounded transcripts, shared by all sessions
+@st.cache_resource
+def get_transcript_archive():
+    return transcript.TranscriptArchive()
+
+# Browser demo replies shared across sessions (same message at the same point in a conversation)
+@st.cache_resource
+def get_response_cache():
+    return chat_cache.ResponseCache()
+
+# Backend chat turns run here so a slow LLM reply never blocks a script thread
+@st.cache_resource
+def get_chat_worker():
+    return chat_worker.ChatWorker()
+
+# Knowledge base search for the offline chat (memory-mapped from `python knowledge.py build`)
+@st.cache_resource
+def get_knowledge_index():
+    return knowledge.get_index()
@@ -0,0 +1,296 @@
+"""
+Backend API client shared by every page.
+
+All requests go through one requests.Session per process, so pages and
+sessions reuse a pool of keep-alive connections instead of opening one
+per call. Each request is a profiler upstream span and carries the
+rerun's traceparent.
+
+Read endpoints are cached process-wide (sized_cache.py) under this
+module's names, so every page hits the same entries: clinics fetched for
+the Operations page are already warm on the Demo page.
+"""
+
+import json
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import profiler
+import sized_cache
+from dentsi_dashboard import models
+
+DEFAULT_API_BASE = "https://dentcognit.abacusai.app"
+
+# Keep-alive connections kept per host; script threads beyond this wait for one
+POOL_SIZE = 16
+TIMEOUT = 10
+# Rows per request when an appointment range is fetched page by page
+APPOINTMENT_PAGE = 500
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def session():
+    """The process-wide requests.Session"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                s.mount("http://", adapter)
+                s.mount("https://", adapter)
+                _session = s
+    return _session
+
+
+def api_base():
+    """Backend URL; override with DENTSI_API_BASE (e.g. a local stub_api.py), read on every call"""
+    return os.environ.get("DENTSI_API_BASE", DEFAULT_API_BASE).rstrip("/")
+
+
+def request(method, path, endpoint=None, timeout=TIMEOUT, **kwargs):
+    """`method` api_base() + path as an upstream span named `endpoint` (default: path)"""
+    with profiler.upstream(endpoint or path, method):
+        return session().request(method, f"{api_base()}{path}", headers=profiler.trace_headers(),
+                                 timeout=timeout, **kwargs)
+
+
+def get(path, endpoint=None, **kwargs):
+    return request("GET", path, endpoint, **kwargs)
+
+
+def post(path, endpoint=None, **kwargs):
+    return request("POST", path, endpoint, **kwargs)
+
+
+# ============================================================================
+# CACHED FETCHERS
+# ============================================================================
+
+@profiler.timed("fetch_health", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_health():
+    try:
+        return get("/health").json()
+    except:
+        return {"status": "offline"}
+
+@profiler.timed("fetch_clinics", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_clinics():
+    try:
+        r = get("/clinics")
+        r.raise_for_status()
+        return r.json()
+    except:
+        return []
+
+@profiler.timed("fetch_stats", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_stats(clinic_id=None):
+    try:
+        r = get("/api/dashboard/stats", params={"clinicId": clinic_id})
+        return r.json().get("data", {})
+    except:
+        return {}
+
+@profiler.timed("fetch_appointments", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_appointments(clinic_id=None, limit=50):
+    try:
+        r = get("/api/dashboard/appointments", params={"limit": limit, "clinicId": clinic_id})
+        return r.json().get("data", [])
+    except:
+        return []
+
+@profiler.timed("fetch_appointments_between", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_appointments_between(clinic_id, start, end, page_size=APPOINTMENT_PAGE):
+    """Every appointment dated start..end (dates, inclusive), following the pagination.
+
+    None when a page fails, so callers can tell a short answer from a partial one.
+    """
+    params = {
+        "clinicId": clinic_id, "limit": page_size,
+        "startDate": f"{start.isoformat()}T00:00:00.000Z", "endDate": f"{end.isoformat()}T23:59:59.999Z",
+    }
+    rows, page = [], 1
+    try:
+        while True:
+            r = get("/api/dashboard/appointments", params={**params, "page": page})
+            if r.status_code != 200:
+                return None
+            body = r.json()
+            rows.extend(body.get("data", []))
+            if page >= (body.get("pagination") or {}).get("totalPages", 1):
+                return rows
+            page += 1
+    except:
+        return None
+
+@profiler.timed("fetch_calls", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_calls(clinic_id=None, limit=20):
+    try:
+        r = get("/api/dashboard/calls", params={"limit": limit, "clinicId": clinic_id})
+        return r.json().get("data", [])
+    except:
+        return []
+
+@profiler.timed("fetch_call_store", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_call_store():
+    """Fetch the call log once and partition it by outcome.
+
+    Conversations and Escalations both read from this store, so a rerun
+    makes a single GET /calls and both tabs see the same counts.
+    """
+    try:
+        r = get("/calls", timeout=5)
+        calls_list = r.json() if r.status_code == 200 else []
+        complete = r.status_code == 200 and isinstance(calls_list, list)
+    except:
+        calls_list = []
+        complete = False
+    if not isinstance(calls_list, list):
+        calls_list = []
+    return {"calls": calls_list, "by_outcome": models.calls_by_outcome(calls_list), "complete": complete}
+
+@profiler.timed("fetch_calls_by_outcome", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_calls_by_outcome(outcome):
+    """Targeted fetch for one outcome, used when the call store is incomplete"""
+    try:
+        r = get("/calls", params={"outcome": outcome}, timeout=5)
+        calls_list = r.json() if r.status_code == 200 else []
+    except:
+        return []
+    # The backend may ignore the filter, so apply it here as well
+    return [c for c in calls_list if (c.get("outcome") or "").lower() == outcome]
+
+def get_calls_with_outcome(call_store, outcome):
+    """Answer an outcome view from the loaded call store, fetching only if it is incomplete"""
+    if call_store["complete"]:
+        return call_store["by_outcome"].get(outcome, [])
+    return fetch_calls_by_outcome(outcome)
+
+@profiler.timed("fetch_patients", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_patients():
+    """Patient records from /patients, with their appointments"""
+    try:
+        r = get("/patients", timeout=5)
+        return r.json() if r.status_code == 200 else []
+    except:
+        return []
+
+@profiler.timed("fetch_doctors", cached=True)
+@sized_cache.cached(ttl=30)
+def fetch_doctors():
+    """Doctor records from /admin/doctors, or None when the backend has none to give"""
+    try:
+        r = get("/admin/doctors")
+        if r.status_code == 200:
+            return r.json()
+    except:
+        pass
+    return None
+
+
+# ============================================================================
+# DEMO CHAT AND ADMIN CALLS (not cached)
+# ============================================================================
+
+def start_demo_session(clinic_id=None, caller_phone=None):
+    """Start a new demo conversation session"""
+    try:
+        r = post("/webhook/demo/start", json={"clinicId": clinic_id, "callerPhone": caller_phone}, timeout=30)
+        return r.json()
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def send_demo_message(session_id, message, clinic_id=None):
+    """Send a message in the demo conversation"""
+    try:
+        r = post(
+            "/webhook/demo",
+            json={
+                "sessionId": session_id,
+                "userMessage": message,
+                "clinicId": clinic_id
+            },
+            timeout=30
+        )
+        return r.json()
+    except Exception as e:
+        return {"success": False, "error": str(e), "response": f"Error: {str(e)}"}
+
+class DemoStream:
+    """Streamed reply from POST /webhook/demo/stream.
+
+    Iterating yields text deltas as the backend sends them, and `text`
+    holds the reply so far. A `reset` event (the agent said something, then
+    called a tool) clears `text`, so it only ever shows the final reply.
+    Afterwards `result` holds the same payload as send_demo_message. Falls
+    back to the non-streaming endpoint if the backend does not offer the
+    stream.
+    """
+
+    def __init__(self, session_id, message, clinic_id=None):
+        self.session_id = session_id
+        self.message = message
+        self.clinic_id = clinic_id
+        self.text = ""
+        self.result = None
+
+    def __iter__(self):
+        payload = {"sessionId": self.session_id, "userMessage": self.message, "clinicId": self.clinic_id}
+        try:
+            r = post("/webhook/demo/stream", json=payload, stream=True, timeout=(5, 30))
+            if r.status_code != 200 or not r.headers.get("Content-Type", "").startswith("text/event-stream"):
+                r.close()
+                self.result = send_demo_message(self.session_id, self.message, self.clinic_id)
+                self.text = self.result.get("response", "")
+                yield self.text
+                return
+            event = None
+            with r:
+                for line in r.iter_lines(decode_unicode=True):
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data = json.loads(line[5:].strip())
+                        if event == "token":
+                            delta = data.get("text", "")
+                            self.text += delta
+                            yield delta
+                        elif event == "reset":
+                            self.text = ""
+                        elif event == "done":
+                            self.result = data
+                    elif not line:
+                        event = None
+        except Exception as e:
+            self.result = {"success": False, "error": str(e), "response": f"Error: {str(e)}"}
+        if self.result is None:
+            self.result = {"success": False, "error": "stream ended early", "response": "Error: stream ended early"}
+
+def update_clinic_phone(clinic_id, phone):
+    """Update a clinic's phone number"""
+    try:
+        r = request("PATCH", f"/clinics/{clinic_id}/phone", "/clinics/{id}/phone", json={"phone": phone})
+        return r.json()
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def set_active_clinic(clinic_id):
+    """Route new phone bookings to this clinic; failures are ignored"""
+    try:
+        post("/admin/set-active-clinic", json={"clinic_id": clinic_id}, timeout=5)
+    except:
+        pass
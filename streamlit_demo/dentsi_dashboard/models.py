@@ -0,0 +1,96 @@
+"""
+Record shapes shared by the pages.
+
+The backend returns plain JSON records (frozen and shared when they come
+from the fetcher cache); these helpers derive what the pages display from
+them, and hold the demo rosters pages fall back to without a backend.
+"""
+
+import heapq
+import json
+
+ALL_CLINICS = "All Clinics"
+
+
+def clinic_options(clinics, all_label=ALL_CLINICS, prefix=""):
+    """{selectbox label: clinic id}, starting with `all_label` -> None"""
+    options = {all_label: None}
+    for c in clinics:
+        options[f"{prefix}{c['name']}"] = c["id"]
+    return options
+
+
+def calls_by_outcome(calls):
+    """Calls grouped by lower-cased outcome ("unknown" when missing), in order"""
+    by_outcome = {}
+    for c in calls:
+        outcome = (c.get("outcome") or "unknown").lower()
+        by_outcome.setdefault(outcome, []).append(c)
+    return by_outcome
+
+
+CALL_ORDERS = {
+    "Most Recent": lambda c: c.get("created_at") or "",
+    "Longest Duration": lambda c: c.get("duration") or 0,
+    "Highest Sentiment": lambda c: c.get("sentiment_score") or 0,
+}
+
+
+def top_calls(calls, order, n):
+    """The first n calls in a CALL_ORDERS order (one pass, no full sort)"""
+    return heapq.nlargest(n, calls, key=CALL_ORDERS[order])
+
+
+def doctor_names(doctors):
+    """{doctor id: name} for joining names onto appointments, which carry only doctor_id"""
+    return {d["id"]: d.get("name") or d["id"] for d in doctors or [] if d.get("id")}
+
+
+def doctor_summary(d):
+    """A /admin/doctors record in the shape of the doctor cards"""
+    return {
+        "name": d.get("name", "Unknown"),
+        "specialty": d.get("specialty", "General Dentistry"),
+        "clinic": d.get("clinic", {}).get("name", "Unknown Clinic") if d.get("clinic") else "Unknown Clinic",
+        "available": d.get("is_active", True),
+        "appointments": 5,  # Would need appointment count endpoint
+        "revenue": 2500  # Would need revenue endpoint
+    }
+
+
+# ============================================================================
+# DEMO ROSTERS
+# ============================================================================
+
+# Doctor cards when /admin/doctors is unreachable (Operations page)
+FALLBACK_DOCTORS = [
+    {"name": "Dr. Emily Chen", "specialty": "General Dentistry", "clinic": "SmileCare Dental", "available": True, "appointments": 8, "revenue": 2400},
+    {"name": "Dr. Michael Roberts", "specialty": "Oral Surgery", "clinic": "SmileCare Dental", "available": True, "appointments": 5, "revenue": 7500},
+    {"name": "Dr. Sarah Kim", "specialty": "Pediatric Dentistry", "clinic": "SmileCare Dental", "available": False, "appointments": 6, "revenue": 1800},
+    {"name": "Dr. James Wilson", "specialty": "General Dentistry", "clinic": "Bright Teeth", "available": True, "appointments": 7, "revenue": 2100},
+    {"name": "Dr. Lisa Patel", "specialty": "Cosmetic Dentistry", "clinic": "Bright Teeth", "available": True, "appointments": 4, "revenue": 4800},
+    {"name": "Dr. Robert Martinez", "specialty": "Endodontics", "clinic": "Downtown Dental", "available": True, "appointments": 6, "revenue": 9000},
+]
+
+# Mock doctors with today's load and revenue (Demo and Overview pages)
+DEMO_DOCTORS = [
+    {"name": "Dr. Emily Chen", "specialty": "General Dentistry", "clinic": "SmileCare Dental", "available": True, "appointments_today": 8, "revenue": 2400},
+    {"name": "Dr. Michael Roberts", "specialty": "Oral Surgery", "clinic": "SmileCare Dental", "available": True, "appointments_today": 5, "revenue": 7500},
+    {"name": "Dr. Sarah Kim", "specialty": "Pediatric Dentistry", "clinic": "SmileCare Dental", "available": False, "appointments_today": 6, "revenue": 1800},
+    {"name": "Dr. James Wilson", "specialty": "General Dentistry", "clinic": "Bright Teeth", "available": True, "appointments_today": 7, "revenue": 2100},
+    {"name": "Dr. Lisa Patel", "specialty": "Cosmetic Dentistry", "clinic": "Bright Teeth", "available": True, "appointments_today": 4, "revenue": 4800},
+    {"name": "Dr. Robert Martinez", "specialty": "Endodontics", "clinic": "Downtown Dental", "available": True, "appointments_today": 6, "revenue": 9000},
+    {"name": "Dr. Amanda Thompson", "specialty": "General Dentistry", "clinic": "Downtown Dental", "available": True, "appointments_today": 9, "revenue": 2700},
+]
+
+# Doctor schedules for the free-slot finder (SmileCare doctors from the seed data)
+SEED_DOCTORS = [
+    {"id": "seed-chen", "name": "Dr. Emily Chen", "specialty": "General Dentistry",
+     "available_hours": json.dumps({"mon": ["9:00-12:00", "13:00-17:00"], "tue": ["9:00-12:00", "13:00-17:00"],
+                                    "wed": ["9:00-12:00"], "thu": ["9:00-12:00", "13:00-17:00"], "fri": ["9:00-15:00"]})},
+    {"id": "seed-roberts", "name": "Dr. Michael Roberts", "specialty": "Oral Surgery",
+     "available_hours": json.dumps({"mon": ["10:00-12:00", "14:00-17:00"], "wed": ["9:00-12:00", "13:00-17:00"],
+                                    "fri": ["9:00-14:00"]})},
+    {"id": "seed-kim", "name": "Dr. Sarah Kim", "specialty": "Pediatric Dentistry",
+     "available_hours": json.dumps({"tue": ["9:00-12:00", "13:00-17:00"], "thu": ["9:00-12:00", "13:00-17:00"]})},
+]
@@ -0,0 +1,69 @@
+"""
+Page stylesheets and small page elements shared by the pages.
+
+Each page's CSS lives in static/css/<page>.css. With static serving on
+(.streamlit/config.toml) a page sends a one-line <link> to the file, with
+a content hash in the URL: the browser fetches each stylesheet once and
+keeps it until the CSS changes, and reruns no longer resend kilobytes of
+CSS. Without static serving the CSS is inlined as before, and so it is
+on Streamlit before 1.57: its Tornado static server sends everything but
+images and fonts as text/plain with nosniff, and browsers refuse such a
+stylesheet.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+from dentsi_dashboard import client
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+CSS_URL = "app/static/css"
+# First release whose static server sends .css as text/css
+STATIC_CSS_VERSION = (1, 57)
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name):
+    """Contents of static/css/<name>.css"""
+    return (STATIC_DIR / "css" / f"{name}.css").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def stylesheet_url(name):
+    """URL of static/css/<name>.css, versioned by its content"""
+    digest = hashlib.sha256(stylesheet(name).encode("utf-8")).hexdigest()[:12]
+    return f"{CSS_URL}/{name}.css?v={digest}"
+
+
+def _streamlit_version():
+    try:
+        return tuple(int(part) for part in st.__version__.split(".")[:2])
+    except:
+        return (0, 0)
+
+
+def static_serving():
+    """True when the server serves static/ at app/static/ with usable CSS content types"""
+    if _streamlit_version() < STATIC_CSS_VERSION:
+        return False
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except:
+        return False
+
+
+def inject_css(name):
+    """Apply static/css/<name>.css to the current page"""
+    if static_serving():
+        st.markdown(f'<link rel="stylesheet" href="{stylesheet_url(name)}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{stylesheet(name)}</style>", unsafe_allow_html=True)
+
+
+def api_links():
+    """Sidebar links to the backend's API docs and health check"""
+    st.markdown(f"[📄 API Docs]({client.api_base()}/api-docs)")
+    st.markdown(f"[❤️ Health Check]({client.api_base()}/health)")
@@ -0,0 +1,287 @@
+"""
+HTML templates for the card grids on the pages.
+
+Cards used to be inline f-strings emitted one st.markdown per card inside
+st.columns loops, so a grid of twelve cards cost a dozen markdown
+elements plus a row and a column container for each. Here every card is
+a format string, compacted once at import, and a whole section - all of
+its cards laid out in one CSS grid - is a single markdown element.
+Record values are HTML-escaped.
+"""
+
+import html
+
+
+def compact(markup):
+    """Markup with indentation and blank lines removed.
+
+    A blank line ends a markdown HTML block (the rest would render as
+    text), so cards are joined only in this form.
+    """
+    return "\n".join(line.strip() for line in markup.strip().splitlines() if line.strip())
+
+
+def render(template, markup=None, **fields):
+    """`template` filled with `fields`, escaped (newlines become <br>), and `markup` as is"""
+    values = {k: html.escape(str(v)).replace("\n", "<br>") for k, v in fields.items()}
+    values.update(markup or {})
+    return template.format(**values)
+
+
+def grid(cards, columns=3, gap="1rem", row_gap="0"):
+    """Cards `columns` to a row (fewer on narrow screens) as one HTML block"""
+    track = f"minmax(max(160px, calc((100% - {columns - 1} * {gap}) / {columns})), 1fr)"
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat(auto-fill, {track}); '
+        f'column-gap: {gap}; row-gap: {row_gap};">'
+        + "\n".join(compact(c) for c in cards)
+        + "</div>"
+    )
+
+
+# ============================================================================
+# APPOINTMENTS
+# ============================================================================
+
+APPOINTMENT_CARD = compact("""
+<div style="background: linear-gradient(135deg, rgba(30, 41, 59, 0.95), rgba(51, 65, 85, 0.8)); border: 1px solid rgba(139, 92, 246, 0.3); border-radius: 16px; padding: 20px; margin-bottom: 16px; transition: transform 0.2s;">
+    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <div>
+            <div style="font-size: 1.1rem; font-weight: 700; color: #ffffff;">{patient_name}</div>
+            <div style="font-size: 0.85rem; color: #94a3b8;">{phone}</div>
+        </div>
+        <div style="background: {status_color}; color: white; padding: 4px 12px; border-radius: 20px; font-size: 0.75rem; font-weight: 600;">{status}</div>
+    </div>
+    <div style="border-top: 1px solid rgba(139, 92, 246, 0.2); padding-top: 12px; margin-top: 8px;">
+        <div style="display: flex; align-items: center; margin-bottom: 8px;">
+            <span style="font-size: 1.2rem; margin-right: 8px;">{service_icon}</span>
+            <span style="color: #e2e8f0; font-weight: 600;">{service}</span>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div style="color: #94a3b8; font-size: 0.9rem;">📅 {date}</div>
+            <div style="color: #10b981; font-weight: 700; font-size: 1.1rem;">${price}</div>
+        </div>
+        <div style="color: #64748b; font-size: 0.8rem; margin-top: 8px;">📍 {clinic}</div>
+    </div>
+</div>
+""")
+
+STATUS_COLORS = {"SCHEDULED": "#10b981", "CONFIRMED": "#f59e0b"}
+
+# Substring of the lowercased service -> icon, first match wins
+SERVICE_ICONS = [("clean", "🪥"), ("crown", "👑"), ("canal", "🔧"), ("extract", "🔧"), ("whiten", "✨")]
+
+
+def service_icon(service):
+    service = service.lower()
+    return next((icon for key, icon in SERVICE_ICONS if key in service), "🩺")
+
+
+def appointment_card(apt):
+    """Card for one row of the Appointments tab (upper-cased status)"""
+    return render(
+        APPOINTMENT_CARD,
+        patient_name=apt["patient_name"], phone=apt["phone"], status=apt["status"],
+        status_color=STATUS_COLORS.get(apt["status"], "#6b7280"),
+        service_icon=service_icon(apt["service"]), service=apt["service"],
+        date=apt["date"], price=apt["price"], clinic=apt["clinic"],
+    )
+
+
+# ============================================================================
+# PATIENTS
+# ============================================================================
+
+PATIENT_CARD = compact("""
+<div style="background: linear-gradient(135deg, rgba(30, 41, 59, 0.95), rgba(51, 65, 85, 0.8)); border: 1px solid rgba(139, 92, 246, 0.3); border-radius: 16px; padding: 20px; margin-bottom: 16px;">
+    <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+        <div>
+            <div style="font-size: 1.1rem; font-weight: 700; color: #ffffff;">👤 {name}</div>
+            <div style="font-size: 0.85rem; color: #94a3b8; margin-top: 4px;">{phone}</div>
+        </div>
+        <div style="background: linear-gradient(135deg, #10b981, #059669); color: white; padding: 6px 12px; border-radius: 8px; font-weight: 700;">${ltv}</div>
+    </div>
+    <div style="margin-top: 16px; padding-top: 12px; border-top: 1px solid rgba(139, 92, 246, 0.2);">
+        <div style="color: #e2e8f0; font-size: 0.9rem;">📧 {email}</div>
+        <div style="margin-top: 8px; color: #a5b4fc; font-size: 0.85rem;">🏥 {insurance}</div>
+        <div style="margin-top: 8px; color: #6b7280; font-size: 0.8rem;">📅 {visits}</div>
+    </div>
+</div>
+""")
+
+
+def patient_card(name, phone, email, insurance, ltv, visits):
+    return render(PATIENT_CARD, name=name, phone=phone, email=email, insurance=insurance, ltv=ltv,
+                  visits=f"{visits} appointment{'s' if visits != 1 else ''}")
+
+
+def patient_record_card(patient):
+    """Card for a /patients record (lifetime value estimated at $150 a visit)"""
+    email = patient.get("email") or ""
+    appointments = patient.get("appointments") or []
+    return patient_card(
+        patient.get("name", "Unknown"), patient.get("phone", "N/A"),
+        (email[:20] + "...") if len(email) > 20 else (email or "No email"),
+        patient.get("insurance_provider") or "No insurance",
+        len(appointments) * 150, len(appointments),
+    )
+
+
+# ============================================================================
+# DOCTORS
+# ============================================================================
+
+DOCTOR_CARD = compact("""
+<div style="background: linear-gradient(145deg, #121A2F, #0B1220); border: 1px solid rgba(108, 99, 255, 0.3); border-radius: 16px; padding: 20px; margin-bottom: 16px;">
+<div style="font-size: 1.15rem; font-weight: 700; color: #E5E7EB; margin-bottom: 6px;">👨‍⚕️ {name}</div>
+<div style="font-size: 0.9rem; color: #6C63FF; margin-bottom: 4px;">{specialty}</div>
+<div style="font-size: 0.85rem; color: #9CA3AF; margin-bottom: 12px;">📍 {clinic}</div>
+<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
+<span style="background: {status_bg}; color: {status_color}; padding: 4px 12px; border-radius: 12px; font-size: 0.8rem; font-weight: 600;">{status}</span>
+<span style="color: #FACC15; font-size: 1.2rem; font-weight: 800;">${revenue}</span>
+</div>
+<div style="font-size: 0.8rem; color: #6B7280;">{appointments} appointments today</div>
+</div>
+""")
+
+# Demo and Overview pages (styled by their .doctor-card rule)
+DEMO_DOCTOR_CARD = compact("""
+<div class="doctor-card">
+    <div style="font-size: 1.1rem; font-weight: 600; color: #f1f5f9;">{name}</div>
+    <div style="color: #7c3aed; font-size: 0.85rem;">{specialty}</div>
+    <div style="color: #64748b; font-size: 0.8rem; margin-top: 6px;">📍 {clinic}</div>
+    <div style="margin-top: 8px; display: flex; justify-content: space-between;">
+        <span>{status}</span>
+        <span style="color: #10b981;">${revenue}</span>
+    </div>
+    <div style="color: #94a3b8; font-size: 0.75rem; margin-top: 4px;">{appointments} appointments today</div>
+</div>
+""")
+
+ROSTER_DOCTOR_CARD = compact("""
+<div class="doctor-card">
+    <div style="font-size: 1.2rem; font-weight: 600; color: #f1f5f9;">{name}</div>
+    <div style="color: #7c3aed; font-size: 0.9rem;">{specialty}</div>
+    <div style="color: #64748b; font-size: 0.85rem; margin-top: 8px;">📍 {clinic}</div>
+    <div style="margin-top: 10px;">{status}</div>
+</div>
+""")
+
+
+def doctor_card(doc):
+    """Operations page card for a models.doctor_summary record"""
+    available = doc["available"]
+    return render(
+        DOCTOR_CARD, name=doc["name"], specialty=doc["specialty"], clinic=doc["clinic"],
+        status="Available" if available else "Busy",
+        status_color="#22C55E" if available else "#EF4444",
+        status_bg="rgba(34, 197, 94, 0.15)" if available else "rgba(239, 68, 68, 0.15)",
+        revenue=f"{doc['revenue']:,}", appointments=doc["appointments"],
+    )
+
+
+def demo_doctor_card(doc, template=DEMO_DOCTOR_CARD):
+    """Card for a models.DEMO_DOCTORS entry"""
+    return render(
+        template, name=doc["name"], specialty=doc["specialty"], clinic=doc["clinic"],
+        status="🟢 Available" if doc["available"] else "🔴 Busy",
+        revenue=f"{doc['revenue']:,}", appointments=doc["appointments_today"],
+    )
+
+
+# ============================================================================
+# CALLS
+# ============================================================================
+
+# A native <details> per call instead of an st.expander holding four
+# st.metric columns and a disabled text area
+CALL_CARD = compact("""
+<details{open} style="background: rgba(18, 26, 47, 0.6); border: 1px solid rgba(108, 99, 255, 0.25); border-radius: 8px; margin-bottom: 12px;">
+    <summary style="cursor: pointer; padding: 12px 16px; color: #E5E7EB;">{emoji} {name} | {phone} | {outcome_label}</summary>
+    <div style="padding: 4px 16px 16px 16px;">
+        <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(140px, 1fr)); gap: 1rem;">
+            <div><div style="color: #9CA3AF; font-size: 0.85rem;">⏱️ Duration</div><div style="color: #E5E7EB; font-size: 1.8rem;">{duration}s</div></div>
+            <div><div style="color: #9CA3AF; font-size: 0.85rem;">📊 Sentiment</div><div style="color: #E5E7EB; font-size: 1.8rem;">{sentiment}%</div></div>
+            <div><div style="color: #9CA3AF; font-size: 0.85rem;">🎯 Outcome</div><div style="color: #E5E7EB; font-size: 1.8rem;">{outcome}</div></div>
+            <div><div style="color: #9CA3AF; font-size: 0.85rem;">💡 Intent</div><div style="color: #E5E7EB; font-size: 1.8rem;">{intent}</div></div>
+        </div>
+        <hr style="margin: 16px 0; border-color: rgba(148, 163, 184, 0.2);">
+        <div style="font-weight: 700; color: #E5E7EB; margin-bottom: 8px;">📝 Conversation Summary</div>
+        <div style="background: rgba(11, 18, 32, 0.8); border: 1px solid rgba(148, 163, 184, 0.2); border-radius: 8px; padding: 10px 12px; max-height: {height}px; overflow-y: auto; color: #9CA3AF; font-size: 0.9rem;">{transcript}</div>{note}
+    </div>
+</details>
+""")
+
+CALL_NOTES = {
+    "booked": ("rgba(34, 197, 94, 0.15)", "#22C55E", "💰 <strong>Revenue Impact:</strong> {}"),
+    "escalated": ("rgba(245, 158, 11, 0.15)", "#F59E0B", "⚠️ <strong>Action Required:</strong> {}"),
+}
+CALL_NOTE_TEXT = {"booked": "Appointment booked - Est. $150-$200", "escalated": "Follow up with patient"}
+
+
+def call_card(call, expanded=False, transcript_limit=500, height=120, note=None):
+    """Collapsible card for a /calls record (`note` overrides the outcome's default remark)"""
+    patient = call.get("patient") or {}
+    outcome = call.get("outcome") or "unknown"
+    sentiment = call.get("sentiment_score") or 0.5
+    intent = call.get("intent", "general")
+    transcript = call.get("transcript", "")
+    if transcript_limit and len(transcript) > transcript_limit:
+        transcript = transcript[:transcript_limit] + "..."
+    remark = ""
+    if outcome in CALL_NOTES:
+        bg, color, text = CALL_NOTES[outcome]
+        remark = (f'<div style="background: {bg}; color: {color}; border-radius: 8px; padding: 12px 16px; margin-top: 12px;">'
+                  + text.format(html.escape(note or CALL_NOTE_TEXT[outcome])) + "</div>")
+    return render(
+        CALL_CARD,
+        markup={"open": " open" if expanded else "", "note": remark},
+        emoji="😊" if sentiment > 0.6 else "😐" if sentiment > 0.3 else "😟",
+        name=patient.get("name", "Unknown Caller"), phone=call.get("caller_phone", "N/A"),
+        outcome_label=outcome.upper(), duration=call.get("duration") or 0,
+        sentiment=int(sentiment * 100), outcome=outcome.replace("_", " ").title(),
+        intent=intent.replace("_", " ").title() if intent else "General",
+        transcript=transcript or "No transcript available", height=height,
+    )
+
+
+# ============================================================================
+# ESCALATIONS
+# ============================================================================
+
+ESCALATION_CARD = compact("""
+<div style="background: #121A2F; border-left: 4px solid {color}; border-radius: 0 12px 12px 0; padding: 20px; margin-bottom: 16px;">
+    <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+        <div>
+            <div style="font-size: 1.15rem; font-weight: 700; color: #E5E7EB;">{patient}</div>
+            <div style="color: #9CA3AF; margin-top: 8px; font-size: 0.95rem;">{reason}</div>
+            <div style="color: #6B7280; font-size: 0.85rem; margin-top: 12px;">📞 {phone} &nbsp;•&nbsp; 🕐 {time}</div>
+        </div>
+        <div style="background: {bg}; color: {color}; padding: 6px 16px; border-radius: 8px; font-weight: 600; font-size: 0.85rem;">{priority}</div>
+    </div>
+</div>
+""")
+
+# Complete page: solid priority badge, resolved with the buttons under the list
+COMPLETE_ESCALATION_CARD = compact("""
+<div style="background: rgba(30, 41, 59, 0.6); border-left: 4px solid {color}; padding: 16px 20px; border-radius: 0 8px 8px 0; margin: 8px 0;">
+    <div style="display: flex; justify-content: space-between; align-items: flex-start; gap: 16px;">
+        <div>
+            <div style="color: #f1f5f9; font-weight: 600;">{patient}</div>
+            <div style="color: #94a3b8; font-size: 0.9rem;">{reason}</div>
+            <div style="color: #64748b; font-size: 0.8rem; margin-top: 8px;">📞 {phone} | 🕐 {time}</div>
+        </div>
+        <div style="background: {color}; color: white; padding: 8px 16px; border-radius: 8px; text-align: center; font-weight: 600;">{priority}</div>
+    </div>
+</div>
+""")
+
+PRIORITY_COLORS = {"High": "#EF4444", "Medium": "#F59E0B", "Low": "#6C63FF"}
+PRIORITY_BG = {"High": "rgba(239, 68, 68, 0.15)", "Medium": "rgba(245, 158, 11, 0.15)", "Low": "rgba(108, 99, 255, 0.15)"}
+
+
+def escalation_card(esc, template=ESCALATION_CARD):
+    return render(
+        template, patient=esc["patient"], reason=esc["reason"], phone=esc["phone"], time=esc["time"],
+        priority=esc["priority"], color=PRIORITY_COLORS[esc["priority"]], bg=PRIORITY_BG[esc["priority"]],
+    )
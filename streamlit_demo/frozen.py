@@ -0,0 +1,135 @@
+"""
+Read-only records for data shared between sessions.
+
+The fetcher cache (sized_cache.py) hands every session the same objects
+instead of a fresh copy per hit. freeze() turns the JSON the backend
+returns into FrozenDict / FrozenList: subclasses of dict and list, so
+pandas, json, Plotly and isinstance checks treat them as usual, but any
+in-place change raises ReadOnlyError instead of silently altering what
+every other session sees. Make a private copy to change something:
+
+    apt = dict(apt)              # shallow, mutable
+    appointments = thaw(appointments)   # deep, mutable
+"""
+
+
+import sys
+
+
+class ReadOnlyError(TypeError):
+    """Raised on an attempt to modify shared, frozen data."""
+
+
+def _read_only(self, *args, **kwargs):
+    raise ReadOnlyError(
+        f"{type(self).__name__} is shared between sessions and read-only; "
+        "copy it first (dict(x), list(x) or frozen.thaw(x))"
+    )
+
+
+class FrozenDict(dict):
+    """A dict that cannot be changed in place."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FrozenList(list):
+    """A list that cannot be changed in place."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(obj):
+    """Deeply read-only version of JSON-like data (dicts, lists, tuples of them, scalars).
+
+    Other objects are returned as they are; numpy arrays are made read-only.
+    """
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        return obj
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    if isinstance(obj, tuple):
+        return tuple(freeze(v) for v in obj)
+    setflags = getattr(obj, "setflags", None)
+    if callable(setflags):
+        try:
+            setflags(write=False)
+        except Exception:
+            pass
+    return obj
+
+
+def freeze_sized(obj, sizeof=sys.getsizeof, memo=None):
+    """(freeze(obj), approximate bytes) in one pass.
+
+    Objects reachable more than once (the same record in two lists) are
+    frozen once, stay shared, and are counted once. Dict keys and
+    None/True/False are not counted: the json decoder shares repeated keys
+    between records and the singletons cost nothing extra. Leaves other
+    than str/int/float are measured with `sizeof`.
+    """
+    kind = type(obj)
+    if obj is None or kind is bool:
+        return obj, 0
+    if kind is str or kind is int or kind is float:
+        return obj, sys.getsizeof(obj)
+    memo = {} if memo is None else memo
+    if id(obj) in memo:
+        return memo[id(obj)], 0
+    if kind is dict or kind is FrozenDict:
+        items, size = [], 0
+        for k, v in obj.items():
+            v, n = freeze_sized(v, sizeof, memo)
+            items.append((k, v))
+            size += n
+        out = obj if kind is FrozenDict else FrozenDict(items)
+        size += sys.getsizeof(out)
+    elif kind is list or kind is FrozenList or kind is tuple:
+        items, size = [], 0
+        for v in obj:
+            v, n = freeze_sized(v, sizeof, memo)
+            items.append(v)
+            size += n
+        out = obj if kind is FrozenList else (tuple(items) if kind is tuple else FrozenList(items))
+        size += sys.getsizeof(out)
+    else:
+        out, size = freeze(obj), sizeof(obj)
+    memo[id(obj)] = out
+    return out, size
+
+
+def thaw(obj):
+    """Deep, mutable copy of frozen data"""
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(thaw(v) for v in obj)
+    return obj
@@ -0,0 +1,303 @@
+"""
+Offline knowledge-base search for the Dentsi dashboards.
+
+The text files in knowledge_base/ (doctor profiles, FAQ and policies,
+insurance, service catalog) are split into passages and indexed with
+BM25. The term-passage weights are precomputed into a compressed sparse
+row matrix with one row per term (plain NumPy arrays: indptr / indices /
+data), so a query is a few slices and one bincount.
+
+Build the index once with
+
+    python knowledge.py build
+
+which writes knowledge_base/knowledge_index.bin. At startup the arrays
+are memory-mapped straight from that file. If it is missing or was built
+from different knowledge-base contents (a hash of the files, so a fresh
+checkout still uses it), the index is built in memory instead.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import struct
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+KB_DIR = Path(__file__).resolve().parent.parent / "knowledge_base"
+INDEX_PATH = KB_DIR / "knowledge_index.bin"
+
+MAGIC = b"DKBI0001"
+ALIGN = 8
+
+# BM25 parameters
+K1 = 1.5
+B = 0.5
+
+STOPWORDS = set("""
+a an and are as at be but by can do does for from have how i if in is it me my
+of on or our so that the their there this to we what when where which who why
+will with you your yes no not any all about also than then they them its it's
+much many am pm
+""".split())
+
+# Folded to one term on both the index and the query side
+SYNONYMS = {
+    "cost": "price", "fee": "price", "charge": "price", "pricing": "price",
+    "hour": "availability", "available": "availability", "open": "availability", "schedule": "availability",
+    "cancel": "cancellation", "cancelled": "cancellation", "cancelling": "cancellation",
+}
+
+# FAQ question lines count this many times, so a matching question beats a
+# passage that merely repeats the words
+QUESTION_WEIGHT = 2
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_SECTION_RE = re.compile(r"^=+\s*(.*?)\s*=+$")
+
+
+def tokenize(text):
+    """Lowercased word tokens without stopwords, with plural 's' folded"""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        # Clock digits ("9:00") add length but never help a match
+        if token in STOPWORDS or (token.isdigit() and len(token) <= 2):
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(SYNONYMS.get(token, token))
+    return tokens
+
+
+def split_passages(name, text):
+    """Blank-line separated passages, each tagged with its file and section heading"""
+    passages = []
+    lines = text.splitlines()
+    title = lines[0].strip() if lines else name
+    section = ""
+    block = []
+
+    def flush():
+        body = "\n".join(block).strip()
+        if body and body != "---":
+            passages.append({"source": name, "section": section, "text": body})
+        block.clear()
+
+    for raw in lines[1:]:
+        line = raw.rstrip()
+        heading = _SECTION_RE.match(line.strip())
+        if heading:
+            flush()
+            section = heading.group(1).title()
+            continue
+        if not line.strip():
+            flush()
+            continue
+        block.append(line)
+    flush()
+    for passage in passages:
+        passage["title"] = title
+    return passages
+
+
+def _sources(kb_dir):
+    return sorted(Path(kb_dir).glob("*.txt"))
+
+
+def _fingerprint(kb_dir):
+    """SHA-256 over the names and contents of the source files, to detect a stale artifact"""
+    digest = hashlib.sha256()
+    for path in _sources(kb_dir):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+class KnowledgeIndex:
+    """BM25 over knowledge-base passages, stored as a term-major sparse matrix."""
+
+    def __init__(self, vocab, passages, indptr, indices, data, fingerprint=None):
+        self.vocab = vocab              # term -> row
+        self.passages = passages        # list of {"source", "section", "title", "text"}
+        self.indptr = indptr            # int64, len(vocab) + 1
+        self.indices = indices          # int32 passage ids, term-major
+        self.data = data                # float32 BM25 weights
+        self.fingerprint = fingerprint
+
+    def __len__(self):
+        return len(self.passages)
+
+    def scores(self, query):
+        """BM25 score of every passage for the query"""
+        rows, weights = [], []
+        for token in set(tokenize(query)):
+            row = self.vocab.get(token)
+            if row is None:
+                continue
+            lo, hi = self.indptr[row], self.indptr[row + 1]
+            rows.append(self.indices[lo:hi])
+            weights.append(self.data[lo:hi])
+        if not rows:
+            return np.zeros(len(self.passages), dtype=np.float32)
+        return np.bincount(
+            np.concatenate(rows), weights=np.concatenate(weights), minlength=len(self.passages)
+        )
+
+    def search(self, query, k=3, min_score=0.0):
+        """Top-k passages as (score, passage), best first"""
+        scores = self.scores(query)
+        if not scores.any():
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(float(scores[i]), self.passages[i]) for i in top if scores[i] > min_score]
+
+
+def build_index(kb_dir=KB_DIR):
+    """Parse the knowledge base and compute BM25 weights"""
+    passages = []
+    for path in _sources(kb_dir):
+        passages.extend(split_passages(path.stem, path.read_text(encoding="utf-8")))
+
+    # Section headings are indexed with each passage so "Dr. Johnson hours"
+    # finds the availability paragraph under her heading
+    doc_terms = []
+    for p in passages:
+        counts = Counter(tokenize(f'{p["section"]} {p["text"]}'))
+        if p["text"].startswith("Q:"):
+            for token in tokenize(p["text"].split("\n", 1)[0]):
+                counts[token] += QUESTION_WEIGHT - 1
+        doc_terms.append(counts)
+    lengths = np.array([sum(c.values()) for c in doc_terms], dtype=np.float64)
+    avg_length = lengths.mean() if len(lengths) else 0.0
+
+    postings = {}
+    for doc, counts in enumerate(doc_terms):
+        for term, tf in counts.items():
+            postings.setdefault(term, []).append((doc, tf))
+
+    vocab = {term: row for row, term in enumerate(sorted(postings))}
+    n_docs = len(passages)
+    indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+    indices, data = [], []
+    for term, row in vocab.items():
+        docs = postings[term]
+        idf = np.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+        for doc, tf in docs:
+            norm = K1 * (1 - B + B * lengths[doc] / avg_length)
+            indices.append(doc)
+            data.append(idf * tf * (K1 + 1) / (tf + norm))
+        indptr[row + 1] = indptr[row] + len(docs)
+
+    return KnowledgeIndex(
+        vocab, passages, indptr,
+        np.array(indices, dtype=np.int32), np.array(data, dtype=np.float32),
+        fingerprint=_fingerprint(kb_dir),
+    )
+
+
+def save_index(index, path=INDEX_PATH):
+    """Write the index as MAGIC, a length-prefixed JSON header and 8-byte aligned arrays"""
+    arrays = {"indptr": index.indptr, "indices": index.indices, "data": index.data}
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {"dtype": array.dtype.str, "count": int(array.size), "offset": offset}
+        offset += -(-array.nbytes // ALIGN) * ALIGN
+    header = json.dumps({
+        "vocab": index.vocab,
+        "passages": index.passages,
+        "fingerprint": index.fingerprint,
+        "arrays": layout,
+    }).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 8 + len(header)) % ALIGN)
+
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            raw = array.tobytes()
+            f.write(raw)
+            f.write(b"\0" * (-len(raw) % ALIGN))
+    tmp.replace(path)
+    return path
+
+
+def load_index(path=INDEX_PATH):
+    """Memory-map a saved index; None if the file is missing or not an index"""
+    path = Path(path)
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_len))
+    except (OSError, ValueError, struct.error):
+        return None
+
+    base = len(MAGIC) + 8 + header_len
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        if spec["count"] == 0:
+            arrays[name] = np.zeros(0, dtype=spec["dtype"])
+            continue
+        arrays[name] = np.memmap(
+            path, dtype=spec["dtype"], mode="r", offset=base + spec["offset"], shape=(spec["count"],)
+        )
+    return KnowledgeIndex(
+        header["vocab"], header["passages"], arrays["indptr"], arrays["indices"], arrays["data"],
+        fingerprint=header.get("fingerprint"),
+    )
+
+
+def get_index(path=INDEX_PATH, kb_dir=KB_DIR):
+    """The prebuilt index if it is current, otherwise one built in memory"""
+    index = load_index(path)
+    if index is not None and index.fingerprint == _fingerprint(kb_dir):
+        return index
+    return build_index(kb_dir)
+
+
+def answer(index, question, min_score=2.0):
+    """Chat-ready answer text for a question, or None if nothing matches well"""
+    hits = index.search(question, k=1, min_score=min_score)
+    if not hits:
+        return None
+    text = hits[0][1]["text"]
+    # FAQ passages are "Q: ...\nA: ..." - reply with the answer part only
+    if text.startswith("Q:") and "\nA:" in text:
+        text = text.split("\nA:", 1)[1].strip()
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dentsi knowledge-base index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="build the index artifact")
+    build.add_argument("--kb", default=str(KB_DIR), help="knowledge base directory")
+    build.add_argument("--out", default=str(INDEX_PATH), help="output file")
+    query = sub.add_parser("query", help="search the index")
+    query.add_argument("text")
+    query.add_argument("-k", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        index = build_index(args.kb)
+        out = save_index(index, args.out)
+        print(f"Indexed {len(index)} passages, {len(index.vocab)} terms -> {out}")
+    else:
+        for score, passage in get_index().search(args.text, k=args.k):
+            print(f"[{score:.2f}] {passage['source']} / {passage['section']}")
+            print("    " + passage["text"].replace("\n", "\n    "))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Headline KPI engine shared by the Dentsi dashboards.
+
+API payloads are normalized once into flat appointment / call frames, and
+every headline number (bookings, status counts, revenue, average ticket,
+call outcomes, sentiment, duration) is computed from those frames with
+vectorized pandas/numpy operations. Frames and KPIs are memoized on a
+fingerprint of the underlying records, so reruns that see the same data
+skip the work entirely.
+
+Returned frames are shared between sessions - treat them as read-only.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import pricing
+
+MEMO_SIZE = 64
+
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+
+APPOINTMENT_COLUMNS = [
+    "id", "clinic_id", "clinic_name", "doctor_id", "doctor_name",
+    "patient_name", "patient_phone", "service_type", "appointment_date",
+    "date", "start_time", "duration_minutes", "status", "booked", "price",
+]
+
+CALL_COLUMNS = [
+    "id", "clinic_id", "clinic_name", "patient_name", "caller_phone",
+    "call_sid", "intent", "status", "outcome", "duration",
+    "sentiment_score", "created_at",
+]
+
+
+def data_version(records):
+    """Cheap fingerprint of an API record list.
+
+    Uses the fields that change when a record is edited, so a refreshed
+    fetch with identical data maps to the same memo entry.
+    """
+    if not records:
+        return 0
+    return hash(tuple(
+        (r.get("id"), r.get("updated_at"), r.get("status"), r.get("outcome"))
+        for r in records
+    ))
+
+
+def _memoized(key, build):
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+    value = build()
+    with _memo_lock:
+        _memo[key] = value
+        while len(_memo) > MEMO_SIZE:
+            _memo.popitem(last=False)
+    return value
+
+
+def _name(obj):
+    return obj.get("name") if obj else None
+
+
+def appointments_frame(appointments, engine=None):
+    """Normalize dashboard appointment records into a flat frame."""
+    engine = engine or pricing.default_engine()
+    key = ("appointments", data_version(appointments), id(engine))
+    return _memoized(key, lambda: _build_appointments_frame(appointments or [], engine))
+
+
+def _build_appointments_frame(appointments, engine):
+    patients = [a.get("patient") or {} for a in appointments]
+    df = pd.DataFrame({
+        "id": [a.get("id") for a in appointments],
+        "clinic_id": [a.get("clinic_id") for a in appointments],
+        "clinic_name": [_name(a.get("clinic")) for a in appointments],
+        "doctor_id": [a.get("doctor_id") for a in appointments],
+        "doctor_name": [_name(a.get("doctor")) for a in appointments],
+        "patient_name": [p.get("name") for p in patients],
+        "patient_phone": [p.get("phone") for p in patients],
+        "service_type": [a.get("service_type") for a in appointments],
+        "appointment_date": pd.to_datetime(
+            [a.get("appointment_date") for a in appointments], errors="coerce", utc=True, format="ISO8601"
+        ).tz_localize(None),
+        "start_time": [a.get("start_time") for a in appointments],
+        "duration_minutes": [a.get("duration_minutes") for a in appointments],
+        "status": [(a.get("status") or "scheduled").lower() for a in appointments],
+        "booked": [bool(a.get("patient")) for a in appointments],
+    }, columns=[c for c in APPOINTMENT_COLUMNS if c not in ("date", "price")])
+    df["date"] = df["appointment_date"].dt.strftime("%Y-%m-%d")
+    df["duration_minutes"] = pd.to_numeric(df["duration_minutes"], errors="coerce").fillna(60).astype(int)
+    df["booked"] = df["booked"].astype(bool)
+    df["price"] = engine.prices(df["service_type"].fillna(""))
+    return df[APPOINTMENT_COLUMNS]
+
+
+def calls_frame(calls):
+    """Normalize call records into a flat frame."""
+    key = ("calls", data_version(calls))
+    return _memoized(key, lambda: _build_calls_frame(calls or []))
+
+
+def _build_calls_frame(calls):
+    df = pd.DataFrame({
+        "id": [c.get("id") for c in calls],
+        "clinic_id": [c.get("clinic_id") for c in calls],
+        "clinic_name": [_name(c.get("clinic")) for c in calls],
+        "patient_name": [_name(c.get("patient")) for c in calls],
+        "caller_phone": [c.get("caller_phone") for c in calls],
+        "call_sid": [c.get("call_sid") for c in calls],
+        "intent": [c.get("intent") for c in calls],
+        "status": [c.get("status") for c in calls],
+        "outcome": [(c.get("outcome") or "unknown").lower() for c in calls],
+        "duration": pd.to_numeric([c.get("duration") for c in calls], errors="coerce"),
+        "sentiment_score": pd.to_numeric([c.get("sentiment_score") for c in calls], errors="coerce"),
+        "created_at": pd.to_datetime(
+            [c.get("created_at") for c in calls], errors="coerce", utc=True, format="ISO8601"
+        ).tz_localize(None),
+    }, columns=CALL_COLUMNS)
+    return df
+
+
+def _appointment_kpis(df):
+    booked = df["booked"].to_numpy(dtype=bool)
+    # Cancelled / no-show appointments earn nothing, as in rollups.RevenueRollup
+    earning = ~df["status"].isin(pricing.NO_REVENUE_STATUSES).to_numpy(dtype=bool)
+    prices = df["price"].to_numpy()
+    n_booked = int(booked.sum())
+    n_earning = int((booked & earning).sum())
+    revenue = int(prices[booked & earning].sum())
+    revenue_all = int(prices[earning].sum())
+    status_counts = df.loc[booked, "status"].value_counts().to_dict()
+    return {
+        "appointments": len(df),
+        "booked": n_booked,
+        "status_counts": {k: int(v) for k, v in status_counts.items()},
+        "scheduled": int(status_counts.get("scheduled", 0)),
+        "confirmed": int(status_counts.get("confirmed", 0)),
+        "completed": int(status_counts.get("completed", 0)),
+        "cancelled": int(status_counts.get("cancelled", 0)),
+        "revenue": revenue,
+        "avg_ticket": revenue // n_earning if n_earning else 0,
+        "revenue_all": revenue_all,
+        "avg_ticket_all": revenue_all / int(earning.sum()) if earning.any() else 0,
+    }
+
+
+def _call_kpis(df):
+    n = len(df)
+    sentiment = df["sentiment_score"].to_numpy(dtype=float)
+    # Missing or zero sentiment counts as neutral, as the dashboards always have
+    sentiment = np.where(np.isnan(sentiment) | (sentiment == 0), 0.5, sentiment)
+    duration = np.nan_to_num(df["duration"].to_numpy(dtype=float))
+    outcome_counts = df["outcome"].value_counts().to_dict()
+    booked = int(outcome_counts.get("booked", 0))
+    completed = int((df["status"] == "completed").sum())
+    return {
+        "calls": n,
+        "outcome_counts": {k: int(v) for k, v in outcome_counts.items()},
+        "booked_calls": booked,
+        "escalated_calls": int(outcome_counts.get("escalated", 0)),
+        "completed_calls": completed,
+        "booking_rate": booked / n * 100 if n else 0,
+        "success_rate": completed / n * 100 if n else 0,
+        "avg_sentiment": float(sentiment.mean()) if n else 0.5,
+        "avg_duration": float(duration.mean()) if n else 0,
+    }
+
+
+def compute_kpis(appointments=None, calls=None, engine=None):
+    """Every headline metric for the given appointment and call records.
+
+    Either input may be omitted; the matching KPIs are then reported over
+    an empty set.
+    """
+    engine = engine or pricing.default_engine()
+    key = ("kpis", data_version(appointments), data_version(calls), id(engine))
+
+    def build():
+        result = _appointment_kpis(appointments_frame(appointments, engine))
+        result.update(_call_kpis(calls_frame(calls)))
+        return result
+
+    return _memoized(key, build)
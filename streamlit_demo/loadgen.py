@@ -0,0 +1,234 @@
+"""
+Concurrent-session load generator for the Dentsi dashboards.
+
+Drives N simulated staff sessions at once - each one a headless AppTest
+session in its own worker process - against a local stub_api.py server,
+for N = 1, 2, 4, ... Every session repeats a scripted mix of typical
+interactions with a short think time:
+
+    refresh     plain rerun (auto-refresh, returning to the tab)
+    widget      change a radio/selectbox in the page body (calendar view,
+                call filters, revenue period, ...)
+    search      type into the patient search box
+    clinic      pick another clinic in the sidebar
+
+Tabs switch in the browser without a rerun, so "switching tabs" costs the
+server nothing; the widget action stands in for working inside a tab.
+Actions an app does not offer fall back to a refresh.
+
+For each N it reports rerun latency percentiles, throughput, CPU use and
+memory, and the capacity: the last N before p95 first exceeds --slo-ms:
+
+    python loadgen.py                                   # pages/dentsi_app.py, 1..8 sessions
+    python loadgen.py --app pages/dentsi_complete.py --sessions 1 4 16 --duration 60
+    python loadgen.py --rows 100000 --latency lognormal:80,0.5 --json load.json
+
+Sessions are separate processes, so each holds its own fetcher cache
+(sized_cache.py) and imports: in one real replica every session shares
+the same frozen fetch results and cache budget, so per-session memory
+here is an upper bound and shared-cache hits are not reproduced. CPU is what the sessions used
+over the measured window, as a share of all cores; the stub is excluded.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bench import HERE, TIMEOUT, StubServer, offline_env
+
+SESSIONS = [1, 2, 4, 8]
+DURATION = 30
+THINK_MS = 500
+SLO_MS = 1000
+
+# Relative frequency of each action in a session
+ACTIONS = {"refresh": 3, "widget": 4, "search": 2, "clinic": 1}
+
+SEARCH_TERMS = ["", "a", "john", "smi", "mar", "555", "lee", "x"]
+
+# Widgets the load must not touch (the profiler's debug panel)
+SKIP_KEYS = {"profiler_pick"}
+
+
+# ============================================================================
+# ONE SESSION (worker process)
+# ============================================================================
+
+def _pick_other(widget, rng):
+    """Set a radio/selectbox to a different option; False if it has none"""
+    options = list(widget.options)
+    if len(options) < 2:
+        return False
+    current = widget.index if widget.index is not None else -1
+    choice = rng.choice([i for i in range(len(options)) if i != current])
+    if widget.type == "radio":
+        widget.set_value(options[choice])
+    else:
+        widget.select_index(choice)
+    return True
+
+
+def act(at, action, rng):
+    """Apply `action` to the session's widgets; returns the action actually taken"""
+    if action == "widget":
+        widgets = [w for w in list(at.main.radio) + list(at.main.selectbox) if w.key not in SKIP_KEYS]
+        rng.shuffle(widgets)
+        if any(_pick_other(w, rng) for w in widgets[:3]):
+            return action
+    elif action == "search":
+        try:
+            at.text_input(key="patient_search").input(rng.choice(SEARCH_TERMS))
+            return action
+        except KeyError:
+            pass
+    elif action == "clinic":
+        if len(at.sidebar.selectbox) and _pick_other(at.sidebar.selectbox[0], rng):
+            return action
+    return "refresh"
+
+
+def _cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_session(app, index, duration, think_ms, seed, barrier):
+    """One simulated session: first run, then actions until `duration` is up"""
+    # Streamlit's "no runtime" warnings would drown the report
+    logging.disable(logging.WARNING)
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(HERE)
+    rng = random.Random(seed * 1000 + index)
+    at = AppTest.from_file(str(HERE / app), default_timeout=TIMEOUT)
+    started = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - started
+
+    barrier.wait()
+    cpu_start, samples, errors = _cpu_seconds(), [], 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        time.sleep(rng.expovariate(1000 / think_ms) if think_ms else 0)
+        action = act(at, rng.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0], rng)
+        started = time.perf_counter()
+        try:
+            at.run()
+            failed = bool(at.exception)
+        except Exception:
+            failed = True
+        samples.append((action, time.perf_counter() - started))
+        if failed:
+            errors += 1
+            # Start over like a user reloading the page
+            at = AppTest.from_file(str(HERE / app), default_timeout=TIMEOUT)
+            at.run()
+    return {
+        "first_s": first,
+        "samples": samples,
+        "errors": errors,
+        "cpu_s": _cpu_seconds() - cpu_start,
+        # ru_maxrss is KiB on Linux
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+# ============================================================================
+# A LOAD STEP (N sessions)
+# ============================================================================
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * q / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def run_step(app, sessions, duration, think_ms, seed):
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Manager() as manager, ProcessPoolExecutor(max_workers=sessions, mp_context=ctx) as pool:
+        barrier = manager.Barrier(sessions)
+        futures = [pool.submit(run_session, app, i, duration, think_ms, seed, barrier) for i in range(sessions)]
+        results = [f.result() for f in futures]
+
+    latencies = [s for r in results for _, s in r["samples"]]
+    by_action = {}
+    for r in results:
+        for action, s in r["samples"]:
+            by_action.setdefault(action, []).append(s)
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "reruns_per_s": round(len(latencies) / duration, 2),
+        "errors": sum(r["errors"] for r in results),
+        "first_ms": round(percentile([r["first_s"] for r in results], 50) * 1000, 1),
+        **{f"p{q}_ms": round(percentile(latencies, q) * 1000, 1) for q in (50, 90, 95, 99)},
+        "max_ms": round(max(latencies, default=0) * 1000, 1),
+        "actions": {a: {"count": len(v), "p95_ms": round(percentile(v, 95) * 1000, 1)}
+                    for a, v in sorted(by_action.items())},
+        "cpu_pct": round(100 * sum(r["cpu_s"] for r in results) / (duration * (os.cpu_count() or 1)), 1),
+        "rss_mb_per_session": round(percentile([r["rss_mb"] for r in results], 50), 1),
+        "rss_mb_total": round(sum(r["rss_mb"] for r in results), 1),
+    }
+
+
+def print_steps(steps):
+    print(f"{'sessions':>8}{'reruns/s':>10}{'p50 ms':>9}{'p90 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}{'errors':>8}{'cpu %':>8}{'MB/sess':>9}{'MB total':>10}")
+    for s in steps:
+        print(f"{s['sessions']:>8}{s['reruns_per_s']:>10.2f}{s['p50_ms']:>9.0f}{s['p90_ms']:>9.0f}{s['p95_ms']:>9.0f}"
+              f"{s['p99_ms']:>9.0f}{s['max_ms']:>9.0f}{s['errors']:>8}{s['cpu_pct']:>8.1f}"
+              f"{s['rss_mb_per_session']:>9.0f}{s['rss_mb_total']:>10.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test of a Dentsi dashboard against the stub API")
+    parser.add_argument("--app", default="pages/dentsi_app.py")
+    parser.add_argument("--sessions", nargs="+", type=int, default=SESSIONS, help="concurrent sessions per step")
+    parser.add_argument("--duration", type=float, default=DURATION, help="measured seconds per step")
+    parser.add_argument("--think-ms", type=float, default=THINK_MS, help="mean pause between a session's actions")
+    parser.add_argument("--rows", type=int, default=10_000, help="stub data size")
+    parser.add_argument("--latency", default="0", help="stub response delay, as for stub_api.py --latency")
+    parser.add_argument("--slo-ms", type=float, default=SLO_MS, help="p95 rerun latency that counts as degraded")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    os.chdir(HERE)
+    steps = []
+    with StubServer(args.rows, ["--latency", args.latency]) as stub:
+        os.environ.update(offline_env(stub.url))
+        for n in args.sessions:
+            print(f"... {n} session(s) on {args.app} for {args.duration:g}s", file=sys.stderr, flush=True)
+            steps.append(run_step(args.app, n, args.duration, args.think_ms, args.seed))
+
+    print_steps(steps)
+    # Capacity: the last step before the first one over the SLO (or with errors)
+    capacity = None
+    for step in steps:
+        if step["p95_ms"] > args.slo_ms or step["errors"]:
+            break
+        capacity = step["sessions"]
+    if capacity is None:
+        print(f"No step kept p95 <= {args.slo_ms:g} ms")
+    else:
+        print(f"Capacity: {capacity} concurrent session(s) with p95 <= {args.slo_ms:g} ms ({os.cpu_count()} CPU(s))")
+    if args.json:
+        args.json.write_text(json.dumps({"app": args.app, "rows": args.rows, "steps": steps}, indent=2) + "\n",
+                             encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""
+Prometheus metrics for the Dentsi dashboards.
+
+Aggregates what profiler.py records in every app - backend request
+latency per endpoint, cached-fetch hits and misses, rerun time per app
+and per tab - plus active sessions and their session-state size and the
+occupancy of the fetcher cache (sized_cache.py), and
+serves it in the Prometheus text exposition format from a small sidecar
+HTTP thread:
+
+    DENTSI_METRICS_PORT=9464 streamlit run streamlit_app.py
+    curl http://localhost:9464/metrics
+
+Apps call metrics.start() once per rerun (idempotent); without
+DENTSI_METRICS_PORT nothing listens, the counters are still kept.
+"""
+
+import math
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import profiler
+import sized_cache
+from sized_cache import deep_size
+
+PORT_ENV = "DENTSI_METRICS_PORT"
+HOST_ENV = "DENTSI_METRICS_HOST"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+RERUN_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# A session counts as active while it has rerun within this many seconds
+SESSION_TTL = 10 * 60
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# ============================================================================
+# METRIC FAMILIES
+# ============================================================================
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def set(self, *labels, value):
+        """Set the value outright (for a count kept elsewhere)"""
+        with self._lock:
+            self.values[labels] = value
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, _labels(self.labels, k), v) for k, v in sorted(self.values.items())]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def replace(self, values):
+        with self._lock:
+            self.values = dict(values)
+
+
+class Histogram(Counter):
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, *labels, value):
+        with self._lock:
+            counts = self.values.get(labels)
+            if counts is None:
+                counts = self.values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[0][i] += 1
+            counts[1] += value
+            counts[2] += 1
+
+    def samples(self):
+        out = []
+        with self._lock:
+            for key, (buckets, total, count) in sorted(self.values.items()):
+                for bound, n in zip(self.buckets, buckets):
+                    out.append((f"{self.name}_bucket", _labels(self.labels, key, [("le", _number(bound))]), n))
+                out.append((f"{self.name}_sum", _labels(self.labels, key), total))
+                out.append((f"{self.name}_count", _labels(self.labels, key), count))
+        return out
+
+
+class Registry:
+    def __init__(self):
+        self.families = []
+        self.collectors = []
+
+    def add(self, family):
+        self.families.append(family)
+        return family
+
+    def collector(self, fn):
+        """Register fn() to refresh gauges right before each scrape"""
+        self.collectors.append(fn)
+        return fn
+
+    def render(self):
+        for collect in self.collectors:
+            try:
+                collect()
+            except Exception:
+                pass
+        lines = []
+        for family in self.families:
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            lines.extend(f"{name}{labels} {_number(value)}" for name, labels, value in family.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+UPSTREAM_SECONDS = REGISTRY.add(Histogram(
+    "dentsi_upstream_request_duration_seconds", "Backend API request latency.",
+    ("app", "endpoint", "method"), LATENCY_BUCKETS))
+UPSTREAM_ERRORS = REGISTRY.add(Counter(
+    "dentsi_upstream_request_errors_total", "Backend API requests that raised (timeouts, refused connections).",
+    ("app", "endpoint", "method", "error")))
+CACHE_REQUESTS = REGISTRY.add(Counter(
+    "dentsi_cache_requests_total", "Cached fetcher calls by result (hit or miss).",
+    ("app", "fetch", "result")))
+CACHE_HIT_RATIO = REGISTRY.add(Gauge(
+    "dentsi_cache_hit_ratio", "Share of cached fetcher calls served from the cache.",
+    ("app", "fetch")))
+RERUN_SECONDS = REGISTRY.add(Histogram(
+    "dentsi_rerun_duration_seconds", "Script rerun wall time.",
+    ("app",), RERUN_BUCKETS))
+TAB_SECONDS = REGISTRY.add(Histogram(
+    "dentsi_tab_render_duration_seconds", "Wall time spent rendering each tab per rerun.",
+    ("app", "tab"), RERUN_BUCKETS))
+ACTIVE_SESSIONS = REGISTRY.add(Gauge(
+    "dentsi_active_sessions", f"Sessions that reran in the last {SESSION_TTL} s.",
+    ("app",)))
+SESSION_STATE_BYTES = REGISTRY.add(Gauge(
+    "dentsi_session_state_bytes", "Approximate st.session_state size summed over active sessions.",
+    ("app",)))
+FETCH_CACHE_BYTES = REGISTRY.add(Gauge(
+    "dentsi_fetch_cache_bytes", "Bytes held by the fetcher cache, per fetcher.",
+    ("fetch",)))
+FETCH_CACHE_ENTRIES = REGISTRY.add(Gauge(
+    "dentsi_fetch_cache_entries", "Entries in the fetcher cache, per fetcher.",
+    ("fetch",)))
+FETCH_CACHE_BUDGET = REGISTRY.add(Gauge(
+    "dentsi_fetch_cache_budget_bytes", "Memory budget of the fetcher cache."))
+FETCH_CACHE_EVICTIONS = REGISTRY.add(Counter(
+    "dentsi_fetch_cache_evictions_total", "Entries evicted from the fetcher cache to stay within budget."))
+
+
+# ============================================================================
+# FEEDS (profiler callbacks)
+# ============================================================================
+
+# session id -> (app, last rerun, session_state bytes)
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _session_context():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        return None
+
+
+def _observe_session(app):
+    ctx = _session_context()
+    if ctx is None:
+        return
+    try:
+        size = deep_size(ctx.session_state.filtered_state)
+    except Exception:
+        size = 0
+    now = time.monotonic()
+    with _sessions_lock:
+        _sessions[ctx.session_id] = (app, now, size)
+        for sid, (_, seen, _) in list(_sessions.items()):
+            if now - seen > SESSION_TTL:
+                del _sessions[sid]
+        active, memory = {}, {}
+        for sid_app, _, sid_size in _sessions.values():
+            active[(sid_app,)] = active.get((sid_app,), 0) + 1
+            memory[(sid_app,)] = memory.get((sid_app,), 0) + sid_size
+    ACTIVE_SESSIONS.replace(active)
+    SESSION_STATE_BYTES.replace(memory)
+
+
+def observe_run(run):
+    app = run.label
+    RERUN_SECONDS.observe(app, value=run.duration)
+    for span in run.spans:
+        if span.kind == "fetch" and "cache" in span.attrs:
+            CACHE_REQUESTS.inc(app, span.name, span.attrs["cache"])
+        elif span.kind == "section" and span.name.startswith("tab: "):
+            TAB_SECONDS.observe(app, span.name[5:], value=span.duration)
+    _update_hit_ratios()
+    _observe_session(app)
+
+
+def observe_upstream(run, endpoint, method, seconds, error):
+    app = run.label if run is not None else "background"
+    UPSTREAM_SECONDS.observe(app, endpoint, method, value=seconds)
+    if error:
+        UPSTREAM_ERRORS.inc(app, endpoint, method, error)
+
+
+def _update_hit_ratios():
+    totals = {}
+    for (app, fetch, result), n in list(CACHE_REQUESTS.values.items()):
+        hits, calls = totals.get((app, fetch), (0, 0))
+        totals[(app, fetch)] = (hits + (n if result == "hit" else 0), calls + n)
+    CACHE_HIT_RATIO.replace({key: round(hits / calls, 4) for key, (hits, calls) in totals.items() if calls})
+
+
+@REGISTRY.collector
+def collect_cache():
+    cache = sized_cache.stats()
+    FETCH_CACHE_BYTES.replace({(ns,): v["bytes"] for ns, v in cache["namespaces"].items()})
+    FETCH_CACHE_ENTRIES.replace({(ns,): v["entries"] for ns, v in cache["namespaces"].items()})
+    FETCH_CACHE_BUDGET.set(value=cache["budget_bytes"])
+    FETCH_CACHE_EVICTIONS.set(value=cache["evictions"])
+
+
+profiler.on_finish(observe_run)
+profiler.on_upstream(observe_upstream)
+
+
+# ============================================================================
+# SIDECAR HTTP SERVER
+# ============================================================================
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+
+def serve(port, host="0.0.0.0"):
+    """Serve /metrics from a daemon thread; returns the server"""
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="dentsi-metrics", daemon=True).start()
+    return server
+
+
+def start(port=None, host=None):
+    """Start the sidecar once per process (port from DENTSI_METRICS_PORT); None when disabled"""
+    global _server, _server_failed
+    if _server is not None or _server_failed:
+        return _server
+    port = port if port is not None else int(os.environ.get(PORT_ENV) or 0)
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = serve(port, host or os.environ.get(HOST_ENV, "0.0.0.0"))
+            except OSError as e:
+                # Another process already owns the port; keep collecting, don't break the page
+                _server_failed = True
+                print(f"metrics: cannot listen on {port}: {e}", file=sys.stderr)
+                return None
+    return _server
@@ -2,17 +2,19 @@
 DENTRA AI Voice Agent - Demo Dashboard
 A Streamlit-based dashboard for clinic demos
 
-Run with: streamlit run app.py
+Page of the multipage app: streamlit run streamlit_app.py
 """
 
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime
 import json
 
-# Configuration
-API_BASE = "https://dentcognit.abacusai.app"
+import kpis
+import metrics
+import profiler
+import tracing
+from dentsi_dashboard import client, models, renderers
 
 st.set_page_config(
     page_title="DENTRA - AI Voice Agent",
@@ -21,113 +23,25 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1e3a5f;
-        margin-bottom: 0;
-    }
-    .sub-header {
-        color: #64748b;
-        font-size: 1.1rem;
-        margin-top: 0;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 12px;
-        color: white;
-    }
-    .stat-value {
-        font-size: 2.5rem;
-        font-weight: bold;
-    }
-    .stat-label {
-        font-size: 0.9rem;
-        opacity: 0.9;
-    }
-    .success-badge {
-        background: #10b981;
-        color: white;
-        padding: 4px 12px;
-        border-radius: 20px;
-        font-size: 0.8rem;
-    }
-    .warning-badge {
-        background: #f59e0b;
-        color: white;
-        padding: 4px 12px;
-        border-radius: 20px;
-        font-size: 0.8rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# API Functions
-@st.cache_data(ttl=30)
-def get_health():
-    try:
-        r = requests.get(f"{API_BASE}/health", timeout=10)
-        return r.json()
-    except:
-        return {"status": "error"}
-
-@st.cache_data(ttl=30)
-def get_clinics():
-    try:
-        r = requests.get(f"{API_BASE}/clinics", timeout=10)
-        return r.json()
-    except:
-        return []
-
-@st.cache_data(ttl=30)
-def get_stats(clinic_id=None):
-    try:
-        url = f"{API_BASE}/api/dashboard/stats"
-        if clinic_id:
-            url += f"?clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", {})
-    except:
-        return {}
+# Per-rerun timings, exported by the metrics sidecar (DENTSI_METRICS_PORT)
+# and as traces (DENTSI_TRACE_FILE / DENTSI_OTLP_ENDPOINT)
+profiler.begin("app", profiler.history(st.session_state))
+metrics.start()
+tracing.start()
 
-@st.cache_data(ttl=30)
-def get_appointments(clinic_id=None, limit=20):
-    try:
-        url = f"{API_BASE}/api/dashboard/appointments?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
-
-@st.cache_data(ttl=30)
-def get_calls(clinic_id=None, limit=20):
-    try:
-        url = f"{API_BASE}/api/dashboard/calls?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
+# Custom CSS
+renderers.inject_css("app")
 
 # Sidebar
-with st.sidebar:
+with st.sidebar, profiler.span("sidebar"):
     st.image("https://cdn-icons-png.flaticon.com/512/2977/2977285.png", width=80)
     st.markdown("## DENTRA")
     st.markdown("*AI Voice Agent for Dental Clinics*")
     st.divider()
     
     # Clinic selector
-    clinics = get_clinics()
-    clinic_options = {"All Clinics": None}
-    for c in clinics:
-        clinic_options[c["name"]] = c["id"]
+    clinics = client.fetch_clinics()
+    clinic_options = models.clinic_options(clinics)
     
     selected_clinic_name = st.selectbox(
         "Select Clinic",
@@ -138,7 +52,7 @@ with st.sidebar:
     st.divider()
     
     # Health status
-    health = get_health()
+    health = client.fetch_health()
     if health.get("status") == "ok":
         st.success("✅ System Online")
     else:
@@ -148,16 +62,15 @@ with st.sidebar:
     
     # Quick links
     st.markdown("### Quick Links")
-    st.markdown(f"[📄 API Docs]({API_BASE}/api-docs)")
-    st.markdown(f"[❤️ Health Check]({API_BASE}/health)")
+    renderers.api_links()
 
 # Main content
 st.markdown('<p class="main-header">🦷 DENTRA Dashboard</p>', unsafe_allow_html=True)
 st.markdown('<p class="sub-header">AI Voice Agent for Dental Clinics - Real-Time Operations</p>', unsafe_allow_html=True)
 st.divider()
 
-# Load data
-stats = get_stats(selected_clinic_id)
+# Load data (headline numbers use the same KPI definitions as the other pages)
+kpi = kpis.compute_kpis(client.fetch_appointments(selected_clinic_id), client.fetch_calls(selected_clinic_id))
 
 # Metrics row
 col1, col2, col3, col4, col5, col6 = st.columns(6)
@@ -165,45 +78,43 @@ col1, col2, col3, col4, col5, col6 = st.columns(6)
 with col1:
     st.metric(
         "Total Calls",
-        stats.get("calls", {}).get("total", 0),
-        help="Total inbound calls handled"
+        kpi["calls"],
+        help="Recent inbound calls handled"
     )
 
 with col2:
     st.metric(
         "Appointments",
-        stats.get("appointments", {}).get("total", 0),
-        help="Total appointments in system"
+        kpi["booked"],
+        help="Recent booked appointments"
     )
 
 with col3:
     st.metric(
         "Confirmed",
-        stats.get("appointments", {}).get("confirmed", 0),
+        kpi["confirmed"],
         help="Confirmed appointments"
     )
 
 with col4:
     st.metric(
         "Escalations",
-        stats.get("calls", {}).get("escalated", 0),
+        kpi["escalated_calls"],
         help="Calls requiring staff attention"
     )
 
 with col5:
-    success_rate = stats.get("calls", {}).get("successRate", 0)
     st.metric(
         "Success Rate",
-        f"{success_rate:.1f}%",
+        f"{kpi['success_rate']:.1f}%",
         help="Call completion rate"
     )
 
 with col6:
-    revenue = stats.get("revenue", {}).get("estimated", 0)
     st.metric(
         "Est. Revenue",
-        f"${revenue:,.0f}",
-        help="Estimated revenue from appointments"
+        f"${kpi['revenue']:,.0f}",
+        help="Estimated revenue from booked appointments (cancellations and no-shows excluded)"
     )
 
 st.divider()
@@ -211,21 +122,21 @@ st.divider()
 # Tabs
 tab1, tab2, tab3, tab4 = st.tabs(["📅 Appointments", "📞 Calls", "🏥 Clinics", "ℹ️ About"])
 
-with tab1:
+with tab1, profiler.span("tab: Appointments"):
     st.subheader("Recent Appointments")
     
-    appointments = get_appointments(selected_clinic_id, limit=20)
+    appointments = client.fetch_appointments(selected_clinic_id, limit=20)
     
     if appointments:
         # Convert to DataFrame
-        df = pd.DataFrame(appointments)
+        df = kpis.appointments_frame(appointments)
         
         # Format for display
         display_df = pd.DataFrame({
-            "Patient": df.apply(lambda x: x["patient"]["name"] if x.get("patient") else "Available Slot", axis=1),
-            "Clinic": df.apply(lambda x: x["clinic"]["name"] if x.get("clinic") else "-", axis=1),
+            "Patient": df["patient_name"].where(df["booked"], "Available Slot").fillna("Available Slot"),
+            "Clinic": df["clinic_name"].fillna("-"),
             "Service": df["service_type"],
-            "Date": pd.to_datetime(df["appointment_date"]).dt.strftime("%b %d, %Y"),
+            "Date": df["appointment_date"].dt.strftime("%b %d, %Y"),
             "Status": df["status"].str.upper()
         })
         
@@ -237,22 +148,22 @@ with tab1:
     else:
         st.info("No appointments found.")
 
-with tab2:
+with tab2, profiler.span("tab: Calls"):
     st.subheader("Call History")
     
-    calls = get_calls(selected_clinic_id, limit=20)
+    calls = client.fetch_calls(selected_clinic_id, limit=20)
     
     if calls:
-        df = pd.DataFrame(calls)
+        df = kpis.calls_frame(calls)
         
         display_df = pd.DataFrame({
             "Call ID": df["call_sid"].str[:12] + "...",
-            "Clinic": df.apply(lambda x: x["clinic"]["name"] if x.get("clinic") else "-", axis=1),
+            "Clinic": df["clinic_name"].fillna("-"),
             "Intent": df["intent"].fillna("Unknown"),
-            "Duration": df["duration"].apply(lambda x: f"{x}s" if x else "-"),
+            "Duration": (df["duration"].astype("Int64").astype(str) + "s").where(df["duration"] > 0, "-"),
             "Status": df["status"].str.upper(),
-            "Outcome": df["outcome"].fillna("-"),
-            "Date": pd.to_datetime(df["created_at"]).dt.strftime("%b %d %H:%M")
+            "Outcome": df["outcome"].where(df["outcome"] != "unknown", "-"),
+            "Date": df["created_at"].dt.strftime("%b %d %H:%M")
         })
         
         st.dataframe(
@@ -263,7 +174,7 @@ with tab2:
     else:
         st.info("No calls recorded yet. Calls will appear here once the Twilio integration is activated.")
 
-with tab3:
+with tab3, profiler.span("tab: Clinics"):
     st.subheader("Clinic Directory")
     
     for clinic in clinics:
@@ -286,7 +197,7 @@ with tab3:
                 for svc in clinic["services"]:
                     st.markdown(f"- {svc['service_name']}: ${svc['price']:.0f} ({svc['duration_minutes']} min)")
 
-with tab4:
+with tab4, profiler.span("tab: About"):
     st.subheader("About DENTRA")
     
     st.markdown("""
@@ -329,6 +240,8 @@ with tab4:
 # Footer
 st.divider()
 st.markdown(
-    f"<center><small>DENTRA AI Voice Agent | Backend: {API_BASE} | Last Updated: {datetime.now().strftime('%H:%M:%S')}</small></center>",
+    f"<center><small>DENTRA AI Voice Agent | Backend: {client.api_base()} | Last Updated: {datetime.now().strftime('%H:%M:%S')}</small></center>",
     unsafe_allow_html=True
 )
+
+profiler.finish()
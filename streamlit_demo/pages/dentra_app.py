@@ -2,11 +2,10 @@
 🦷 DENTRA AI Voice Agent - Enterprise Demo Dashboard
 A stunning Streamlit app showcasing AI-powered dental clinic automation
 
-Run with: streamlit run dentra_app.py
+Page of the multipage app: streamlit run streamlit_app.py
 """
 
 import streamlit as st
-import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -14,15 +13,19 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
-import random
-import time
+
+import kpis
+import metrics
+import profiler
+import synthetic
+import replay
+import tracing
+from dentsi_dashboard import client, models, renderers
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-API_BASE = "https://dentcognit.abacusai.app"
-
 st.set_page_config(
     page_title="DENTRA - AI Voice Agent for Dental Clinics",
     page_icon="🦷",
@@ -30,339 +33,53 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Per-rerun timings, exported by the metrics sidecar (DENTSI_METRICS_PORT)
+# and as traces (DENTSI_TRACE_FILE / DENTSI_OTLP_ENDPOINT)
+profiler.begin("dentra_app", profiler.history(st.session_state))
+metrics.start()
+tracing.start()
+
 # ============================================================================
 # CUSTOM CSS - Premium Styling
 # ============================================================================
 
-st.markdown("""
-<style>
-    /* Main background */
-    .stApp {
-        background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #0f172a 100%);
-    }
-    
-    /* Hide default Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Header styling */
-    .main-header {
-        font-size: 3rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #60a5fa 0%, #a78bfa 50%, #f472b6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 0;
-        padding: 20px 0;
-    }
-    
-    .sub-header {
-        color: #94a3b8;
-        font-size: 1.2rem;
-        text-align: center;
-        margin-top: 0;
-        margin-bottom: 30px;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
-        border: 1px solid rgba(99, 102, 241, 0.3);
-        border-radius: 16px;
-        padding: 24px;
-        text-align: center;
-        transition: all 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-4px);
-        border-color: rgba(99, 102, 241, 0.6);
-        box-shadow: 0 20px 40px rgba(99, 102, 241, 0.2);
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #60a5fa 0%, #a78bfa 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    
-    .metric-label {
-        color: #94a3b8;
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-top: 8px;
-    }
-    
-    .metric-delta {
-        color: #34d399;
-        font-size: 0.85rem;
-        margin-top: 4px;
-    }
-    
-    /* Agent cards */
-    .agent-card {
-        background: rgba(30, 41, 59, 0.8);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        border-radius: 12px;
-        padding: 20px;
-        margin: 10px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .agent-card:hover {
-        border-color: rgba(99, 102, 241, 0.5);
-        transform: scale(1.02);
-    }
-    
-    .agent-icon {
-        font-size: 2rem;
-        margin-bottom: 10px;
-    }
-    
-    .agent-name {
-        color: #f1f5f9;
-        font-size: 1.1rem;
-        font-weight: 600;
-        margin-bottom: 8px;
-    }
-    
-    .agent-desc {
-        color: #94a3b8;
-        font-size: 0.85rem;
-    }
-    
-    /* Status badges */
-    .badge-success {
-        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-        color: white;
-        padding: 6px 16px;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 600;
-    }
-    
-    .badge-warning {
-        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
-        color: white;
-        padding: 6px 16px;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 600;
-    }
-    
-    .badge-danger {
-        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
-        color: white;
-        padding: 6px 16px;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 600;
-    }
-    
-    /* Feature cards */
-    .feature-card {
-        background: rgba(30, 41, 59, 0.6);
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        border-radius: 16px;
-        padding: 24px;
-        height: 100%;
-    }
-    
-    .feature-icon {
-        font-size: 2.5rem;
-        margin-bottom: 16px;
-    }
-    
-    .feature-title {
-        color: #f1f5f9;
-        font-size: 1.2rem;
-        font-weight: 600;
-        margin-bottom: 12px;
-    }
-    
-    .feature-text {
-        color: #94a3b8;
-        font-size: 0.9rem;
-        line-height: 1.6;
-    }
-    
-    /* Conversation demo */
-    .chat-bubble-user {
-        background: rgba(59, 130, 246, 0.2);
-        border: 1px solid rgba(59, 130, 246, 0.4);
-        border-radius: 16px 16px 4px 16px;
-        padding: 16px;
-        margin: 12px 0;
-        margin-left: 40px;
-        color: #e2e8f0;
-    }
-    
-    .chat-bubble-ai {
-        background: rgba(139, 92, 246, 0.2);
-        border: 1px solid rgba(139, 92, 246, 0.4);
-        border-radius: 16px 16px 16px 4px;
-        padding: 16px;
-        margin: 12px 0;
-        margin-right: 40px;
-        color: #e2e8f0;
-    }
-    
-    .chat-label {
-        font-size: 0.75rem;
-        color: #64748b;
-        margin-bottom: 6px;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background: rgba(30, 41, 59, 0.5);
-        padding: 8px;
-        border-radius: 12px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        color: #94a3b8;
-        border-radius: 8px;
-        padding: 12px 24px;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-        color: white;
-    }
-    
-    /* Section headers */
-    .section-header {
-        color: #f1f5f9;
-        font-size: 1.5rem;
-        font-weight: 600;
-        margin: 30px 0 20px 0;
-        padding-bottom: 10px;
-        border-bottom: 2px solid rgba(99, 102, 241, 0.3);
-    }
-    
-    /* Sidebar */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
-        border-right: 1px solid rgba(99, 102, 241, 0.2);
-    }
-    
-    /* Dataframe styling */
-    .stDataFrame {
-        border-radius: 12px;
-        overflow: hidden;
-    }
-    
-    /* Progress bars */
-    .stProgress > div > div {
-        background: linear-gradient(90deg, #6366f1 0%, #a78bfa 100%);
-    }
-    
-    /* Dividers */
-    hr {
-        border: none;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, rgba(99, 102, 241, 0.3), transparent);
-        margin: 30px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+renderers.inject_css("dentra_app")
 
 # ============================================================================
 # MOCK DATA GENERATORS
 # ============================================================================
 
-def generate_call_data(days=30):
-    """Generate realistic call data for charts"""
-    dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
-    data = {
-        'date': dates,
-        'total_calls': [random.randint(25, 60) for _ in range(days)],
-        'booked': [random.randint(15, 40) for _ in range(days)],
-        'inquiries': [random.randint(5, 15) for _ in range(days)],
-        'emergencies': [random.randint(1, 5) for _ in range(days)],
-        'escalated': [random.randint(1, 4) for _ in range(days)],
-    }
-    return pd.DataFrame(data)
-
-def generate_revenue_data():
-    """Generate revenue by service type"""
-    services = ['Implants', 'Crowns', 'Root Canals', 'Cleanings', 'Fillings', 'Extractions', 'Whitening']
-    revenue = [45000, 32000, 28000, 18000, 15000, 12000, 8000]
-    appointments = [9, 22, 19, 120, 60, 40, 35]
-    return pd.DataFrame({'service': services, 'revenue': revenue, 'appointments': appointments})
-
-def generate_hourly_calls():
-    """Generate call distribution by hour"""
-    hours = list(range(8, 20))
-    calls = [12, 28, 45, 52, 48, 35, 42, 55, 48, 32, 18, 8]
-    return pd.DataFrame({'hour': hours, 'calls': calls})
-
-def generate_patient_data():
-    """Generate patient statistics"""
-    return {
-        'total': 1250,
-        'new_this_month': 87,
-        'returning': 1163,
-        'with_insurance': 892,
-        'overdue_cleaning': 156
-    }
-
-# ============================================================================
-# API FUNCTIONS
-# ============================================================================
+# One seeded synthetic data set (clinics, doctors, patients, appointments,
+# calls) per day, shared by all sessions; the charts are summaries of it
+@st.cache_resource(max_entries=2)
+def get_demo_data(day):
+    return synthetic.generate(end=day)
 
-@st.cache_data(ttl=60)
-def get_api_health():
-    try:
-        r = requests.get(f"{API_BASE}/health", timeout=10)
-        return r.json()
-    except:
-        return {"status": "offline"}
+@st.cache_data(max_entries=8)
+def demo_call_data(day, days=30):
+    """Daily call volume for the last `days` days"""
+    return synthetic.daily_calls(get_demo_data(day)["call"], days=days, end=day)
 
-@st.cache_data(ttl=60)
-def get_clinics():
-    try:
-        r = requests.get(f"{API_BASE}/clinics", timeout=10)
-        return r.json()
-    except:
-        return []
+@st.cache_data(max_entries=2)
+def demo_revenue_data(day):
+    """Revenue and appointments by service type"""
+    return synthetic.revenue_by_service(get_demo_data(day)["appointment"])
 
-@st.cache_data(ttl=60)
-def get_dashboard_stats(clinic_id=None):
-    try:
-        url = f"{API_BASE}/api/dashboard/stats"
-        if clinic_id:
-            url += f"?clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", {})
-    except:
-        return {}
+@st.cache_data(max_entries=2)
+def demo_hourly_calls(day):
+    """Call distribution by hour"""
+    return synthetic.hourly_calls(get_demo_data(day)["call"])
 
-@st.cache_data(ttl=60)
-def get_appointments(clinic_id=None, limit=50):
-    try:
-        url = f"{API_BASE}/api/dashboard/appointments?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
+@st.cache_data(max_entries=2)
+def demo_patient_data(day):
+    """Patient statistics"""
+    return synthetic.patient_summary(get_demo_data(day)["patient"], end=day)
 
 # ============================================================================
 # SIDEBAR
 # ============================================================================
 
-with st.sidebar:
+with st.sidebar, profiler.span("sidebar"):
     # Logo and title
     st.markdown("""
     <div style="text-align: center; padding: 20px 0;">
@@ -386,10 +103,8 @@ with st.sidebar:
     st.divider()
     
     # Clinic selector
-    clinics = get_clinics()
-    clinic_options = {"🏥 All Clinics": None}
-    for c in clinics:
-        clinic_options[f"🏥 {c['name']}"] = c["id"]
+    clinics = client.fetch_clinics()
+    clinic_options = models.clinic_options(clinics, "🏥 All Clinics", prefix="🏥 ")
     
     selected_clinic_name = st.selectbox(
         "Select Clinic",
@@ -401,7 +116,7 @@ with st.sidebar:
     st.divider()
     
     # System status
-    health = get_api_health()
+    health = client.fetch_health()
     if health.get("status") == "ok":
         st.markdown("""
         <div style="background: rgba(16, 185, 129, 0.2); border: 1px solid rgba(16, 185, 129, 0.4);
@@ -425,9 +140,9 @@ with st.sidebar:
     
     # Quick links
     st.markdown("### 🔗 Quick Links")
-    st.markdown(f"[📄 API Documentation]({API_BASE}/api-docs)")
-    st.markdown(f"[❤️ Health Check]({API_BASE}/health)")
-    st.markdown("[📊 Swagger UI]({}/api-docs)".format(API_BASE))
+    st.markdown(f"[📄 API Documentation]({client.api_base()}/api-docs)")
+    st.markdown(f"[❤️ Health Check]({client.api_base()}/health)")
+    st.markdown("[📊 Swagger UI]({}/api-docs)".format(client.api_base()))
     
     st.divider()
     
@@ -451,22 +166,23 @@ st.markdown('<p class="sub-header">Enterprise-Grade AI Receptionist for Dental C
 # KEY METRICS ROW
 # ============================================================================
 
-stats = get_dashboard_stats(selected_clinic_id)
-call_data = generate_call_data()
-patient_data = generate_patient_data()
+kpi = kpis.compute_kpis(client.fetch_appointments(selected_clinic_id), client.fetch_calls(selected_clinic_id))
+demo_day = datetime.now().date()
+call_data = demo_call_data(demo_day)
+patient_data = demo_patient_data(demo_day)
 
 col1, col2, col3, col4, col5, col6 = st.columns(6)
 
-metrics = [
-    ("📞", "Total Calls", f"{call_data['total_calls'].sum():,}", "+12% vs last month", col1),
-    ("📅", "Appointments", f"{stats.get('appointments', {}).get('total', 50)}", "+8% vs last month", col2),
-    ("✅", "Booking Rate", "76%", "+5% vs last month", col3),
-    ("💰", "Revenue", "$158,000", "+15% vs last month", col4),
+metric_cards = [
+    ("📞", "Total Calls", f"{kpi['calls']:,}", "+12% vs last month", col1),
+    ("📅", "Appointments", f"{kpi['booked']}", "+8% vs last month", col2),
+    ("✅", "Booking Rate", f"{kpi['booking_rate']:.0f}%", "+5% vs last month", col3),
+    ("💰", "Revenue", f"${kpi['revenue']:,}", "+15% vs last month", col4),
     ("👥", "New Patients", f"{patient_data['new_this_month']}", "+22% vs last month", col5),
     ("⚡", "Avg Response", "0.8s", "-0.2s vs last month", col6),
 ]
 
-for icon, label, value, delta, col in metrics:
+for icon, label, value, delta, col in metric_cards:
     with col:
         st.markdown(f"""
         <div class="metric-card">
@@ -496,7 +212,7 @@ tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
 # TAB 1: AI AGENTS
 # ============================================================================
 
-with tab1:
+with tab1, profiler.span("tab: AI Agents"):
     st.markdown('<h2 class="section-header">🤖 The Dentra Crew™ - Multi-Agent Architecture</h2>', unsafe_allow_html=True)
     
     # Architecture diagram
@@ -583,14 +299,14 @@ with tab1:
 # TAB 2: ANALYTICS
 # ============================================================================
 
-with tab2:
+with tab2, profiler.span("tab: Analytics"):
     st.markdown('<h2 class="section-header">📊 Real-Time Analytics Dashboard</h2>', unsafe_allow_html=True)
     
     # Call volume chart
     col1, col2 = st.columns(2)
     
     with col1:
-        call_data = generate_call_data()
+        call_data = demo_call_data(demo_day)
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=call_data['date'], y=call_data['total_calls'],
@@ -613,7 +329,7 @@ with tab2:
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        revenue_data = generate_revenue_data()
+        revenue_data = demo_revenue_data(demo_day)
         fig = px.bar(
             revenue_data, x='service', y='revenue',
             color='revenue',
@@ -634,7 +350,7 @@ with tab2:
     
     with col1:
         # Call distribution by hour
-        hourly = generate_hourly_calls()
+        hourly = demo_hourly_calls(demo_day)
         fig = go.Figure(data=[go.Bar(
             x=hourly['hour'], y=hourly['calls'],
             marker=dict(
@@ -695,7 +411,7 @@ with tab2:
 # TAB 3: LIVE DEMO
 # ============================================================================
 
-with tab3:
+with tab3, profiler.span("tab: Live Demo"):
     st.markdown('<h2 class="section-header">📞 Live Conversation Demo</h2>', unsafe_allow_html=True)
     
     st.markdown("""
@@ -734,31 +450,22 @@ with tab3:
         ("ai", "🦷 DENTRA", "Thank you for calling, Sarah. We look forward to seeing you Tuesday! Have a wonderful day. 😊"),
     ]
     
-    # Display conversation with animation
+    bubbles = {
+        "ai": '<div class="chat-bubble-ai"><div class="chat-label">{speaker}</div><div>{message}</div></div>',
+        "user": '<div class="chat-bubble-user"><div class="chat-label">{speaker}</div><div>{message}</div></div>',
+    }
+    
+    # Display conversation with animation (played back in the browser, no sleeps)
     if st.button("▶️ Play Conversation Demo", type="primary"):
-        chat_container = st.container()
-        with chat_container:
-            for role, speaker, message in conversation:
-                bubble_class = "chat-bubble-ai" if role == "ai" else "chat-bubble-user"
-                st.markdown(f"""
-                <div class="{bubble_class}">
-                    <div class="chat-label">{speaker}</div>
-                    <div>{message}</div>
-                </div>
-                """, unsafe_allow_html=True)
-                time.sleep(0.5)
-        
-        st.success("✅ Appointment booked successfully! Insurance captured: Delta Dental (DLT98765432)")
+        st.session_state.conversation_play = st.session_state.get("conversation_play", 0) + 1
+        st.markdown(replay.render(
+            conversation, bubbles, interval=0.5,
+            done="✅ Appointment booked successfully! Insurance captured: Delta Dental (DLT98765432)",
+            play=st.session_state.conversation_play
+        ), unsafe_allow_html=True)
     else:
         # Show static conversation
-        for role, speaker, message in conversation[:6]:
-            bubble_class = "chat-bubble-ai" if role == "ai" else "chat-bubble-user"
-            st.markdown(f"""
-            <div class="{bubble_class}">
-                <div class="chat-label">{speaker}</div>
-                <div>{message}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(replay.render(conversation[:6], bubbles, interval=None), unsafe_allow_html=True)
         
         st.info("👆 Click 'Play Conversation Demo' to see the full conversation flow")
 
@@ -766,7 +473,7 @@ with tab3:
 # TAB 4: APPOINTMENTS
 # ============================================================================
 
-with tab4:
+with tab4, profiler.span("tab: Appointments"):
     st.markdown('<h2 class="section-header">📅 Appointment Management</h2>', unsafe_allow_html=True)
     
     # Status filters
@@ -777,18 +484,18 @@ with tab4:
         date_filter = st.date_input("Filter by Date", value=None)
     
     # Appointments table
-    appointments = get_appointments(selected_clinic_id, limit=20)
+    appointments = client.fetch_appointments(selected_clinic_id, limit=20)
     
     if appointments:
-        df = pd.DataFrame(appointments)
+        df = kpis.appointments_frame(appointments)
         
         # Process data
         display_df = pd.DataFrame({
-            'Patient': df.apply(lambda x: x["patient"]["name"] if x.get("patient") else "🟢 Available", axis=1),
-            'Clinic': df.apply(lambda x: x["clinic"]["name"] if x.get("clinic") else "-", axis=1),
+            'Patient': df['patient_name'].where(df['booked'], "🟢 Available").fillna("🟢 Available"),
+            'Clinic': df['clinic_name'].fillna("-"),
             'Service': df['service_type'],
-            'Date': pd.to_datetime(df['appointment_date']).dt.strftime('%b %d, %Y'),
-            'Time': df.get('start_time', '09:00'),
+            'Date': df['appointment_date'].dt.strftime('%b %d, %Y'),
+            'Time': df['start_time'].fillna('09:00'),
             'Status': df['status'].str.upper()
         })
         
@@ -829,7 +536,7 @@ with tab4:
 # TAB 5: ML PREDICTIONS
 # ============================================================================
 
-with tab5:
+with tab5, profiler.span("tab: ML Predictions"):
     st.markdown('<h2 class="section-header">🎯 ML-Powered Predictions</h2>', unsafe_allow_html=True)
     
     st.markdown("""
@@ -955,7 +662,7 @@ with tab5:
 # TAB 6: FEATURES
 # ============================================================================
 
-with tab6:
+with tab6, profiler.span("tab: Features"):
     st.markdown('<h2 class="section-header">ℹ️ Complete Feature Overview</h2>', unsafe_allow_html=True)
     
     # Feature grid
@@ -1039,10 +746,12 @@ st.markdown(f"""
         DENTRA AI Voice Agent | Enterprise Demo Dashboard
     </div>
     <div style="color: #64748b; font-size: 0.8rem; margin-top: 8px;">
-        Backend: {API_BASE} | Built with OpenAI Agents SDK + Streamlit
+        Backend: {client.api_base()} | Built with OpenAI Agents SDK + Streamlit
     </div>
     <div style="color: #475569; font-size: 0.75rem; margin-top: 8px;">
         © 2026 DENTRA. All rights reserved.
     </div>
 </div>
 """, unsafe_allow_html=True)
+
+profiler.finish()
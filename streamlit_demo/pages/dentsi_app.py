@@ -0,0 +1,1018 @@
+"""
+AMPLIT AI - Autonomous Agentic Dental Assistant
+Premium Enterprise Dashboard - Production Ready
+
+Features:
+- Beautiful, accessible UI with proper contrast
+- Real-time data from backend API
+- Browser-based voice demo
+- Phone call integration via Twilio
+- Doctor scheduling & revenue analytics
+
+Page of the multipage app: streamlit run streamlit_app.py
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+import calendar
+
+import calendar_view
+import kpis
+import metrics
+import profiler
+import rollups
+import schedule
+import sized_cache
+import tracing
+from dentsi_dashboard import cache, client, models, renderers, templates
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TWILIO_NUMBER = "+1 (920) 891-4513"
+TWILIO_NUMBER_RAW = "+19208914513"
+
+st.set_page_config(
+    page_title="AMPLIT AI - Where Every Call Leads to a Smile",
+    page_icon="✨",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# ============================================================================
+# SESSION STATE
+# ============================================================================
+
+if 'selected_clinic_id' not in st.session_state:
+    st.session_state.selected_clinic_id = None
+if 'selected_clinic_name' not in st.session_state:
+    st.session_state.selected_clinic_name = None
+
+# Per-rerun timings (sections, fetches, backend calls); shown with ?debug=1
+# and exported by the metrics sidecar (DENTSI_METRICS_PORT) and as traces
+# (DENTSI_TRACE_FILE / DENTSI_OTLP_ENDPOINT)
+profiler.begin("dentsi_app", profiler.history(st.session_state))
+metrics.start()
+tracing.start()
+
+# ============================================================================
+# PREMIUM CSS - High Contrast, Beautiful UI
+# ============================================================================
+
+renderers.inject_css("dentsi_app")
+
+# ============================================================================
+# SHARED DATA
+# ============================================================================
+
+PRICING = cache.get_pricing_engine()
+REVENUE_ROLLUP = cache.get_revenue_rollup()
+
+# Doctors from the backend, or the demo roster when it is unreachable
+admin_doctors = client.fetch_doctors()
+if admin_doctors is not None:
+    DOCTORS = [models.doctor_summary(d) for d in admin_doctors]
+else:
+    DOCTORS = models.FALLBACK_DOCTORS
+# Appointments carry only doctor_id; names are joined from the doctor records
+DOCTOR_NAMES = models.doctor_names(admin_doctors)
+
+# ============================================================================
+# SIDEBAR
+# ============================================================================
+
+with st.sidebar, profiler.span("sidebar"):
+    # Animated sidebar header - AMPLIT AI
+    st.markdown("""<div style="text-align: center; padding: 35px 15px;">
+<div style="font-size: 3.5rem; font-weight: 900; background: linear-gradient(135deg, #6C63FF, #22C55E, #FACC15, #FF6B6B, #6C63FF); background-size: 400% 400%; -webkit-background-clip: text; -webkit-text-fill-color: transparent; animation: gradient-shift 3s ease infinite; letter-spacing: -1px; margin-bottom: 12px;">AMPLIT AI</div>
+<div style="font-size: 1.25rem; font-weight: 700; background: linear-gradient(90deg, #22C55E, #6C63FF); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin-bottom: 10px;">AI That Amplifies Care</div>
+<div style="font-size: 1rem; line-height: 1.6; color: #9CA3AF; font-style: italic;">Where Every Patient Call<br>Leads to a Smile</div>
+<div style="margin-top: 22px; display: inline-flex; align-items: center; gap: 10px; background: rgba(34, 197, 94, 0.15); border: 1px solid rgba(34, 197, 94, 0.4); border-radius: 25px; padding: 10px 18px;">
+<span style="width: 10px; height: 10px; background: #22C55E; border-radius: 50%; animation: pulse 2s infinite;"></span>
+<span style="color: #22C55E; font-size: 1rem; font-weight: 700;">Always On</span>
+</div>
+</div>""", unsafe_allow_html=True)
+    
+    st.divider()
+    
+    # System status
+    health = client.fetch_health()
+    if health.get("status") == "ok":
+        st.markdown("""
+        <div style="background: rgba(34, 197, 94, 0.15); border: 1px solid #22C55E; border-radius: 10px; padding: 12px; text-align: center;">
+            <span style="color: #22C55E; font-weight: 700;">🤖 Autonomous Front Desk Live</span>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.warning("⚠️ Backend Offline")
+    
+    st.divider()
+    
+    # Hardcoded clinic - SmileCare Dental
+    clinics = client.fetch_clinics()
+    selected_clinic_name = "SmileCare Dental"
+    selected_clinic_id = "ea239f20-2e76-4192-82bb-3ac9e7df4236"  # SmileCare Dental ID
+    
+    # Find SmileCare Dental ID from clinics list (fallback verification)
+    for c in clinics:
+        if c.get("name") == "SmileCare Dental":
+            selected_clinic_id = c.get("id")
+            break
+    
+    # Set SmileCare Dental as active clinic on backend
+    client.set_active_clinic(selected_clinic_id)
+    
+    st.markdown("""
+    <div style="font-size: 1.3rem; font-weight: 800; color: #E5E7EB; margin-bottom: 16px;">
+        📞 Patient Line
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, #6C63FF, #22C55E);
+                color: white; padding: 22px; border-radius: 16px;
+                text-align: center; font-size: 1.5rem; font-weight: 800;
+                box-shadow: 0 8px 24px rgba(108, 99, 255, 0.3);">
+        {TWILIO_NUMBER}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Show active clinic
+    st.markdown(f"""
+    <div style="background: rgba(108, 99, 255, 0.15); border: 1px solid rgba(108, 99, 255, 0.4); 
+                border-radius: 12px; padding: 16px; margin-top: 12px; text-align: center;">
+        <span style="color: #9CA3AF; font-size: 1rem; display: block; margin-bottom: 8px;">Active Clinic:</span>
+        <span style="color: #6C63FF; font-weight: 800; font-size: 1.15rem;">{selected_clinic_name}</span>
+        <div style="margin-top: 10px; padding-top: 10px; border-top: 1px solid rgba(108, 99, 255, 0.3);">
+            <span style="color: #22C55E; font-size: 0.85rem;">✓ All bookings go to this clinic</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="font-size: 1.2rem; font-weight: 700; color: #E5E7EB; margin-bottom: 12px;">⚙️ How It Works</div>
+    <div style="color: #9CA3AF; font-size: 0.95rem; line-height: 1.6;">
+        1. Call the patient line above<br>
+        2. Dentsi AI answers 24/7<br>
+        3. Appointments booked automatically
+    </div>
+    """, unsafe_allow_html=True)
+    
+
+# ============================================================================
+# MAIN CONTENT
+# ============================================================================
+
+st.markdown('<h1 class="main-title">AMPLIT AI</h1>', unsafe_allow_html=True)
+st.markdown("""
+<p style="text-align: center; font-size: 1.6rem; max-width: 750px; margin-left: auto; margin-right: auto; line-height: 1.6; margin-bottom: 12px;
+   background: linear-gradient(135deg, #6C63FF, #22C55E, #FACC15, #FF6B6B, #6C63FF); background-size: 400% 400%;
+   -webkit-background-clip: text; -webkit-text-fill-color: transparent; animation: gradient-shift 3s ease infinite; font-weight: 700;">
+AI That Amplifies Care
+</p>
+<p style="text-align: center; font-size: 1.15rem; color: #9CA3AF; font-style: italic; margin-bottom: 30px;">
+Where Every Patient Call Leads to a Smile
+</p>
+""", unsafe_allow_html=True)
+
+st.markdown("""
+<div style="display: flex; justify-content: center; gap: 24px; margin-bottom: 35px; flex-wrap: wrap;">
+    <div class="feature-badge primary" style="animation-delay: 0s;">
+        <span style="width: 10px; height: 10px; background: #22C55E; border-radius: 50%; animation: pulse 2s infinite;"></span>
+        <span style="color: #22C55E;">24/7 Call & Text Answering</span>
+    </div>
+    <div class="feature-badge" style="animation-delay: 0.1s;">
+        <span class="icon">🎯</span> <span>Zero Missed Calls</span>
+    </div>
+    <div class="feature-badge" style="animation-delay: 0.2s;">
+        <span class="icon">📅</span> <span>Smart Appointment Scheduling</span>
+    </div>
+    <div class="feature-badge" style="animation-delay: 0.3s;">
+        <span class="icon">💰</span> <span>Turn No-Shows into Revenue</span>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+
+# ============================================================================
+# METRICS ROW
+# ============================================================================
+
+with profiler.span("metrics row"):
+    appointments = client.fetch_appointments(selected_clinic_id, limit=200)
+    calls = client.fetch_calls(selected_clinic_id)
+
+    # Calculate metrics (one vectorized pass, memoized on data version)
+    kpi = kpis.compute_kpis(appointments, calls, PRICING)
+    apt_df = kpis.appointments_frame(appointments, PRICING)
+    total_revenue = kpi["revenue"]
+    call_count = kpi["calls"] if calls else 15
+
+    metrics_data = [
+        ("📞", str(call_count), "Calls Today"),
+        ("📅", str(kpi["booked"]), "Appointments"),
+        ("✅", f"{kpi['booking_rate']:.0f}%", "Booking Rate"),
+        ("💰", f"${total_revenue:,}", "Revenue"),
+        ("🏥", str(len(clinics)), "Clinics"),
+        ("⚡", "0.8s", "Avg Response"),
+    ]
+
+    st.markdown(templates.grid([f"""
+        <div class="metric-card">
+            <div class="metric-icon">{icon}</div>
+            <div class="metric-value">{value}</div>
+            <div class="metric-label">{label}</div>
+        </div>
+        """ for icon, value, label in metrics_data], columns=6), unsafe_allow_html=True)
+
+st.markdown("<br>", unsafe_allow_html=True)
+
+# ============================================================================
+# TABS
+# ============================================================================
+
+tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
+    "📅 Appointments",
+    "📆 Calendar",
+    "👥 Patients",
+    "💬 Conversations",
+    "👨‍⚕️ Doctors",
+    "💰 Revenue",
+    "📊 Analytics",
+    "🚨 Escalations"
+])
+
+# ============================================================================
+# TAB 1: APPOINTMENTS
+# ============================================================================
+
+with tab1, profiler.span("tab: Appointments"):
+    st.markdown('<div class="section-header">📅 Scheduled Appointments</div>', unsafe_allow_html=True)
+    
+    if kpi["booked"]:
+        # Summary Cards at Top
+        booked_df = apt_df[apt_df["booked"]]
+        apt_data = pd.DataFrame({
+            "patient_name": booked_df["patient_name"].fillna("Unknown"),
+            "phone": booked_df["patient_phone"].fillna("-"),
+            "service": booked_df["service_type"].fillna("Consultation"),
+            "date": booked_df["date"].fillna("-"),
+            "status": booked_df["status"].str.upper(),
+            "clinic": booked_df["clinic_name"].fillna("-"),
+            "price": booked_df["price"],
+        }).to_dict("records")
+        
+        scheduled_count = kpi["scheduled"]
+        completed_count = kpi["completed"]
+        avg_revenue = kpi["avg_ticket"]
+        
+        # Premium Summary Cards
+        st.markdown("""
+        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin-bottom: 30px;">
+            <div style="background: linear-gradient(135deg, rgba(139, 92, 246, 0.3), rgba(139, 92, 246, 0.1)); border: 2px solid rgba(139, 92, 246, 0.5); border-radius: 16px; padding: 24px; text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: 800; color: #a78bfa;">""" + str(kpi["booked"]) + """</div>
+                <div style="color: #e2e8f0; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px; margin-top: 8px;">Total Appointments</div>
+            </div>
+            <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.3), rgba(16, 185, 129, 0.1)); border: 2px solid rgba(16, 185, 129, 0.5); border-radius: 16px; padding: 24px; text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: 800; color: #34d399;">""" + str(scheduled_count) + """</div>
+                <div style="color: #e2e8f0; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px; margin-top: 8px;">Scheduled</div>
+            </div>
+            <div style="background: linear-gradient(135deg, rgba(6, 182, 212, 0.3), rgba(6, 182, 212, 0.1)); border: 2px solid rgba(6, 182, 212, 0.5); border-radius: 16px; padding: 24px; text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: 800; color: #22d3ee;">$""" + f"{total_revenue:,}" + """</div>
+                <div style="color: #e2e8f0; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px; margin-top: 8px;">Total Revenue</div>
+            </div>
+            <div style="background: linear-gradient(135deg, rgba(244, 63, 94, 0.3), rgba(244, 63, 94, 0.1)); border: 2px solid rgba(244, 63, 94, 0.5); border-radius: 16px; padding: 24px; text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: 800; color: #fb7185;">$""" + str(avg_revenue) + """</div>
+                <div style="color: #e2e8f0; font-size: 0.9rem; text-transform: uppercase; letter-spacing: 1px; margin-top: 8px;">Avg / Visit</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Appointment Cards Grid
+        st.markdown('<div style="color: #e2e8f0; font-size: 1.1rem; font-weight: 600; margin-bottom: 16px;">📋 Upcoming Appointments</div>', unsafe_allow_html=True)
+        
+        # All cards as one grid element
+        st.markdown(templates.grid(templates.appointment_card(apt) for apt in apt_data[:12]), unsafe_allow_html=True)
+        
+        # Show more in table if many appointments
+        if len(apt_data) > 12:
+            st.markdown("<br>", unsafe_allow_html=True)
+            with st.expander(f"📊 View All {len(apt_data)} Appointments in Table"):
+                df = pd.DataFrame([{
+                    "Patient": a["patient_name"],
+                    "Phone": a["phone"],
+                    "Service": a["service"],
+                    "Date": a["date"],
+                    "Status": a["status"],
+                    "Clinic": a["clinic"],
+                    "Revenue": f"${a['price']}"
+                } for a in apt_data])
+                st.dataframe(df, use_container_width=True, hide_index=True)
+    else:
+        st.markdown("""
+        <div style="background: rgba(30, 41, 59, 0.8); border: 2px dashed rgba(139, 92, 246, 0.4); border-radius: 16px; padding: 60px 40px; text-align: center; margin: 20px 0;">
+            <div style="font-size: 4rem; margin-bottom: 20px;">📅</div>
+            <div style="font-size: 1.5rem; font-weight: 700; color: #e2e8f0; margin-bottom: 10px;">No Appointments Yet</div>
+            <div style="color: #94a3b8; font-size: 1.1rem;">Make a test call to <span style="color: #8b5cf6; font-weight: 600;">+1 (920) 891-4513</span> to see appointments here!</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+# ============================================================================
+# TAB 2: CALENDAR VIEW
+# ============================================================================
+
+with tab2, profiler.span("tab: Calendar"):
+    st.markdown('<div class="section-header">📆 Appointment Calendar</div>', unsafe_allow_html=True)
+    
+    # Revenue per chair summary
+    num_chairs = 5
+    chair_revenue = total_revenue // num_chairs if total_revenue > 0 else 0
+    week_start, week_end = calendar_view.week_bounds()
+    week_count = len(client.fetch_appointments_between(selected_clinic_id, week_start, week_end) or [])
+    
+    st.markdown(templates.grid([
+        f"""
+        <div style="background: linear-gradient(135deg, #6C63FF, #8B7FFF); border-radius: 16px; padding: 20px; text-align: center;">
+            <div style="font-size: 2rem; font-weight: 900; color: white;">{week_count}</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.9rem;">This Week</div>
+        </div>
+        """,
+        f"""
+        <div style="background: linear-gradient(135deg, #22C55E, #16A34A); border-radius: 16px; padding: 20px; text-align: center;">
+            <div style="font-size: 2rem; font-weight: 900; color: white;">${total_revenue:,}</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.9rem;">Total Revenue</div>
+        </div>
+        """,
+        f"""
+        <div style="background: linear-gradient(135deg, #FACC15, #EAB308); border-radius: 16px; padding: 20px; text-align: center;">
+            <div style="font-size: 2rem; font-weight: 900; color: #0B1220;">${chair_revenue:,}</div>
+            <div style="color: rgba(11,18,32,0.8); font-size: 0.9rem;">Per Chair</div>
+        </div>
+        """,
+        f"""
+        <div style="background: linear-gradient(135deg, #06B6D4, #0891B2); border-radius: 16px; padding: 20px; text-align: center;">
+            <div style="font-size: 2rem; font-weight: 900; color: white;">{num_chairs}</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.9rem;">Active Chairs</div>
+        </div>
+        """,
+    ], columns=4), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Build calendar
+    today = datetime.now().date()
+    if 'calendar_month' not in st.session_state:
+        st.session_state.calendar_month = (today.year, today.month)
+    
+    calendar_mode = st.radio("View", ["Month", "Week", "Day", "Agenda"], horizontal=True, key="calendar_mode")
+    
+    if calendar_mode == "Month":
+        nav1, nav2, nav3, nav4 = st.columns([1, 1, 1, 5])
+        with nav1:
+            if st.button("◀ Prev", key="calendar_prev", use_container_width=True):
+                st.session_state.calendar_month = calendar_view.shift_month(*st.session_state.calendar_month, -1)
+        with nav2:
+            if st.button("Today", key="calendar_today", use_container_width=True):
+                st.session_state.calendar_month = (today.year, today.month)
+        with nav3:
+            if st.button("Next ▶", key="calendar_next", use_container_width=True):
+                st.session_state.calendar_month = calendar_view.shift_month(*st.session_state.calendar_month, 1)
+        current_year, current_month = st.session_state.calendar_month
+        
+        # Calendar header
+        st.markdown(f"### {calendar.month_name[current_month]} {current_year}")
+        
+        # Only the month on screen is fetched and indexed
+        month_rows = client.fetch_appointments_between(
+            selected_clinic_id, *calendar_view.month_bounds(current_year, current_month)
+        )
+        if month_rows is None:
+            st.warning("Could not load this month's appointments from the API.")
+        month_version = kpis.data_version(month_rows)
+        month_index = cache.get_date_index(selected_clinic_id, month_version, month_rows or [])
+
+        def load_month(year, month, clinic_id=selected_clinic_id):
+            rows = client.fetch_appointments_between(clinic_id, *calendar_view.month_bounds(year, month)) or []
+            return calendar_view.DateIndex(rows, PRICING), kpis.data_version(rows)
+
+        # Whole month grid as one cached element; neighbours load and render in the background
+        with profiler.span("calendar html"):
+            renderer = cache.get_calendar_renderer()
+            st.markdown(
+                renderer.render(month_index, selected_clinic_id, month_version, current_year, current_month, today),
+                unsafe_allow_html=True
+            )
+            renderer.prefetch(load_month, selected_clinic_id, current_year, current_month, today)
+    
+    else:
+        # Keyed by id: names need not be unique (or known)
+        doctor_options = {None: "All Doctors"}
+        for doctor_id, name in sorted(DOCTOR_NAMES.items(), key=lambda d: d[1]):
+            doctor_options[doctor_id] = name
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_day = st.date_input("Date", value=today, key="calendar_day")
+        with col2:
+            selected_doctor = st.selectbox("Doctor", list(doctor_options), format_func=doctor_options.get,
+                                           key="calendar_doctor")
+        
+        # Fetch and index just the days this view shows
+        if calendar_mode == "Week":
+            range_start, range_end = calendar_view.week_bounds(selected_day)
+        elif calendar_mode == "Day":
+            range_start, range_end = selected_day, selected_day
+        else:
+            range_start, range_end = selected_day, selected_day + timedelta(days=13)
+        range_rows = client.fetch_appointments_between(selected_clinic_id, range_start, range_end)
+        if range_rows is None:
+            st.warning("Could not load these appointments from the API.")
+        SCHEDULE = cache.get_schedule_index(
+            selected_clinic_id, kpis.data_version(range_rows), kpis.data_version(admin_doctors),
+            range_rows or [], DOCTOR_NAMES
+        )
+        
+        if calendar_mode == "Week":
+            week = SCHEDULE.week(selected_day, selected_clinic_id, selected_doctor)
+            first, last = min(week), max(week)
+            st.markdown(f"### Week of {first:%b %d} - {last:%b %d, %Y}")
+            with profiler.span("calendar html"):
+                st.markdown(calendar_view.render_week(week, today), unsafe_allow_html=True)
+        elif calendar_mode == "Day":
+            st.markdown(f"### {selected_day:%A, %B %d, %Y}")
+            day_apts = SCHEDULE.day(selected_day, selected_clinic_id, selected_doctor)
+            with profiler.span("calendar html"):
+                st.markdown(calendar_view.render_day(day_apts), unsafe_allow_html=True)
+        else:
+            st.markdown(f"### Next 14 Days from {selected_day:%b %d}")
+            agenda = SCHEDULE.agenda(selected_day, 14, selected_clinic_id, selected_doctor)
+            agenda_rows = [{
+                "Date": day.strftime("%a %b %d"),
+                "Time": f'{apt["start"]:%H:%M} - {apt["end"]:%H:%M}',
+                "Patient": apt["patient"],
+                "Service": apt["service"],
+                "Doctor": apt["doctor"],
+                "Status": apt["status"].upper()
+            } for day, apts in agenda.items() for apt in apts]
+            if agenda_rows:
+                st.dataframe(pd.DataFrame(agenda_rows), use_container_width=True, hide_index=True)
+            else:
+                st.info("No appointments in the next 14 days.")
+        
+        # Availability check against the doctor's booked intervals
+        with st.expander("🔎 Check Availability"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                check_time = st.time_input("Start time", value=schedule.DEFAULT_START, step=900, key="check_time")
+            with col2:
+                check_duration = st.selectbox("Duration (min)", [30, 45, 60, 90, 120], index=2, key="check_duration")
+            with col3:
+                check_doctor = st.selectbox("Doctor", list(doctor_options)[1:] or [None], format_func=doctor_options.get,
+                                            key="check_doctor")
+            check_start = datetime.combine(selected_day, check_time)
+            clashes = SCHEDULE.overlapping(
+                check_start, check_start + timedelta(minutes=check_duration), selected_clinic_id, check_doctor
+            )
+            if clashes:
+                st.error(f"❌ {len(clashes)} conflicting appointment(s): " + ", ".join(
+                    f'{c["start"]:%H:%M}-{c["end"]:%H:%M} {c["patient"]} ({c["doctor"]})' for c in clashes
+                ))
+            else:
+                st.success(f"✅ Free {check_start:%a %b %d %H:%M} for {check_duration} minutes")
+    
+    # Legend
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("""
+    <div style="display: flex; gap: 20px; flex-wrap: wrap; justify-content: center;">
+        <div style="display: flex; align-items: center; gap: 6px;"><div style="width: 12px; height: 12px; background: #22C55E; border-radius: 3px;"></div><span style="color: #9CA3AF; font-size: 0.85rem;">Cleaning</span></div>
+        <div style="display: flex; align-items: center; gap: 6px;"><div style="width: 12px; height: 12px; background: #FACC15; border-radius: 3px;"></div><span style="color: #9CA3AF; font-size: 0.85rem;">Crown</span></div>
+        <div style="display: flex; align-items: center; gap: 6px;"><div style="width: 12px; height: 12px; background: #EF4444; border-radius: 3px;"></div><span style="color: #9CA3AF; font-size: 0.85rem;">Extraction</span></div>
+        <div style="display: flex; align-items: center; gap: 6px;"><div style="width: 12px; height: 12px; background: #06B6D4; border-radius: 3px;"></div><span style="color: #9CA3AF; font-size: 0.85rem;">Whitening</span></div>
+        <div style="display: flex; align-items: center; gap: 6px;"><div style="width: 12px; height: 12px; background: #F59E0B; border-radius: 3px;"></div><span style="color: #9CA3AF; font-size: 0.85rem;">Root Canal</span></div>
+    </div>
+    """, unsafe_allow_html=True)
+
+# ============================================================================
+# TAB 3: PATIENTS
+# ============================================================================
+
+with tab3, profiler.span("tab: Patients"):
+    st.markdown('<div class="section-header">👥 Patient Profiles</div>', unsafe_allow_html=True)
+    
+    patients_list = client.fetch_patients()
+    
+    if patients_list:
+        # Search filter
+        search_term = st.text_input("🔍 Search patients by name or phone", "", key="patient_search")
+        
+        filtered_patients = patients_list
+        if search_term:
+            filtered_patients = [p for p in patients_list if 
+                search_term.lower() in p.get("name", "").lower() or 
+                search_term in p.get("phone", "")]
+        
+        # Summary stats
+        total_ltv = sum(len(p.get('appointments', [])) * 150 for p in filtered_patients)
+        st.markdown(f"""
+        <div style="display: flex; gap: 20px; margin-bottom: 24px; flex-wrap: wrap;">
+            <div style="background: rgba(139, 92, 246, 0.15); border: 1px solid rgba(139, 92, 246, 0.4); padding: 16px 24px; border-radius: 12px;">
+                <div style="font-size: 1.8rem; font-weight: 800; color: #a78bfa;">{len(filtered_patients)}</div>
+                <div style="color: #e2e8f0; font-size: 0.85rem;">Total Patients</div>
+            </div>
+            <div style="background: rgba(16, 185, 129, 0.15); border: 1px solid rgba(16, 185, 129, 0.4); padding: 16px 24px; border-radius: 12px;">
+                <div style="font-size: 1.8rem; font-weight: 800; color: #34d399;">${total_ltv:,}</div>
+                <div style="color: #e2e8f0; font-size: 0.85rem;">Total Lifetime Value</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Patient cards in grid
+        with profiler.span("patient cards"):
+            st.markdown(templates.grid(templates.patient_record_card(p) for p in filtered_patients[:12]),
+                        unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div style="background: rgba(30, 41, 59, 0.8); border: 2px dashed rgba(139, 92, 246, 0.4); border-radius: 16px; padding: 60px 40px; text-align: center;">
+            <div style="font-size: 4rem; margin-bottom: 20px;">👥</div>
+            <div style="font-size: 1.5rem; font-weight: 700; color: #ffffff; margin-bottom: 10px;">No Patients Yet</div>
+            <div style="color: #94a3b8; font-size: 1.1rem;">Patients are created when they call and book appointments</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Sample patient cards
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown('<div style="color: #ffffff; font-size: 1.1rem; font-weight: 600; margin-bottom: 16px;">📋 Sample Patient Cards</div>', unsafe_allow_html=True)
+        
+        samples = [
+            {"name": "John Smith", "phone": "+1 (555) 123-4567", "email": "john@email.com", "insurance": "Delta Dental", "ltv": 1850, "visits": 12},
+            {"name": "Sarah Johnson", "phone": "+1 (555) 987-6543", "email": "sarah@email.com", "insurance": "Cigna", "ltv": 920, "visits": 6},
+            {"name": "Mike Brown", "phone": "+1 (555) 456-7890", "email": "mike@email.com", "insurance": "Aetna", "ltv": 450, "visits": 3},
+        ]
+        st.markdown(templates.grid(templates.patient_card(**s) for s in samples), unsafe_allow_html=True)
+        
+# ============================================================================
+# TAB 4: CONVERSATIONS
+# ============================================================================
+
+with tab4, profiler.span("tab: Conversations"):
+    st.markdown('<div class="section-header">💬 Conversation Summaries</div>', unsafe_allow_html=True)
+    
+    # Call logs (shared with the Escalations tab)
+    call_store = client.fetch_call_store()
+    calls_list = call_store["calls"]
+    
+    if calls_list:
+        # Summary tiles
+        call_kpi = kpis.compute_kpis(calls=calls_list)
+        booked_calls = call_kpi["booked_calls"]
+        escalated_calls = call_kpi["escalated_calls"]
+        avg_sentiment = call_kpi["avg_sentiment"]
+        avg_duration = call_kpi["avg_duration"]
+        
+        st.markdown(templates.grid([
+            f"""
+            <div style="background: rgba(108, 99, 255, 0.15); border: 1px solid rgba(108, 99, 255, 0.4); border-radius: 12px; padding: 18px; text-align: center;">
+                <div style="font-size: 2rem; font-weight: 900; color: #6C63FF;">{len(calls_list)}</div>
+                <div style="color: #E5E7EB; font-size: 0.85rem; margin-top: 4px;">Total Calls</div>
+            </div>
+            """,
+            f"""
+            <div style="background: rgba(34, 197, 94, 0.15); border: 1px solid rgba(34, 197, 94, 0.4); border-radius: 12px; padding: 18px; text-align: center;">
+                <div style="font-size: 2rem; font-weight: 900; color: #22C55E;">{booked_calls}</div>
+                <div style="color: #E5E7EB; font-size: 0.85rem; margin-top: 4px;">Booked</div>
+            </div>
+            """,
+            f"""
+            <div style="background: rgba(245, 158, 11, 0.15); border: 1px solid rgba(245, 158, 11, 0.4); border-radius: 12px; padding: 18px; text-align: center;">
+                <div style="font-size: 2rem; font-weight: 900; color: #F59E0B;">{int(avg_sentiment * 100)}%</div>
+                <div style="color: #E5E7EB; font-size: 0.85rem; margin-top: 4px;">Avg Sentiment</div>
+            </div>
+            """,
+            f"""
+            <div style="background: rgba(6, 182, 212, 0.15); border: 1px solid rgba(6, 182, 212, 0.4); border-radius: 12px; padding: 18px; text-align: center;">
+                <div style="font-size: 2rem; font-weight: 900; color: #06B6D4;">{int(avg_duration)}s</div>
+                <div style="color: #E5E7EB; font-size: 0.85rem; margin-top: 4px;">Avg Duration</div>
+            </div>
+            """,
+        ], columns=4), unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Filter options
+        col1, col2 = st.columns(2)
+        with col1:
+            outcome_filter = st.selectbox("Filter by Outcome", 
+                ["All", "Booked", "Inquiry Answered", "Escalated", "Cancelled"])
+        with col2:
+            sort_by = st.selectbox("Sort by", list(models.CALL_ORDERS))
+        
+        # Filter calls
+        filtered_calls = calls_list
+        if outcome_filter != "All":
+            filtered_calls = call_store["by_outcome"].get(outcome_filter.lower().replace(" ", "_"), [])
+        
+        # One collapsible card per call, all in one element
+        st.markdown(templates.grid((templates.call_card(call) for call in models.top_calls(filtered_calls, sort_by, 15)), columns=1),
+                    unsafe_allow_html=True)
+    else:
+        st.info("No conversation logs yet. Make a test call to see summaries here!")
+        
+        # Demo conversation
+        st.markdown("### Sample Conversation Summary")
+        sample_call = {
+            "patient": {"name": "Sarah Johnson"}, "caller_phone": "+1 (555) 987-6543", "outcome": "booked",
+            "duration": 127, "sentiment_score": 0.85, "intent": "new_appointment",
+            "transcript": """Dentsi: Hello and welcome to SmileCare Dental! This is Dentsi, your AI assistant. How can I help you today?
+
+Patient: Hi, I'd like to schedule a teeth cleaning.
+
+Dentsi: Wonderful! I'd be happy to help you with that. Let me check our availability. Do you have a preferred day?
+
+Patient: Maybe next Tuesday?
+
+Dentsi: I have Tuesday, January 28th at 10am or 2pm available. Which works better for you?
+
+Patient: 2pm sounds good.
+
+Dentsi: Perfect! Before I confirm, do you have dental insurance?
+
+Patient: Yes, Delta Dental.
+
+Dentsi: Great! And your member ID?
+
+Patient: DD789456123
+
+Dentsi: Got it! You're all set for a cleaning on Tuesday, January 28th at 2pm. You'll receive a text confirmation. We're looking forward to seeing you!""",
+        }
+        st.markdown(templates.call_card(sample_call, expanded=True, transcript_limit=None, height=200,
+                                        note="Cleaning booked - Est. $120"), unsafe_allow_html=True)
+
+# ============================================================================
+# TAB 5: DOCTORS
+# ============================================================================
+
+with tab5, profiler.span("tab: Doctors"):
+    st.markdown('<div class="section-header">👨‍⚕️ Doctors & Availability</div>', unsafe_allow_html=True)
+    
+    # Doctor tiles, three to a row, as one element
+    st.markdown(templates.grid((templates.doctor_card(doc) for doc in DOCTORS), gap="2rem"), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown('<div class="section-header">📊 Performance by Doctor</div>', unsafe_allow_html=True)
+    
+    doc_df = pd.DataFrame(DOCTORS)
+    
+    col1, col2 = st.columns(2)
+    with col1, profiler.span("chart: appointments by doctor"):
+        fig = px.bar(doc_df, x="name", y="appointments", 
+                     title="Appointments Today",
+                     color="appointments",
+                     color_continuous_scale=["#8b5cf6", "#06b6d4"])
+        fig.update_layout(
+            template="plotly_dark", 
+            paper_bgcolor="rgba(0,0,0,0)", 
+            plot_bgcolor="rgba(0,0,0,0)", 
+            height=350,
+            showlegend=False,
+            xaxis_title="",
+            yaxis_title="Appointments"
+        )
+        fig.update_xaxes(tickangle=45)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2, profiler.span("chart: revenue by doctor"):
+        fig = px.bar(doc_df, x="name", y="revenue", 
+                     title="Revenue Today",
+                     color="revenue",
+                     color_continuous_scale=["#10b981", "#06b6d4"])
+        fig.update_layout(
+            template="plotly_dark", 
+            paper_bgcolor="rgba(0,0,0,0)", 
+            plot_bgcolor="rgba(0,0,0,0)", 
+            height=350,
+            showlegend=False,
+            xaxis_title="",
+            yaxis_title="Revenue ($)"
+        )
+        fig.update_xaxes(tickangle=45)
+        st.plotly_chart(fig, use_container_width=True)
+
+# ============================================================================
+# TAB 6: REVENUE
+# ============================================================================
+
+with tab6, profiler.span("tab: Revenue"):
+    st.markdown('<div class="section-header">💰 Revenue Analytics</div>', unsafe_allow_html=True)
+    
+    period_options = {"Today": 1, "Last 7 Days": 7, "Last 30 Days": 30, "Last 12 Months": 365}
+    period_label = st.radio("Period", list(period_options), index=1, horizontal=True, label_visibility="collapsed",
+                            key="revenue_period")
+    period_days = period_options[period_label]
+    start, end, prev_start, prev_end = rollups.period_bounds(period_days)
+    # A single day has no trend; the chart shows the week leading up to it instead
+    trend_start = start if period_days > 1 else prev_start - timedelta(days=5)
+    
+    # Feed the rollup every appointment in the window shown (this and the previous
+    # period), not the first page of the clinic's oldest appointments
+    window_start = min(prev_start, trend_start)
+    with profiler.span("revenue window"):
+        window = client.fetch_appointments_between(selected_clinic_id, window_start, end)
+        if window is not None:
+            REVENUE_ROLLUP.sync(window, selected_clinic_id, window_start, end)
+        else:
+            st.warning("Could not load every appointment in this period; figures may be incomplete.")
+    
+    period_revenue, total_patients = REVENUE_ROLLUP.totals(start, end, selected_clinic_id)
+    prev_revenue, _ = REVENUE_ROLLUP.totals(prev_start, prev_end, selected_clinic_id)
+    num_chairs = 5
+    revenue_per_chair = period_revenue // num_chairs
+    avg_per_patient = period_revenue // total_patients if total_patients else 0
+    if prev_revenue:
+        change = (period_revenue - prev_revenue) / prev_revenue * 100
+        change_text = f"{'↑' if change >= 0 else '↓'} {abs(change):.0f}% vs previous period"
+    else:
+        change_text = "No revenue in previous period"
+    
+    st.markdown(templates.grid([
+        f"""
+        <div class="revenue-box">
+            <div style="font-size: 1rem; opacity: 0.9;">Total Revenue ({period_label})</div>
+            <div style="font-size: 2.8rem; font-weight: 800; margin: 10px 0;">${period_revenue:,}</div>
+            <div style="font-size: 0.9rem;">{change_text}</div>
+        </div>
+        """,
+        f"""
+        <div class="revenue-box-purple">
+            <div style="font-size: 1rem; opacity: 0.9;">Revenue Per Chair</div>
+            <div style="font-size: 2.8rem; font-weight: 800; margin: 10px 0;">${revenue_per_chair:,}</div>
+            <div style="font-size: 0.9rem;">{num_chairs} chairs active</div>
+        </div>
+        """,
+        f"""
+        <div class="revenue-box-cyan">
+            <div style="font-size: 1rem; opacity: 0.9;">Avg Per Patient</div>
+            <div style="font-size: 2.8rem; font-weight: 800; margin: 10px 0;">${avg_per_patient:,}</div>
+            <div style="font-size: 0.9rem;">{total_patients} patients</div>
+        </div>
+        """,
+    ], columns=3), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1, profiler.span("chart: revenue by service"):
+        st.markdown("### Revenue by Service")
+        service_data = REVENUE_ROLLUP.by("service", start, end, selected_clinic_id)
+        if len(service_data):
+            fig = px.pie(service_data, values="revenue", names="service", hole=0.45,
+                         color_discrete_sequence=px.colors.sequential.Plasma)
+            fig.update_layout(template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", height=350)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No booked appointments in this period.")
+    
+    with col2, profiler.span("chart: daily revenue trend"):
+        st.markdown("### Daily Revenue Trend")
+        trend = REVENUE_ROLLUP.daily(trend_start, end, selected_clinic_id)
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=trend["Date"], y=trend["Revenue"],
+            fill='tozeroy', 
+            fillcolor='rgba(139, 92, 246, 0.3)',
+            line=dict(color='#8b5cf6', width=3),
+            mode='lines'
+        ))
+        fig.update_layout(
+            template="plotly_dark", 
+            paper_bgcolor="rgba(0,0,0,0)", 
+            plot_bgcolor="rgba(0,0,0,0)", 
+            height=350,
+            xaxis_title="Date",
+            yaxis_title="Revenue ($)"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("### Revenue by Doctor")
+    with profiler.span("chart: revenue by doctor (rollup)"):
+        doctor_data = REVENUE_ROLLUP.by("doctor", start, end, selected_clinic_id)
+        doctor_data["doctor"] = doctor_data["doctor"].map(lambda d: DOCTOR_NAMES.get(d, d))
+        if len(doctor_data):
+            fig = px.bar(doctor_data, x="doctor", y="revenue", text="appointments",
+                         color="revenue", color_continuous_scale="Plasma")
+            fig.update_layout(template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+                              height=320, xaxis_title="", yaxis_title="Revenue ($)", coloraxis_showscale=False)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No booked appointments in this period.")
+
+# ============================================================================
+# TAB 7: ANALYTICS
+# ============================================================================
+
+with tab7, profiler.span("tab: Analytics"):
+    st.markdown('<div class="section-header">📊 Call Analytics</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1, profiler.span("chart: call volume"):
+        st.markdown("### Call Volume (Last 7 Days)")
+        dates = pd.date_range(end=datetime.now(), periods=7, freq='D')
+        call_data = pd.DataFrame({
+            "Date": dates,
+            "Total Calls": [42, 38, 45, 52, 48, 35, 40],
+            "Booked": [28, 25, 32, 38, 35, 24, 30]
+        })
+        fig = go.Figure()
+        fig.add_trace(go.Bar(x=call_data["Date"], y=call_data["Total Calls"], 
+                             name="Total Calls", marker_color='#8b5cf6'))
+        fig.add_trace(go.Bar(x=call_data["Date"], y=call_data["Booked"], 
+                             name="Booked", marker_color='#06b6d4'))
+        fig.update_layout(
+            template="plotly_dark", 
+            paper_bgcolor="rgba(0,0,0,0)", 
+            plot_bgcolor="rgba(0,0,0,0)", 
+            height=350, 
+            barmode='group',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2, profiler.span("chart: call intents"):
+        st.markdown("### Call Intent Distribution")
+        intents = pd.DataFrame({
+            "Intent": ["New Booking", "Reschedule", "Inquiry", "Cancel", "Emergency"],
+            "Count": [180, 45, 60, 25, 15]
+        })
+        fig = px.pie(intents, values="Count", names="Intent", hole=0.45,
+                     color_discrete_sequence=["#8b5cf6", "#06b6d4", "#10b981", "#f59e0b", "#ef4444"])
+        fig.update_layout(template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", height=350)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("### Call Outcomes")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("✅ Booked", "212", "72%")
+    with col2:
+        st.metric("ℹ️ Info Only", "48", "16%")
+    with col3:
+        st.metric("🔄 Rescheduled", "25", "8%")
+    with col4:
+        st.metric("❌ Cancelled", "8", "3%")
+    with col5:
+        st.metric("🚨 Escalated", "4", "1%")
+
+# ============================================================================
+# TAB 8: ESCALATIONS
+# ============================================================================
+
+with tab8, profiler.span("tab: Escalations"):
+    st.markdown('<div class="section-header">🚨 Escalations & Alerts</div>', unsafe_allow_html=True)
+    
+    # Real escalations come from the call store loaded for Conversations
+    real_escalations = client.get_calls_with_outcome(client.fetch_call_store(), "escalated")
+    
+    # Summary tiles
+    high_count = 1
+    medium_count = 1
+    low_count = 1
+    
+    st.markdown(templates.grid([
+        f"""
+        <div style="background: rgba(239, 68, 68, 0.15); border: 2px solid #EF4444; border-radius: 12px; padding: 20px; text-align: center;">
+            <div style="font-size: 2.2rem; font-weight: 900; color: #EF4444;">{high_count}</div>
+            <div style="color: #E5E7EB; font-size: 0.9rem; margin-top: 4px;">🔴 High Priority</div>
+        </div>
+        """,
+        f"""
+        <div style="background: rgba(245, 158, 11, 0.15); border: 2px solid #F59E0B; border-radius: 12px; padding: 20px; text-align: center;">
+            <div style="font-size: 2.2rem; font-weight: 900; color: #F59E0B;">{medium_count}</div>
+            <div style="color: #E5E7EB; font-size: 0.9rem; margin-top: 4px;">🟡 Medium</div>
+        </div>
+        """,
+        f"""
+        <div style="background: rgba(108, 99, 255, 0.15); border: 2px solid #6C63FF; border-radius: 12px; padding: 20px; text-align: center;">
+            <div style="font-size: 2.2rem; font-weight: 900; color: #6C63FF;">{low_count}</div>
+            <div style="color: #E5E7EB; font-size: 0.9rem; margin-top: 4px;">🔵 Low</div>
+        </div>
+        """,
+        f"""
+        <div style="background: rgba(34, 197, 94, 0.15); border: 2px solid #22C55E; border-radius: 12px; padding: 20px; text-align: center;">
+            <div style="font-size: 2.2rem; font-weight: 900; color: #22C55E;">{len(real_escalations)}</div>
+            <div style="color: #E5E7EB; font-size: 0.9rem; margin-top: 4px;">📞 From Calls</div>
+        </div>
+        """,
+    ], columns=4), unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("""
+    <p style="color: #9CA3AF; margin-bottom: 20px;">
+    Cases requiring human attention - AI has flagged these for follow-up
+    </p>
+    """, unsafe_allow_html=True)
+    
+    # Demo escalations (would be replaced with real data when available)
+    escalations = [
+        {"id": 1, "patient": "Robert Taylor", "reason": "Billing question - needs payment plan discussion", "priority": "Medium", "time": "10 min ago", "phone": "+1 555-777-7777"},
+        {"id": 2, "patient": "Unknown Caller", "reason": "Complex insurance - needs manual verification", "priority": "Low", "time": "25 min ago", "phone": "+1 555-000-0000"},
+        {"id": 3, "patient": "Michael Brown", "reason": "EMERGENCY - Severe tooth pain, needs same-day appointment", "priority": "High", "time": "2 min ago", "phone": "+1 555-333-3333"},
+    ]
+    
+    st.markdown(templates.grid((templates.escalation_card(esc) for esc in escalations), columns=1, row_gap="8px"),
+                unsafe_allow_html=True)
+
+# ============================================================================
+# FOOTER
+# ============================================================================
+
+st.markdown("<br><br>", unsafe_allow_html=True)
+st.markdown(f"""
+<div style="text-align: center; padding: 40px 20px; border-top: 1px solid rgba(139, 92, 246, 0.3); background: linear-gradient(180deg, transparent, rgba(139, 92, 246, 0.05));">
+    <div style="font-size: 2.5rem; font-weight: 900; 
+                background: linear-gradient(135deg, #6C63FF, #22C55E, #FACC15, #FF6B6B, #6C63FF);
+                background-size: 400% 400%;
+                -webkit-background-clip: text; -webkit-text-fill-color: transparent;
+                animation: gradient-shift 3s ease infinite;
+                margin-bottom: 10px;">
+        AMPLIT AI
+    </div>
+    <div style="color: #a5b4fc; margin-top: 8px; font-style: italic; font-size: 1.1rem;">
+        AI That Amplifies Care — Where Every Patient Call Leads to a Smile
+    </div>
+    <div style="color: #64748b; font-size: 0.9rem; margin-top: 20px;">
+        📞 {TWILIO_NUMBER} &nbsp;•&nbsp; 
+        <a href="https://dentcognit.abacusai.app/api-docs" target="_blank" style="color: #8b5cf6;">API Docs</a>
+    </div>
+    <div style="color: #475569; font-size: 0.8rem; margin-top: 15px; display: flex; justify-content: center; gap: 20px; flex-wrap: wrap;">
+        <span style="display: flex; align-items: center; gap: 6px;">
+            <img src="https://www.elevenlabs.io/favicon.ico" width="14" style="border-radius: 3px;"> ElevenLabs
+        </span>
+        <span style="display: flex; align-items: center; gap: 6px;">
+            <span style="font-size: 0.9rem;">🤖</span> Claude Sonnet
+        </span>
+        <span style="display: flex; align-items: center; gap: 6px;">
+            <span style="font-size: 0.9rem;">📞</span> Twilio
+        </span>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+
+# ============================================================================
+# DEBUG PANEL (?debug=1) - rerun waterfall from the profiler
+# ============================================================================
+
+profiler.finish()
+
+if st.query_params.get("debug"):
+    with st.expander("🛠️ Rerun profile", expanded=True):
+        runs = list(profiler.history(st.session_state))
+        labels = [f"{datetime.fromtimestamp(r.wall).strftime('%H:%M:%S')} · {r.duration * 1000:.0f} ms" for r in runs]
+        picked = st.selectbox("Rerun", range(len(runs)), index=len(runs) - 1,
+                              format_func=lambda i: labels[i], key="profiler_pick")
+        run = runs[picked]
+
+        totals = profiler.summary(run)
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Rerun", f"{totals['duration_ms']:.0f} ms")
+        m2.metric("Fetchers", f"{totals['fetch_ms']:.0f} ms")
+        m3.metric("Backend", f"{totals['upstream_ms']:.0f} ms")
+        m4.metric("Cache hit / miss", f"{totals['cache_hits']} / {totals['cache_misses']}")
+        fetch_cache = sized_cache.stats()
+        st.caption(
+            f"Fetch cache ({fetch_cache['policy'].upper()}): {fetch_cache['bytes'] / 2 ** 20:.1f} of "
+            f"{fetch_cache['budget_bytes'] / 2 ** 20:.0f} MB ({fetch_cache['occupancy']:.0%}), "
+            f"{fetch_cache['entries']} entries, {fetch_cache['evictions']} evictions"
+        )
+
+        rows = profiler.waterfall(run)
+        if rows:
+            span_df = pd.DataFrame(rows)
+            span_df["label"] = ["  " * d + n for d, n in zip(span_df["depth"], span_df["name"])]
+            colors = {"section": "#8b5cf6", "fetch": "#00d4ff", "upstream": "#f59e0b"}
+            fig = go.Figure()
+            for kind, group in span_df.groupby("kind", sort=False):
+                fig.add_trace(go.Bar(
+                    y=group.index, x=group["duration_ms"], base=group["start_ms"], orientation="h",
+                    name=kind, marker_color=colors.get(kind, "#64748b"),
+                    hovertext=group["name"], hovertemplate="%{hovertext}: %{x:.1f} ms<extra></extra>",
+                ))
+            fig.update_layout(
+                height=max(240, 22 * len(span_df)), barmode="overlay",
+                yaxis=dict(autorange="reversed", tickvals=list(span_df.index), ticktext=list(span_df["label"])),
+                xaxis_title="ms since rerun start",
+                paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+                font=dict(color="#e2e8f0"), margin=dict(l=0, r=0, t=10, b=0),
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            st.dataframe(span_df.drop(columns=["label"]), use_container_width=True, hide_index=True)
+
+        st.download_button("⬇️ Export runs (JSON)", profiler.export_json(runs),
+                           file_name="dentsi_profile.json", mime="application/json")
@@ -8,24 +8,32 @@ Features:
 3. Real-time appointments & analytics
 4. Doctor scheduling & revenue tracking
 
-Run: streamlit run dentsi_complete.py
+Page of the multipage app: streamlit run streamlit_app.py
 """
 
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import json
+from datetime import date, datetime, timedelta
+import html
 import time
-import uuid
+
+import chat_worker
+import knowledge
+import kpis
+import metrics
+import pricing
+import profiler
+import slots
+import tracing
+import transcript
+from dentsi_dashboard import cache, client, models, renderers, templates
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-API_BASE = "https://dentcognit.abacusai.app"
 TWILIO_NUMBER = "+1 (920) 891-4513"  # Your real Twilio number
 
 st.set_page_config(
@@ -41,281 +49,49 @@ st.set_page_config(
 
 if 'demo_session_id' not in st.session_state:
     st.session_state.demo_session_id = None
+# Chat turns evicted from the bounded transcripts, shared by all sessions
+TRANSCRIPT_ARCHIVE = cache.get_transcript_archive()
+
 if 'conversation_history' not in st.session_state:
-    st.session_state.conversation_history = []
+    st.session_state.conversation_history = transcript.Transcript(archive=TRANSCRIPT_ARCHIVE)
 if 'selected_clinic_id' not in st.session_state:
     st.session_state.selected_clinic_id = None
+if 'demo_offline' not in st.session_state:
+    st.session_state.demo_offline = False
+if 'demo_pending_turns' not in st.session_state:
+    st.session_state.demo_pending_turns = []
+if 'demo_job' not in st.session_state:
+    st.session_state.demo_job = None
+
+# Per-rerun timings, exported by the metrics sidecar (DENTSI_METRICS_PORT)
+# and as traces (DENTSI_TRACE_FILE / DENTSI_OTLP_ENDPOINT)
+profiler.begin("dentsi_complete", profiler.history(st.session_state))
+metrics.start()
+tracing.start()
 
 # ============================================================================
 # CUSTOM CSS - Premium Dark Theme
 # ============================================================================
 
-st.markdown("""
-<style>
-    .stApp { background: linear-gradient(135deg, #0a0a1a 0%, #1a1a3a 100%); }
-    #MainMenu, footer, header { visibility: hidden; }
-    
-    .main-title {
-        font-size: 2.8rem;
-        font-weight: 800;
-        background: linear-gradient(90deg, #00d4ff, #7c3aed, #f472b6);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 10px 0;
-    }
-    
-    .subtitle {
-        text-align: center;
-        color: #94a3b8;
-        font-size: 1.1rem;
-        margin-bottom: 30px;
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, rgba(124, 58, 237, 0.15), rgba(0, 212, 255, 0.1));
-        border: 1px solid rgba(124, 58, 237, 0.3);
-        border-radius: 16px;
-        padding: 20px;
-        text-align: center;
-        height: 130px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-    }
-    
-    .metric-value {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #00d4ff;
-        line-height: 1.2;
-    }
-    
-    .metric-label {
-        color: #94a3b8;
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-top: 8px;
-    }
-    
-    .phone-box {
-        background: linear-gradient(90deg, #7c3aed, #00d4ff);
-        color: white;
-        font-size: 1.6rem;
-        font-weight: 700;
-        padding: 20px 30px;
-        border-radius: 16px;
-        text-align: center;
-        margin: 15px 0;
-    }
-    
-    .chat-container {
-        background: rgba(15, 23, 42, 0.8);
-        border: 1px solid rgba(124, 58, 237, 0.2);
-        border-radius: 16px;
-        padding: 20px;
-        max-height: 400px;
-        overflow-y: auto;
-    }
-    
-    .chat-bubble-ai {
-        background: linear-gradient(135deg, rgba(124, 58, 237, 0.3), rgba(124, 58, 237, 0.1));
-        border-left: 4px solid #7c3aed;
-        padding: 12px 16px;
-        border-radius: 0 12px 12px 0;
-        margin: 10px 0;
-        color: #e2e8f0;
-    }
-    
-    .chat-bubble-user {
-        background: linear-gradient(135deg, rgba(0, 212, 255, 0.2), rgba(0, 212, 255, 0.05));
-        border-right: 4px solid #00d4ff;
-        padding: 12px 16px;
-        border-radius: 12px 0 0 12px;
-        margin: 10px 0 10px 40px;
-        color: #e2e8f0;
-        text-align: right;
-    }
-    
-    .doctor-card {
-        background: rgba(30, 41, 59, 0.8);
-        border: 1px solid rgba(124, 58, 237, 0.2);
-        border-radius: 12px;
-        padding: 16px;
-        margin: 8px 0;
-    }
-    
-    .section-header {
-        color: #f1f5f9;
-        font-size: 1.3rem;
-        font-weight: 600;
-        margin: 20px 0 15px 0;
-        padding-bottom: 10px;
-        border-bottom: 2px solid rgba(124, 58, 237, 0.3);
-    }
-    
-    .status-badge {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 12px;
-        font-size: 0.75rem;
-        font-weight: 600;
-    }
-    
-    .status-online { background: #10b981; color: white; }
-    .status-busy { background: #ef4444; color: white; }
-    
-    .revenue-box {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        padding: 25px;
-        border-radius: 16px;
-        text-align: center;
-    }
-    
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e1e3a 0%, #0a0a1a 100%);
-    }
-    
-    .stTextInput input {
-        background: rgba(30, 41, 59, 0.8) !important;
-        border: 1px solid rgba(124, 58, 237, 0.3) !important;
-        color: #e2e8f0 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+renderers.inject_css("dentsi_complete")
 
 # ============================================================================
-# API FUNCTIONS
-# ============================================================================
-
-@st.cache_data(ttl=30)
-def fetch_health():
-    try:
-        r = requests.get(f"{API_BASE}/health", timeout=10)
-        return r.json()
-    except:
-        return {"status": "offline"}
-
-@st.cache_data(ttl=30)
-def fetch_clinics():
-    try:
-        r = requests.get(f"{API_BASE}/clinics", timeout=10)
-        return r.json()
-    except:
-        return []
-
-@st.cache_data(ttl=30)
-def fetch_stats(clinic_id=None):
-    try:
-        url = f"{API_BASE}/api/dashboard/stats"
-        if clinic_id:
-            url += f"?clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", {})
-    except:
-        return {}
-
-@st.cache_data(ttl=30)
-def fetch_appointments(clinic_id=None, limit=50):
-    try:
-        url = f"{API_BASE}/api/dashboard/appointments?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
-
-@st.cache_data(ttl=30)
-def fetch_calls(clinic_id=None, limit=20):
-    try:
-        url = f"{API_BASE}/api/dashboard/calls?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
-
-def start_demo_session(clinic_id=None, caller_phone=None):
-    """Start a new demo conversation session"""
-    try:
-        r = requests.post(
-            f"{API_BASE}/webhook/demo/start",
-            json={"clinicId": clinic_id, "callerPhone": caller_phone},
-            timeout=30
-        )
-        return r.json()
-    except Exception as e:
-        return {"success": False, "error": str(e)}
-
-def send_demo_message(session_id, message, clinic_id=None):
-    """Send a message in the demo conversation"""
-    try:
-        r = requests.post(
-            f"{API_BASE}/webhook/demo",
-            json={
-                "sessionId": session_id,
-                "userMessage": message,
-                "clinicId": clinic_id
-            },
-            timeout=30
-        )
-        return r.json()
-    except Exception as e:
-        return {"success": False, "error": str(e), "response": f"Error: {str(e)}"}
-
-def update_clinic_phone(clinic_id, phone):
-    """Update a clinic's phone number"""
-    try:
-        r = requests.patch(
-            f"{API_BASE}/clinics/{clinic_id}/phone",
-            json={"phone": phone},
-            timeout=10
-        )
-        return r.json()
-    except Exception as e:
-        return {"success": False, "error": str(e)}
-
-# Service prices for revenue calculation
-SERVICE_PRICES = {
-    "Regular Cleaning": 120, "Deep Cleaning": 250, "Cleaning": 120,
-    "Dental Filling": 250, "Filling": 250,
-    "Crown Placement": 1200, "Crown": 1200,
-    "Root Canal": 1500,
-    "Tooth Extraction": 300, "Extraction": 300,
-    "Teeth Whitening": 400, "Whitening": 400,
-    "Dental Implant": 3500, "Implant": 3500,
-    "Emergency Visit": 200, "Emergency": 200,
-    "Consultation": 75, "Checkup": 75
-}
-
-def get_service_price(service_type):
-    """Get price for a service type"""
-    for key, price in SERVICE_PRICES.items():
-        if key.lower() in service_type.lower():
-            return price
-    return 100  # Default
+# SHARED DATA
+# ============================================================================
+
+PRICING = cache.get_pricing_engine()
+RESPONSE_CACHE = cache.get_response_cache()
+CHAT_WORKER = cache.get_chat_worker()
+KNOWLEDGE = cache.get_knowledge_index()
 
 # Mock doctors data
-DOCTORS = [
-    {"name": "Dr. Emily Chen", "specialty": "General Dentistry", "clinic": "SmileCare Dental", "available": True, "appointments_today": 8, "revenue": 2400},
-    {"name": "Dr. Michael Roberts", "specialty": "Oral Surgery", "clinic": "SmileCare Dental", "available": True, "appointments_today": 5, "revenue": 7500},
-    {"name": "Dr. Sarah Kim", "specialty": "Pediatric Dentistry", "clinic": "SmileCare Dental", "available": False, "appointments_today": 6, "revenue": 1800},
-    {"name": "Dr. James Wilson", "specialty": "General Dentistry", "clinic": "Bright Teeth", "available": True, "appointments_today": 7, "revenue": 2100},
-    {"name": "Dr. Lisa Patel", "specialty": "Cosmetic Dentistry", "clinic": "Bright Teeth", "available": True, "appointments_today": 4, "revenue": 4800},
-    {"name": "Dr. Robert Martinez", "specialty": "Endodontics", "clinic": "Downtown Dental", "available": True, "appointments_today": 6, "revenue": 9000},
-    {"name": "Dr. Amanda Thompson", "specialty": "General Dentistry", "clinic": "Downtown Dental", "available": True, "appointments_today": 9, "revenue": 2700},
-]
+DOCTORS = models.DEMO_DOCTORS
 
 # ============================================================================
 # SIDEBAR
 # ============================================================================
 
-with st.sidebar:
+with st.sidebar, profiler.span("sidebar"):
     st.markdown("""
     <div style="text-align: center; padding: 20px 0;">
         <div style="font-size: 3.5rem;">🦷</div>
@@ -331,7 +107,7 @@ with st.sidebar:
     st.divider()
     
     # System status
-    health = fetch_health()
+    health = client.fetch_health()
     if health.get("status") == "ok":
         st.success("✅ Backend Online")
     else:
@@ -340,7 +116,7 @@ with st.sidebar:
     st.divider()
     
     # Clinic selector
-    clinics = fetch_clinics()
+    clinics = client.fetch_clinics()
     clinic_names = ["All Clinics"] + [c["name"] for c in clinics]
     selected_clinic_name = st.selectbox("🏥 Select Clinic", clinic_names)
     
@@ -369,17 +145,16 @@ with st.sidebar:
         if st.button("Assign Phone Number"):
             for c in clinics:
                 if c["name"] == clinic_to_update:
-                    result = update_clinic_phone(c["id"], "+19208914513")
+                    result = client.update_clinic_phone(c["id"], "+19208914513")
                     if result.get("success"):
                         st.success(f"✅ Assigned to {clinic_to_update}")
-                        st.cache_data.clear()
+                        cache.clear()
                     else:
                         st.error("Failed to update")
                     break
     
     st.divider()
-    st.markdown(f"[📄 API Docs]({API_BASE}/api-docs)")
-    st.markdown(f"[❤️ Health Check]({API_BASE}/health)")
+    renderers.api_links()
 
 # ============================================================================
 # MAIN HEADER
@@ -392,33 +167,41 @@ st.markdown('<p class="subtitle">AI Voice Agent for Dental Clinics - Enterprise
 # KEY METRICS
 # ============================================================================
 
-stats = fetch_stats(selected_clinic_id)
-appointments = fetch_appointments(selected_clinic_id)
-calls = fetch_calls(selected_clinic_id)
-
-# Calculate revenue
-total_revenue = sum(get_service_price(a.get("service_type", "")) for a in appointments if a.get("patient"))
-
-col1, col2, col3, col4, col5, col6 = st.columns(6)
+appointments = client.fetch_appointments(selected_clinic_id)
+calls = client.fetch_calls(selected_clinic_id)
+
+# Calculate revenue and headline counts
+kpi = kpis.compute_kpis(appointments, calls, PRICING)
+total_revenue = kpi["revenue"]
+
+doctor_schedules = client.fetch_doctors() or models.SEED_DOCTORS
+# Booked masks come from every appointment in the slot search horizon, not the
+# first page of the clinic's (oldest) appointments
+today = date.today()
+upcoming = client.fetch_appointments_between(
+    selected_clinic_id, today, today + timedelta(days=slots.HORIZON_DAYS)
+) or []
+SLOT_ENGINE = cache.get_slot_engine(
+    selected_clinic_id, kpis.data_version(doctor_schedules), kpis.data_version(upcoming),
+    doctor_schedules, upcoming
+)
 
-metrics = [
-    ("📞", str(len(calls) if calls else 15), "Calls Today"),
-    ("📅", str(len([a for a in appointments if a.get("patient")])), "Appointments"),
-    ("✅", "87%", "Booking Rate"),
+metric_cards = [
+    ("📞", str(kpi["calls"] if calls else 15), "Calls Today"),
+    ("📅", str(kpi["booked"]), "Appointments"),
+    ("✅", f"{kpi['booking_rate']:.0f}%", "Booking Rate"),
     ("💰", f"${total_revenue:,}", "Revenue"),
     ("🏥", str(len(clinics)), "Clinics"),
     ("⚡", "0.8s", "Avg Response"),
 ]
 
-for col, (icon, value, label) in zip([col1, col2, col3, col4, col5, col6], metrics):
-    with col:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div style="font-size: 1.4rem;">{icon}</div>
-            <div class="metric-value">{value}</div>
-            <div class="metric-label">{label}</div>
-        </div>
-        """, unsafe_allow_html=True)
+st.markdown(templates.grid([f"""
+    <div class="metric-card">
+        <div style="font-size: 1.4rem;">{icon}</div>
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{label}</div>
+    </div>
+    """ for icon, value, label in metric_cards], columns=6), unsafe_allow_html=True)
 
 st.markdown("<br>", unsafe_allow_html=True)
 
@@ -426,20 +209,172 @@ st.markdown("<br>", unsafe_allow_html=True)
 # TABS
 # ============================================================================
 
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+def demo_fallback_response(message, history):
+    """Scripted reply for the browser demo when the backend is not reachable"""
+    text = message.lower()
+    
+    # Pricing questions are answered from the service catalog
+    if any(w in text for w in ("how much", "cost", "price")):
+        service = PRICING.match(text)
+        if service:
+            return (f"A {service} is ${PRICING.price(service):,} and takes about "
+                    f"{PRICING.duration(service)} minutes. Would you like to book one?")
+    weekdays = {i for i, day in enumerate(slots.WEEKDAY_NAMES) if day.lower() in text}
+    # Other questions (policies, insurance, doctors) from the knowledge base;
+    # questions about a particular day are left to the slot finder below
+    is_question = text.rstrip().endswith("?") or text.split(" ", 1)[0] in (
+        "what", "how", "do", "does", "can", "is", "are", "when", "where", "which", "who", "why")
+    if is_question and not weekdays and "tomorrow" not in text:
+        found = knowledge.answer(KNOWLEDGE, message)
+        if found:
+            return found
+    
+    if "cleaning" in text:
+        return "I'd be happy to help you schedule a cleaning! Are you a current patient with us?"
+    if "name" in text:
+        return "Nice to meet you! Do you have dental insurance you'd like us to use?"
+    if "insurance" in text:
+        return "Great! I have your insurance information. What day works best for you?"
+    
+    if weekdays or "tomorrow" in text:
+        if "tomorrow" in text:
+            weekdays = {(datetime.now().weekday() + 1) % 7}
+        window = None
+        if "morning" in text:
+            window = (datetime.min.time(), datetime.strptime("12:00", "%H:%M").time())
+        elif "afternoon" in text:
+            window = (datetime.strptime("12:00", "%H:%M").time(), datetime.strptime("18:00", "%H:%M").time())
+        # Size the slot for the service the caller asked for earlier in the conversation
+        asked = " ".join(m["message"] for m in history if m["role"] == "user")
+        found = SLOT_ENGINE.next_free_slots(
+            PRICING.duration(asked), n=1, clinic_id=selected_clinic_id, weekdays=weekdays, window=window
+        )
+        if found:
+            return f"Perfect! I have {slots.format_slot(found[0])} available. Shall I book that for you?"
+        return "I'm sorry, we don't have an opening then in the next few weeks. Would another day work for you?"
+    
+    if "tooth" in text:
+        found = SLOT_ENGINE.next_free_slots(PRICING.duration("Emergency"), n=1, clinic_id=selected_clinic_id)
+        if found:
+            return (f"I'm sorry to hear you're in pain. Let me get you in as soon as possible. "
+                    f"This is urgent - we have an opening {slots.format_slot(found[0])}. Can you make it?")
+        return "I'm sorry to hear you're in pain. Let me connect you with our staff right away for an emergency visit."
+    found = knowledge.answer(KNOWLEDGE, message)
+    if found:
+        return found
+    return "I understand. How can I assist you further?"
+
+def run_demo_turn(job, session_id, message, clinic_id, pending, stream):
+    """Worker side of a backend turn: replay cache-served turns, then send the message
+    
+    Returns ([(pending turn, backend result), ...], result for the message).
+    """
+    replayed = [(turn, client.send_demo_message(session_id, turn["message"], clinic_id)) for turn in pending]
+    if not stream:
+        return replayed, client.send_demo_message(session_id, message, clinic_id)
+    reply = client.DemoStream(session_id, message, clinic_id)
+    for _ in reply:
+        job.text = reply.text
+    return replayed, reply.result
+
+def demo_reply(message, history, use_cache=True, stream=False):
+    """AI reply for one browser demo turn; history holds the turns before this message
+    
+    Returns the reply text, or for backend turns a chat_worker.ChatJob running
+    in CHAT_WORKER (pass its result to finish_demo_reply once it is done).
+    """
+    session_id = st.session_state.demo_session_id
+    if not session_id or st.session_state.demo_offline:
+        # Fallback responses, with openings from the doctors' real schedules
+        return demo_fallback_response(message, list(history) + [{"role": "user", "message": message}])
+    
+    key = RESPONSE_CACHE.key(selected_clinic_id, message, history)
+    if use_cache:
+        cached = RESPONSE_CACHE.get(key)
+        if cached is not None:
+            # The backend session has not seen this turn; it is replayed before the next
+            # miss, and what the backend answers then replaces the reply shown now
+            # (the caller appends the user turn, then this reply)
+            st.session_state.demo_pending_turns.append({
+                "message": message, "key": key, "reply": cached,
+                "turn": history.archived + len(history) + 1,
+            })
+            return cached
+    
+    pending = st.session_state.demo_pending_turns
+    st.session_state.demo_pending_turns = []
+    return CHAT_WORKER.submit(run_demo_turn, session_id, message, selected_clinic_id, pending, stream)
+
+def finish_demo_reply(result, message, history, key=None):
+    """Reply text for a backend result, caching it when it is safe to reuse
+    
+    key is the RESPONSE_CACHE key taken before the message joined the history.
+    """
+    if not result or "error" in result:
+        return demo_fallback_response(message, list(history) + [{"role": "user", "message": message}])
+    response = result.get("response", "I understand. Let me help you with that.")
+    # Turns that booked something must reach the backend every time
+    if result.get("success") and not result.get("appointmentBooked"):
+        RESPONSE_CACHE.put(key or RESPONSE_CACHE.key(selected_clinic_id, message, history), response)
+    return response
+
+def reconcile_replayed(replayed, history):
+    """Show the backend's own replies to replayed cache-served turns, so the
+    transcript and the backend conversation agree"""
+    for turn, result in replayed:
+        if not result or "error" in result:
+            continue
+        response = result.get("response")
+        if response and response != turn["reply"]:
+            # The cached reply did not reproduce; stop serving it
+            RESPONSE_CACHE.discard(turn["key"])
+            history.replace(turn["turn"], response)
+
+@st.fragment(run_every=0.5)
+def render_pending_reply():
+    """Typing indicator (and streamed text so far) until the worker finishes the turn"""
+    pending = st.session_state.demo_job
+    if pending is None:
+        return
+    job = CHAT_WORKER.get(pending["id"])
+    if job is not None and not job.done():
+        partial = html.escape(job.text).replace("\n", "<br>")
+        st.markdown(
+            f'<div class="chat-bubble-ai"><strong>🦷 Dentsi:</strong> {partial} '
+            '<span class="typing-dots"><span></span><span></span><span></span></span></div>',
+            unsafe_allow_html=True
+        )
+        return
+    
+    st.session_state.demo_job = None
+    history = st.session_state.conversation_history
+    # Ignore turns from a conversation that has since been restarted
+    if pending["session_id"] == st.session_state.demo_session_id:
+        replayed, result = [], None
+        if job is not None:
+            CHAT_WORKER.discard(job.id)
+            if job.result is not None:
+                replayed, result = job.result
+        reconcile_replayed(replayed, history)
+        reply = finish_demo_reply(result, pending["message"], list(history)[:-1], key=pending["key"])
+        history.append("ai", reply)
+    st.rerun()
+
+tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "🎤 Try Demo",
     "📅 Appointments",
     "👨‍⚕️ Doctors",
     "💰 Revenue",
     "📊 Analytics",
-    "🚨 Escalations"
+    "🚨 Escalations",
+    "🗓️ Availability"
 ])
 
 # ============================================================================
 # TAB 1: TRY DEMO - Interactive Voice Demo
 # ============================================================================
 
-with tab1:
+with tab1, profiler.span("tab: Try Demo"):
     st.markdown('<div class="section-header">🎤 Try the AI Voice Agent</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
@@ -482,36 +417,48 @@ with tab1:
         
         # Demo controls
         if st.button("🔄 Start New Conversation", type="primary", use_container_width=True):
-            result = start_demo_session(selected_clinic_id)
+            result = client.start_demo_session(selected_clinic_id)
+            st.session_state.demo_pending_turns = []
+            st.session_state.demo_job = None
             if result.get("success"):
                 st.session_state.demo_session_id = result.get("sessionId")
-                st.session_state.conversation_history = [
-                    {"role": "ai", "message": result.get("greeting", "Hello! How can I help you?")}
-                ]
+                st.session_state.demo_offline = False
+                st.session_state.conversation_history.discard()
+                st.session_state.conversation_history = transcript.Transcript(
+                    [{"role": "ai", "message": result.get("greeting", "Hello! How can I help you?")}],
+                    archive=TRANSCRIPT_ARCHIVE
+                )
                 st.success(f"Connected to {result.get('clinicName', 'clinic')}")
             else:
                 # Fallback if API not available
                 st.session_state.demo_session_id = f"demo-{int(time.time())}"
-                st.session_state.conversation_history = [
-                    {"role": "ai", "message": "Thank you for calling SmileCare Dental. This is Dentsi, your AI assistant. How can I help you today?"}
-                ]
+                st.session_state.demo_offline = True
+                st.session_state.conversation_history.discard()
+                st.session_state.conversation_history = transcript.Transcript(
+                    [{"role": "ai", "message": "Thank you for calling SmileCare Dental. This is Dentsi, your AI assistant. How can I help you today?"}],
+                    archive=TRANSCRIPT_ARCHIVE
+                )
                 st.info("Using demo mode")
         
-        # Conversation display
-        st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-        for msg in st.session_state.conversation_history:
-            if msg["role"] == "ai":
-                st.markdown(f'<div class="chat-bubble-ai"><strong>🦷 Dentsi:</strong> {msg["message"]}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="chat-bubble-user"><strong>You:</strong> {msg["message"]}</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Conversation display (one element, re-rendered only when a turn is added)
+        history = st.session_state.conversation_history
+        if history.archived and st.toggle(f"📜 Show {history.archived} earlier turns", key="show_archived_turns"):
+            st.markdown("".join(transcript.render_turn(t) for t in history.archived_turns()), unsafe_allow_html=True)
+        st.markdown(history.html(), unsafe_allow_html=True)
+        if st.session_state.demo_job is not None:
+            render_pending_reply()
         
         # Message input
         user_input = st.text_input("Type your message:", placeholder="e.g., I'd like to schedule a cleaning", key="user_message")
         
         col_send, col_quick = st.columns([1, 2])
         with col_send:
-            send_clicked = st.button("Send 📤", type="primary", use_container_width=True)
+            send_clicked = st.button("Send 📤", type="primary", use_container_width=True,
+                                     disabled=st.session_state.demo_job is not None)
+            use_cache = st.toggle("⚡ Cache", value=True, key="use_response_cache",
+                                  help="Reuse replies to the same message at the same point in a conversation")
+            stream_replies = st.toggle("🌊 Stream", value=True, key="stream_replies",
+                                       help="Show the reply word by word as the agent generates it")
         
         # Quick responses
         with col_quick:
@@ -525,82 +472,64 @@ with tab1:
             ])
         
         if send_clicked and user_input:
-            # Add user message
-            st.session_state.conversation_history.append({"role": "user", "message": user_input})
-            
-            # Get AI response
-            if st.session_state.demo_session_id:
-                result = send_demo_message(
-                    st.session_state.demo_session_id,
-                    user_input,
-                    selected_clinic_id
-                )
-                ai_response = result.get("response", "I understand. Let me help you with that.")
-            else:
-                # Fallback responses
-                responses = {
-                    "cleaning": "I'd be happy to help you schedule a cleaning! Are you a current patient with us?",
-                    "name": "Nice to meet you! Do you have dental insurance you'd like us to use?",
-                    "insurance": "Great! I have your insurance information. What day works best for you?",
-                    "tuesday": "Perfect! I have Tuesday at 10am available with Dr. Chen. Shall I book that for you?",
-                    "tooth": "I'm sorry to hear you're in pain. Let me get you in as soon as possible. This is urgent - we have an opening today at 2pm. Can you make it?"
+            # Add the user turn now; backend replies arrive through render_pending_reply
+            history = st.session_state.conversation_history
+            key = RESPONSE_CACHE.key(selected_clinic_id, user_input, history)
+            ai_response = demo_reply(user_input, history, use_cache, stream=stream_replies)
+            history.append("user", user_input)
+            if isinstance(ai_response, chat_worker.ChatJob):
+                st.session_state.demo_job = {
+                    "id": ai_response.id,
+                    "session_id": st.session_state.demo_session_id,
+                    "message": user_input,
+                    "key": key,
                 }
-                ai_response = "I understand. How can I assist you further?"
-                for key, resp in responses.items():
-                    if key in user_input.lower():
-                        ai_response = resp
-                        break
-            
-            st.session_state.conversation_history.append({"role": "ai", "message": ai_response})
+            else:
+                history.append("ai", ai_response)
             st.rerun()
         
         if quick != "-- Select --":
             st.info(f"Click 'Send' after selecting: {quick}")
+        
+        cache_stats = RESPONSE_CACHE.stats()
+        if cache_stats["hits"] + cache_stats["misses"]:
+            st.caption(f"⚡ Response cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                       f"({cache_stats['hit_ratio']:.0%}), {cache_stats['entries']} replies stored")
 
 # ============================================================================
 # TAB 2: APPOINTMENTS
 # ============================================================================
 
-with tab2:
+with tab2, profiler.span("tab: Appointments"):
     st.markdown('<div class="section-header">📅 Appointments</div>', unsafe_allow_html=True)
     
     if appointments:
         # Filter to only booked appointments
-        booked = [a for a in appointments if a.get("patient")]
+        apt_df = kpis.appointments_frame(appointments, PRICING)
+        booked = apt_df[apt_df["booked"]]
         
-        if booked:
-            apt_data = []
-            for apt in booked:
-                patient = apt.get("patient", {}) or {}
-                clinic = apt.get("clinic", {}) or {}
-                service = apt.get("service_type", "Consultation")
-                price = get_service_price(service)
-                
-                apt_data.append({
-                    "Patient": patient.get("name", "Unknown"),
-                    "Phone": patient.get("phone", "-"),
-                    "Service": service,
-                    "Date": apt.get("appointment_date", "")[:10],
-                    "Status": apt.get("status", "scheduled").upper(),
-                    "Clinic": clinic.get("name", "-"),
-                    "Revenue": f"${price}"
-                })
-            
-            df = pd.DataFrame(apt_data)
+        if kpi["booked"]:
+            df = pd.DataFrame({
+                "Patient": booked["patient_name"].fillna("Unknown"),
+                "Phone": booked["patient_phone"].fillna("-"),
+                "Service": booked["service_type"].fillna("Consultation"),
+                "Date": booked["date"].fillna(""),
+                "Status": booked["status"].str.upper(),
+                "Clinic": booked["clinic_name"].fillna("-"),
+                "Revenue": "$" + booked["price"].astype(str)
+            })
             st.dataframe(df, use_container_width=True, hide_index=True, height=400)
             
             # Summary metrics
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.metric("Total Booked", len(booked))
+                st.metric("Total Booked", kpi["booked"])
             with col2:
-                scheduled = len([a for a in apt_data if a["Status"] == "SCHEDULED"])
-                st.metric("Scheduled", scheduled)
+                st.metric("Scheduled", kpi["scheduled"])
             with col3:
                 st.metric("Total Revenue", f"${total_revenue:,}")
             with col4:
-                avg = total_revenue // len(booked) if booked else 0
-                st.metric("Avg / Appointment", f"${avg}")
+                st.metric("Avg / Appointment", f"${kpi['avg_ticket']}")
         else:
             st.info("No booked appointments yet.")
     else:
@@ -610,27 +539,10 @@ with tab2:
 # TAB 3: DOCTORS
 # ============================================================================
 
-with tab3:
+with tab3, profiler.span("tab: Doctors"):
     st.markdown('<div class="section-header">👨‍⚕️ Doctors & Availability</div>', unsafe_allow_html=True)
     
-    cols = st.columns(3)
-    for i, doc in enumerate(DOCTORS):
-        with cols[i % 3]:
-            status = "🟢 Available" if doc["available"] else "🔴 Busy"
-            st.markdown(f"""
-            <div class="doctor-card">
-                <div style="font-size: 1.1rem; font-weight: 600; color: #f1f5f9;">{doc['name']}</div>
-                <div style="color: #7c3aed; font-size: 0.85rem;">{doc['specialty']}</div>
-                <div style="color: #64748b; font-size: 0.8rem; margin-top: 6px;">📍 {doc['clinic']}</div>
-                <div style="margin-top: 8px; display: flex; justify-content: space-between;">
-                    <span>{status}</span>
-                    <span style="color: #10b981;">${doc['revenue']:,}</span>
-                </div>
-                <div style="color: #94a3b8; font-size: 0.75rem; margin-top: 4px;">
-                    {doc['appointments_today']} appointments today
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(templates.grid(templates.demo_doctor_card(doc) for doc in DOCTORS), unsafe_allow_html=True)
     
     st.markdown("---")
     st.markdown("### 📊 Performance by Doctor")
@@ -658,7 +570,7 @@ with tab3:
 # TAB 4: REVENUE
 # ============================================================================
 
-with tab4:
+with tab4, profiler.span("tab: Revenue"):
     st.markdown('<div class="section-header">💰 Revenue Analytics</div>', unsafe_allow_html=True)
     
     # Calculate totals
@@ -733,7 +645,7 @@ with tab4:
 # TAB 5: ANALYTICS
 # ============================================================================
 
-with tab5:
+with tab5, profiler.span("tab: Analytics"):
     st.markdown('<div class="section-header">📊 Call Analytics</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
@@ -784,7 +696,7 @@ with tab5:
 # TAB 6: ESCALATIONS
 # ============================================================================
 
-with tab6:
+with tab6, profiler.span("tab: Escalations"):
     st.markdown('<div class="section-header">🚨 Escalations & Alerts</div>', unsafe_allow_html=True)
     
     escalations = [
@@ -793,32 +705,51 @@ with tab6:
         {"id": 3, "patient": "Michael Brown", "reason": "EMERGENCY - Severe tooth pain, needs same-day", "priority": "High", "time": "2 min ago", "phone": "+1 555-333-3333"},
     ]
     
-    for esc in escalations:
-        priority_color = {"High": "#ef4444", "Medium": "#f59e0b", "Low": "#6366f1"}[esc["priority"]]
-        
-        col1, col2, col3 = st.columns([4, 1, 1])
-        with col1:
-            st.markdown(f"""
-            <div style="background: rgba(30, 41, 59, 0.6); border-left: 4px solid {priority_color};
-                        padding: 16px 20px; border-radius: 0 8px 8px 0; margin: 8px 0;">
-                <div style="color: #f1f5f9; font-weight: 600;">{esc['patient']}</div>
-                <div style="color: #94a3b8; font-size: 0.9rem;">{esc['reason']}</div>
-                <div style="color: #64748b; font-size: 0.8rem; margin-top: 8px;">
-                    📞 {esc['phone']} | 🕐 {esc['time']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col2:
-            st.markdown(f"""
-            <div style="background: {priority_color}; color: white; padding: 8px 16px;
-                        border-radius: 8px; text-align: center; margin-top: 20px; font-weight: 600;">
-                {esc['priority']}
-            </div>
-            """, unsafe_allow_html=True)
-        with col3:
-            if st.button("✓ Resolve", key=f"resolve_{esc['id']}", use_container_width=True):
+    # All cards in one element; only the Resolve buttons are widgets, in one row
+    # under the list (a button beside each card would need a row of columns per card)
+    st.markdown(templates.grid((templates.escalation_card(esc, templates.COMPLETE_ESCALATION_CARD)
+                                for esc in escalations), columns=1), unsafe_allow_html=True)
+    for col, esc in zip(st.columns(len(escalations)), escalations):
+        with col:
+            if st.button(f"✓ Resolve {esc['patient']}", key=f"resolve_{esc['id']}", use_container_width=True):
                 st.success(f"Resolved: {esc['patient']}")
 
+# ============================================================================
+# TAB 7: AVAILABILITY
+# ============================================================================
+
+with tab7, profiler.span("tab: Availability"):
+    st.markdown('<div class="section-header">🗓️ Open Slots</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        slot_service = st.selectbox("Service", list(pricing.SERVICE_ALIASES), key="slot_service")
+    with col2:
+        slot_doctors = {"Any Doctor": None}
+        for doctor_id, doc in SLOT_ENGINE.doctors.items():
+            slot_doctors[doc["name"]] = doctor_id
+        slot_doctor = slot_doctors[st.selectbox("Doctor", list(slot_doctors), key="slot_doctor")]
+    with col3:
+        slot_count = st.slider("Show next", 5, 30, 10, key="slot_count")
+    
+    slot_days = st.multiselect("Days", slots.WEEKDAY_NAMES, default=[], key="slot_days",
+                               placeholder="Any day")
+    duration = PRICING.duration(slot_service)
+    open_slots = SLOT_ENGINE.next_free_slots(
+        duration, n=slot_count, doctor_id=slot_doctor, clinic_id=selected_clinic_id,
+        weekdays={slots.WEEKDAY_NAMES.index(d) for d in slot_days} or None
+    )
+    
+    st.caption(f"{slot_service}: {duration} minutes · ${PRICING.price(slot_service):,}")
+    if open_slots:
+        st.dataframe(pd.DataFrame([{
+            "Date": s["start"].strftime("%a %b %d"),
+            "Time": f'{s["start"]:%I:%M %p} - {s["end"]:%I:%M %p}',
+            "Doctor": s["doctor"]
+        } for s in open_slots]), use_container_width=True, hide_index=True)
+    else:
+        st.info("No open slots in the next 60 days for this selection.")
+
 # ============================================================================
 # FOOTER
 # ============================================================================
@@ -829,7 +760,7 @@ st.markdown(f"""
     <div style="font-size: 2rem;">🦷</div>
     <div style="font-size: 1.1rem; font-weight: 600;">DENTSI - AI Voice Agent for Dental Clinics</div>
     <div style="font-size: 0.85rem; margin-top: 8px;">
-        Backend: <a href="{API_BASE}" style="color: #7c3aed;">{API_BASE}</a> | 
+        Backend: <a href="{client.api_base()}" style="color: #7c3aed;">{client.api_base()}</a> | 
         Phone: {TWILIO_NUMBER}
     </div>
     <div style="font-size: 0.75rem; margin-top: 12px; color: #475569;">
@@ -837,3 +768,5 @@ st.markdown(f"""
     </div>
 </div>
 """, unsafe_allow_html=True)
+
+profiler.finish()
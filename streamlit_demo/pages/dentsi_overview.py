@@ -10,23 +10,26 @@ This dashboard connects to the live backend and demonstrates:
 - Patient management
 - Escalation tracking
 
-Run: streamlit run dentsi_dashboard.py
+Page of the multipage app: streamlit run streamlit_app.py
 """
 
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import json
-import time
+from datetime import datetime
+
+import kpis
+import metrics
+import profiler
+import replay
+import tracing
+from dentsi_dashboard import cache, client, models, renderers, templates
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-API_BASE = "https://dentcognit.abacusai.app"
 TWILIO_NUMBER = "+1 (555) 123-4567"  # Demo number - replace with real Twilio number
 
 st.set_page_config(
@@ -40,205 +43,34 @@ st.set_page_config(
 # SESSION STATE
 # ============================================================================
 
-if 'demo_step' not in st.session_state:
-    st.session_state.demo_step = 0
-if 'demo_running' not in st.session_state:
-    st.session_state.demo_running = False
+if 'demo_play' not in st.session_state:
+    st.session_state.demo_play = 0
 if 'selected_clinic' not in st.session_state:
     st.session_state.selected_clinic = None
 
+# Per-rerun timings, exported by the metrics sidecar (DENTSI_METRICS_PORT)
+# and as traces (DENTSI_TRACE_FILE / DENTSI_OTLP_ENDPOINT)
+profiler.begin("dentsi_overview", profiler.history(st.session_state))
+metrics.start()
+tracing.start()
+
 # ============================================================================
 # CUSTOM CSS
 # ============================================================================
 
-st.markdown("""
-<style>
-    .stApp { background: linear-gradient(135deg, #0a0a1a 0%, #1a1a3a 100%); }
-    #MainMenu, footer, header { visibility: hidden; }
-    
-    .main-title {
-        font-size: 2.8rem;
-        font-weight: 800;
-        background: linear-gradient(90deg, #00d4ff, #7c3aed, #f472b6);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 10px 0;
-    }
-    
-    .subtitle {
-        text-align: center;
-        color: #94a3b8;
-        font-size: 1.1rem;
-        margin-bottom: 30px;
-    }
-    
-    .metric-box {
-        background: linear-gradient(135deg, rgba(124, 58, 237, 0.15), rgba(0, 212, 255, 0.1));
-        border: 1px solid rgba(124, 58, 237, 0.3);
-        border-radius: 16px;
-        padding: 24px;
-        text-align: center;
-        height: 140px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    
-    .metric-value {
-        font-size: 2.2rem;
-        font-weight: 700;
-        color: #00d4ff;
-    }
-    
-    .metric-label {
-        color: #94a3b8;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-top: 8px;
-    }
-    
-    .phone-number {
-        background: linear-gradient(90deg, #7c3aed, #00d4ff);
-        color: white;
-        font-size: 1.8rem;
-        font-weight: 700;
-        padding: 20px 40px;
-        border-radius: 16px;
-        text-align: center;
-        margin: 20px 0;
-    }
-    
-    .chat-ai {
-        background: rgba(124, 58, 237, 0.2);
-        border-left: 4px solid #7c3aed;
-        padding: 16px 20px;
-        border-radius: 0 12px 12px 0;
-        margin: 12px 0;
-        color: #e2e8f0;
-    }
-    
-    .chat-patient {
-        background: rgba(0, 212, 255, 0.15);
-        border-right: 4px solid #00d4ff;
-        padding: 16px 20px;
-        border-radius: 12px 0 0 12px;
-        margin: 12px 0;
-        color: #e2e8f0;
-        text-align: right;
-    }
-    
-    .doctor-card {
-        background: rgba(30, 41, 59, 0.8);
-        border: 1px solid rgba(124, 58, 237, 0.2);
-        border-radius: 12px;
-        padding: 20px;
-        margin: 10px 0;
-    }
-    
-    .section-title {
-        color: #f1f5f9;
-        font-size: 1.4rem;
-        font-weight: 600;
-        margin: 20px 0 15px 0;
-        padding-bottom: 10px;
-        border-bottom: 2px solid rgba(124, 58, 237, 0.3);
-    }
-    
-    .status-online {
-        background: #10b981;
-        color: white;
-        padding: 4px 12px;
-        border-radius: 12px;
-        font-size: 0.8rem;
-    }
-    
-    .revenue-highlight {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        padding: 30px;
-        border-radius: 16px;
-        text-align: center;
-    }
-    
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e1e3a 0%, #0a0a1a 100%);
-    }
-</style>
-""", unsafe_allow_html=True)
+renderers.inject_css("dentsi_overview")
 
 # ============================================================================
-# API FUNCTIONS
+# SHARED DATA
 # ============================================================================
 
-@st.cache_data(ttl=30)
-def fetch_health():
-    try:
-        r = requests.get(f"{API_BASE}/health", timeout=10)
-        return r.json()
-    except:
-        return {"status": "offline"}
-
-@st.cache_data(ttl=30)
-def fetch_clinics():
-    try:
-        r = requests.get(f"{API_BASE}/clinics", timeout=10)
-        return r.json()
-    except:
-        return []
-
-@st.cache_data(ttl=30)
-def fetch_stats(clinic_id=None):
-    try:
-        url = f"{API_BASE}/api/dashboard/stats"
-        if clinic_id:
-            url += f"?clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", {})
-    except:
-        return {}
-
-@st.cache_data(ttl=30)
-def fetch_appointments(clinic_id=None, limit=50):
-    try:
-        url = f"{API_BASE}/api/dashboard/appointments?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
-
-@st.cache_data(ttl=30)
-def fetch_calls(clinic_id=None, limit=20):
-    try:
-        url = f"{API_BASE}/api/dashboard/calls?limit={limit}"
-        if clinic_id:
-            url += f"&clinicId={clinic_id}"
-        r = requests.get(url, timeout=10)
-        return r.json().get("data", [])
-    except:
-        return []
-
-def get_doctors_from_clinics(clinics):
-    """Extract doctors from clinic data or return mock doctors"""
-    doctors = [
-        {"name": "Dr. Emily Chen", "specialty": "General Dentistry", "clinic": "SmileCare Dental", "available": True},
-        {"name": "Dr. Michael Roberts", "specialty": "Oral Surgery", "clinic": "SmileCare Dental", "available": True},
-        {"name": "Dr. Sarah Kim", "specialty": "Pediatric Dentistry", "clinic": "SmileCare Dental", "available": False},
-        {"name": "Dr. James Wilson", "specialty": "General Dentistry", "clinic": "Bright Teeth", "available": True},
-        {"name": "Dr. Lisa Patel", "specialty": "Cosmetic Dentistry", "clinic": "Bright Teeth", "available": True},
-        {"name": "Dr. Robert Martinez", "specialty": "Endodontics", "clinic": "Downtown Dental", "available": True},
-        {"name": "Dr. Amanda Thompson", "specialty": "General Dentistry", "clinic": "Downtown Dental", "available": True},
-    ]
-    return doctors
+PRICING = cache.get_pricing_engine()
 
 # ============================================================================
 # SIDEBAR
 # ============================================================================
 
-with st.sidebar:
+with st.sidebar, profiler.span("sidebar"):
     st.markdown("""
     <div style="text-align: center; padding: 20px 0;">
         <div style="font-size: 3.5rem;">🦷</div>
@@ -254,7 +86,7 @@ with st.sidebar:
     st.divider()
     
     # Clinic selector
-    clinics = fetch_clinics()
+    clinics = client.fetch_clinics()
     clinic_names = ["All Clinics"] + [c["name"] for c in clinics]
     selected_clinic_name = st.selectbox("🏥 Select Clinic", clinic_names)
     
@@ -268,10 +100,10 @@ with st.sidebar:
     st.divider()
     
     # System status
-    health = fetch_health()
+    health = client.fetch_health()
     if health.get("status") == "ok":
         st.success("✅ System Online")
-        st.caption(f"Backend: {API_BASE}")
+        st.caption(f"Backend: {client.api_base()}")
     else:
         st.error("⚠️ Demo Mode")
     
@@ -290,8 +122,7 @@ with st.sidebar:
     
     st.divider()
     
-    st.markdown("[📄 API Docs]({}/api-docs)".format(API_BASE))
-    st.markdown("[❤️ Health Check]({}/health)".format(API_BASE))
+    renderers.api_links()
 
 # ============================================================================
 # MAIN HEADER
@@ -304,40 +135,29 @@ st.markdown('<p class="subtitle">AI Voice Agent for Dental Clinics - Enterprise
 # KEY METRICS
 # ============================================================================
 
-stats = fetch_stats(selected_clinic_id)
-appointments = fetch_appointments(selected_clinic_id)
-calls = fetch_calls(selected_clinic_id)
-
-# Calculate revenue from appointments
-total_revenue = 0
-service_prices = {"Cleaning": 120, "Crown": 1200, "Root Canal": 1500, "Filling": 250, "Extraction": 300, "Whitening": 400, "Implant": 3500, "Consultation": 75}
-for apt in appointments:
-    service = apt.get("service_type", "")
-    for svc, price in service_prices.items():
-        if svc.lower() in service.lower():
-            total_revenue += price
-            break
-
-col1, col2, col3, col4, col5, col6 = st.columns(6)
-
-metrics = [
-    ("📞", str(len(calls)), "Total Calls"),
-    ("📅", str(len(appointments)), "Appointments"),
-    ("✅", f"{stats.get('appointments', {}).get('confirmationRate', 85):.0f}%", "Booking Rate"),
+appointments = client.fetch_appointments(selected_clinic_id)
+calls = client.fetch_calls(selected_clinic_id)
+
+# Revenue from appointments, priced from the service catalog
+kpi = kpis.compute_kpis(appointments, calls, PRICING)
+total_revenue = kpi["revenue_all"]
+
+metric_cards = [
+    ("📞", str(kpi["calls"]), "Total Calls"),
+    ("📅", str(kpi["appointments"]), "Appointments"),
+    ("✅", f"{kpi['booking_rate']:.0f}%", "Booking Rate"),
     ("💰", f"${total_revenue:,}", "Revenue"),
     ("👥", str(len(clinics)), "Clinics"),
     ("⚡", "0.8s", "Avg Response"),
 ]
 
-for col, (icon, value, label) in zip([col1, col2, col3, col4, col5, col6], metrics):
-    with col:
-        st.markdown(f"""
-        <div class="metric-box">
-            <div style="font-size: 1.5rem;">{icon}</div>
-            <div class="metric-value">{value}</div>
-            <div class="metric-label">{label}</div>
-        </div>
-        """, unsafe_allow_html=True)
+st.markdown(templates.grid([f"""
+    <div class="metric-box">
+        <div style="font-size: 1.5rem;">{icon}</div>
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{label}</div>
+    </div>
+    """ for icon, value, label in metric_cards], columns=6), unsafe_allow_html=True)
 
 st.markdown("<br>", unsafe_allow_html=True)
 
@@ -358,7 +178,7 @@ tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
 # TAB 1: LIVE DEMO - How the call actually works
 # ============================================================================
 
-with tab1:
+with tab1, profiler.span("tab: Live Demo"):
     st.markdown('<div class="section-title">📞 How Dentsi Works - Live Call Demo</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
@@ -408,83 +228,62 @@ with tab1:
             ("ai", "🦷 Dentsi", "Thank you, John! We look forward to seeing you Tuesday. Have a great day!"),
         ]
         
+        # Recorded calls can be replayed the same way as the scripted demo
+        recorded = {
+            f"📞 {c.get('caller_phone') or 'Unknown'} · {(c.get('created_at') or '')[:16].replace('T', ' ')}": c["transcript"]
+            for c in calls if c.get("transcript")
+        }
+        source = st.selectbox("Conversation", ["🎬 Scripted demo"] + list(recorded), key="demo_source")
+        
         # Demo controls
         if st.button("▶️ Start Live Demo", type="primary", use_container_width=True):
-            st.session_state.demo_running = True
-            st.session_state.demo_step = 0
+            st.session_state.demo_play += 1
         
-        if st.session_state.demo_running:
-            demo_container = st.container()
-            progress = st.progress(0)
-            
-            with demo_container:
-                for i, (role, speaker, message) in enumerate(conversation):
-                    if i <= st.session_state.demo_step:
-                        css_class = "chat-ai" if role == "ai" else "chat-patient"
-                        st.markdown(f"""
-                        <div class="{css_class}">
-                            <strong>{speaker}</strong><br>{message}
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                progress.progress((st.session_state.demo_step + 1) / len(conversation))
-                
-                if st.session_state.demo_step < len(conversation) - 1:
-                    time.sleep(1.5)
-                    st.session_state.demo_step += 1
-                    st.rerun()
-                else:
-                    st.success("✅ Appointment booked! John Smith - Cleaning - Tue Jan 28, 10am - Dr. Chen")
-                    st.session_state.demo_running = False
+        if st.session_state.demo_play:
+            # Played back in the browser: one element, no sleeps or reruns
+            if source in recorded:
+                turns, done, escape = replay.parse_transcript(recorded[source]), "✅ End of recorded call", True
+            else:
+                turns, done, escape = conversation, "✅ Appointment booked! John Smith - Cleaning - Tue Jan 28, 10am - Dr. Chen", False
+            st.markdown(replay.render(
+                turns,
+                {
+                    "ai": '<div class="chat-ai"><strong>{speaker}</strong><br>{message}</div>',
+                    "user": '<div class="chat-patient"><strong>{speaker}</strong><br>{message}</div>',
+                },
+                interval=1.5, done=done, play=st.session_state.demo_play, escape=escape
+            ), unsafe_allow_html=True)
 
 # ============================================================================
 # TAB 2: APPOINTMENTS
 # ============================================================================
 
-with tab2:
+with tab2, profiler.span("tab: Appointments"):
     st.markdown('<div class="section-title">📅 Appointments</div>', unsafe_allow_html=True)
     
     if appointments:
         # Prepare data
-        apt_data = []
-        for apt in appointments:
-            patient_name = apt.get("patient", {}).get("name", "Available Slot") if apt.get("patient") else "Available Slot"
-            clinic_name = apt.get("clinic", {}).get("name", "-") if apt.get("clinic") else "-"
-            service = apt.get("service_type", "-")
-            date = apt.get("appointment_date", "")[:10]
-            status = apt.get("status", "scheduled").upper()
-            
-            # Estimate revenue
-            revenue = 0
-            for svc, price in service_prices.items():
-                if svc.lower() in service.lower():
-                    revenue = price
-                    break
-            
-            apt_data.append({
-                "Patient": patient_name,
-                "Service": service,
-                "Date": date,
-                "Status": status,
-                "Clinic": clinic_name,
-                "Revenue": f"${revenue}"
-            })
-        
-        df = pd.DataFrame(apt_data)
+        apt_df = kpis.appointments_frame(appointments, PRICING)
+        df = pd.DataFrame({
+            "Patient": apt_df["patient_name"].where(apt_df["booked"], "Available Slot").fillna("Available Slot"),
+            "Service": apt_df["service_type"].fillna("-"),
+            "Date": apt_df["date"].fillna(""),
+            "Status": apt_df["status"].str.upper(),
+            "Clinic": apt_df["clinic_name"].fillna("-"),
+            "Revenue": "$" + apt_df["price"].astype(str)
+        })
         st.dataframe(df, use_container_width=True, hide_index=True, height=400)
         
         # Summary
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Appointments", len(appointments))
+            st.metric("Total Appointments", kpi["appointments"])
         with col2:
-            scheduled = len([a for a in apt_data if a["Status"] == "SCHEDULED"])
-            st.metric("Scheduled", scheduled)
+            st.metric("Scheduled", int((apt_df["status"] == "scheduled").sum()))
         with col3:
             st.metric("Total Revenue", f"${total_revenue:,}")
         with col4:
-            avg_per_apt = total_revenue / len(appointments) if appointments else 0
-            st.metric("Avg per Appointment", f"${avg_per_apt:.0f}")
+            st.metric("Avg per Appointment", f"${kpi['avg_ticket_all']:.0f}")
     else:
         st.info("No appointments found.")
 
@@ -492,23 +291,13 @@ with tab2:
 # TAB 3: DOCTORS
 # ============================================================================
 
-with tab3:
+with tab3, profiler.span("tab: Doctors"):
     st.markdown('<div class="section-title">👨‍⚕️ Doctors & Availability</div>', unsafe_allow_html=True)
     
-    doctors = get_doctors_from_clinics(clinics)
+    doctors = models.DEMO_DOCTORS
     
-    cols = st.columns(3)
-    for i, doc in enumerate(doctors):
-        with cols[i % 3]:
-            status = "🟢 Available" if doc["available"] else "🔴 Busy"
-            st.markdown(f"""
-            <div class="doctor-card">
-                <div style="font-size: 1.2rem; font-weight: 600; color: #f1f5f9;">{doc['name']}</div>
-                <div style="color: #7c3aed; font-size: 0.9rem;">{doc['specialty']}</div>
-                <div style="color: #64748b; font-size: 0.85rem; margin-top: 8px;">📍 {doc['clinic']}</div>
-                <div style="margin-top: 10px;">{status}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(templates.grid(templates.demo_doctor_card(doc, templates.ROSTER_DOCTOR_CARD) for doc in doctors),
+                unsafe_allow_html=True)
     
     st.markdown("---")
     st.markdown("### 📊 Appointments by Doctor")
@@ -539,7 +328,7 @@ with tab3:
 # TAB 4: REVENUE
 # ============================================================================
 
-with tab4:
+with tab4, profiler.span("tab: Revenue"):
     st.markdown('<div class="section-title">💰 Revenue Analytics</div>', unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns(3)
@@ -565,13 +354,13 @@ with tab4:
         """, unsafe_allow_html=True)
     
     with col3:
-        avg_apt = total_revenue / len(appointments) if appointments else 0
+        avg_apt = kpi["avg_ticket_all"]
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #00d4ff, #0891b2);
                     color: white; padding: 30px; border-radius: 16px; text-align: center;">
             <div style="font-size: 0.9rem; opacity: 0.9;">Avg per Appointment</div>
             <div style="font-size: 2.5rem; font-weight: 700;">${avg_apt:,.0f}</div>
-            <div style="font-size: 0.85rem; margin-top: 8px;">{len(appointments)} appointments</div>
+            <div style="font-size: 0.85rem; margin-top: 8px;">{kpi["appointments"]} appointments</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -582,17 +371,19 @@ with tab4:
     
     with col1:
         st.markdown("### Revenue by Service")
-        service_revenue = pd.DataFrame({
-            "Service": list(service_prices.keys()),
-            "Price": list(service_prices.values()),
-            "Bookings": [15, 8, 6, 20, 10, 12, 3, 25]
-        })
-        service_revenue["Total"] = service_revenue["Price"] * service_revenue["Bookings"]
-        
-        fig = px.pie(service_revenue, values="Total", names="Service",
-                     color_discrete_sequence=px.colors.sequential.Plasma)
-        fig.update_layout(template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", height=350)
-        st.plotly_chart(fig, use_container_width=True)
+        booked = kpis.appointments_frame(appointments, PRICING)
+        booked = booked[booked["booked"]]
+        if len(booked):
+            service_revenue = (booked.assign(Service=booked["service_type"].fillna("Consultation"))
+                               .groupby("Service", as_index=False)["price"].sum()
+                               .rename(columns={"price": "Total"}))
+            
+            fig = px.pie(service_revenue, values="Total", names="Service",
+                         color_discrete_sequence=px.colors.sequential.Plasma)
+            fig.update_layout(template="plotly_dark", paper_bgcolor="rgba(0,0,0,0)", height=350)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No booked appointments yet.")
     
     with col2:
         st.markdown("### Revenue Trend (Last 7 Days)")
@@ -614,7 +405,7 @@ with tab4:
 # TAB 5: ANALYTICS
 # ============================================================================
 
-with tab5:
+with tab5, profiler.span("tab: Analytics"):
     st.markdown('<div class="section-title">📊 Call Analytics</div>', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
@@ -666,7 +457,7 @@ with tab5:
 # TAB 6: ESCALATIONS
 # ============================================================================
 
-with tab6:
+with tab6, profiler.span("tab: Escalations"):
     st.markdown('<div class="section-title">🚨 Escalations & Alerts</div>', unsafe_allow_html=True)
     
     # Mock escalations
@@ -709,6 +500,8 @@ st.markdown(f"""
 <div style="text-align: center; padding: 20px 0; color: #64748b;">
     <div style="font-size: 1.5rem;">🦷</div>
     <div>DENTSI - AI Voice Agent for Dental Clinics</div>
-    <div style="font-size: 0.8rem; margin-top: 8px;">Backend: {API_BASE} | Powered by OpenAI + Twilio + Deepgram + ElevenLabs</div>
+    <div style="font-size: 0.8rem; margin-top: 8px;">Backend: {client.api_base()} | Powered by OpenAI + Twilio + Deepgram + ElevenLabs</div>
 </div>
 """, unsafe_allow_html=True)
+
+profiler.finish()
@@ -0,0 +1,198 @@
+"""
+Service pricing engine for the Dentsi dashboards.
+
+Prices are loaded from knowledge_base/service_catalog.txt and matched
+against free-text appointment service types with a single compiled
+pattern. When several catalog names occur in a service type the longest
+one wins, so "Deep Cleaning" is priced as a deep cleaning rather than a
+regular one regardless of catalog order.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CATALOG_PATH = Path(__file__).resolve().parent.parent / "knowledge_base" / "service_catalog.txt"
+
+DEFAULT_PRICE = 100
+DEFAULT_DURATION = 60
+
+# Appointments in these states bring in no revenue (headline KPIs and
+# rollups alike)
+NO_REVENUE_STATUSES = frozenset({"cancelled", "canceled", "no-show", "no_show", "rescheduled"})
+
+# Short service names used by the booking flow, mapped to the catalog
+# entry whose price they carry.
+SERVICE_ALIASES = {
+    "Cleaning": "Regular Cleaning (Prophylaxis)",
+    "Deep Cleaning": "Deep Cleaning (Scaling & Root Planing)",
+    "Checkup": "Routine Checkup / Exam",
+    "Exam": "Routine Checkup / Exam",
+    "Consultation": "Routine Checkup / Exam",
+    "Filling": "Dental Filling (Composite/Tooth-Colored)",
+    "Crown": "Dental Crown (Porcelain)",
+    "Root Canal": "Root Canal - Molar",
+    "Extraction": "Simple Tooth Extraction",
+    "Whitening": "Professional Teeth Whitening (In-Office)",
+    # A single implant; the package adds abutment and crown (own catalog names)
+    "Implant": "Single Dental Implant (Implant Only)",
+    "Emergency": "Emergency Exam",
+}
+
+# Used when the catalog file is not available (e.g. a partial checkout)
+FALLBACK_PRICES = {
+    "Regular Cleaning": 120, "Deep Cleaning": 250, "Cleaning": 120,
+    "Dental Filling": 250, "Filling": 250, "Crown Placement": 1200,
+    "Crown": 1200, "Root Canal": 1500, "Tooth Extraction": 300,
+    "Extraction": 300, "Teeth Whitening": 400, "Whitening": 400,
+    "Dental Implant": 3500, "Implant": 3500, "Emergency Visit": 200,
+    "Emergency": 200, "Consultation": 75, "Checkup": 75
+}
+
+_PRICE_RE = re.compile(r"\$([\d,]+(?:\.\d+)?)")
+_MINUTES_RE = re.compile(r"(\d+)\s*minutes?")
+
+
+def parse_catalog(text):
+    """Parse the service catalog into a list of service dicts.
+
+    Each entry is a title line followed by "- Price:" / "- Duration:" lines.
+    Price ranges ("$200-$300") are priced at their midpoint; entries without
+    a dollar amount ("Varies") are skipped.
+    """
+    services = []
+    section = None
+    title = None
+    current = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if line.startswith("==="):
+            section = line.strip("= ").title()
+            title = None
+            continue
+        if not line.startswith("-"):
+            title = line
+            current = None
+            continue
+        if title is None:
+            continue
+
+        key, _, value = line[1:].partition(":")
+        key = key.strip().lower()
+        if key == "price":
+            amounts = [float(m.replace(",", "")) for m in _PRICE_RE.findall(value)]
+            if not amounts:
+                continue
+            current = {
+                "name": title,
+                "category": section,
+                "price": round(sum(amounts[:2]) / len(amounts[:2])),
+                "duration_minutes": None,
+            }
+            services.append(current)
+        elif key == "duration" and current is not None:
+            minutes = _MINUTES_RE.search(value)
+            if minutes:
+                current["duration_minutes"] = int(minutes.group(1))
+
+    return services
+
+
+def earns_revenue(status):
+    """False for cancelled, no-show and rescheduled appointments"""
+    return (status or "").lower() not in NO_REVENUE_STATUSES
+
+
+def _base_name(title):
+    """'Dental Crown (Porcelain)' -> 'Dental Crown'"""
+    return re.sub(r"\s*\(.*?\)", "", title).strip()
+
+
+class PricingEngine:
+    """Longest-match service pricing over a compiled alternation of service names."""
+
+    def __init__(self, prices, default=DEFAULT_PRICE, services=None, durations=None):
+        # prices: {service name: price}, durations: {service name: minutes}
+        self.default = default
+        self.services = services or []
+        self._prices = {name.lower(): price for name, price in prices.items()}
+        self._durations = {name.lower(): minutes for name, minutes in (durations or {}).items()}
+
+        patterns = sorted(self._prices, key=len, reverse=True)
+        alternation = "|".join(re.escape(p) for p in patterns)
+        # The lookahead reports a (possibly overlapping) match at every
+        # position; longest-first ordering makes each one the longest name
+        # starting there.
+        self._matcher = re.compile(rf"(?=\b({alternation})\b)") if patterns else None
+        self.price = lru_cache(maxsize=4096)(self._price)
+        self.duration = lru_cache(maxsize=4096)(self._duration)
+
+    def match(self, service_type):
+        """Longest catalog name found in service_type (lowercased), or None"""
+        if not service_type or self._matcher is None:
+            return None
+        matches = self._matcher.findall(service_type.lower())
+        return max(matches, key=len) if matches else None
+
+    def _price(self, service_type):
+        name = self.match(service_type)
+        return self._prices[name] if name else self.default
+
+    def _duration(self, service_type):
+        """Catalog duration in minutes, DEFAULT_DURATION if unknown"""
+        return self._durations.get(self.match(service_type)) or DEFAULT_DURATION
+
+    def prices(self, service_types):
+        """Vector of prices for a sequence of service types.
+
+        Each distinct service string is matched once; the result is
+        broadcast back with a single take.
+        """
+        values = pd.Series(service_types, dtype=object).fillna("")
+        codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            return np.zeros(len(values), dtype=np.int64)
+        unique_prices = np.fromiter((self.price(s) for s in uniques), dtype=np.int64, count=len(uniques))
+        return unique_prices[codes]
+
+    def total(self, service_types):
+        return int(self.prices(service_types).sum())
+
+
+def build_engine(services, aliases=SERVICE_ALIASES, default=DEFAULT_PRICE):
+    """Build an engine from parsed catalog services plus short-name aliases."""
+    by_title = {s["name"]: s for s in services}
+    prices, durations = {}, {}
+    for s in services:
+        # First occurrence wins for variants sharing a base name
+        # (e.g. the porcelain crown is listed before metal ones)
+        base = _base_name(s["name"])
+        if base not in prices:
+            prices[base] = s["price"]
+            durations[base] = s["duration_minutes"]
+    for alias, title in aliases.items():
+        if title in by_title:
+            prices[alias] = by_title[title]["price"]
+            durations[alias] = by_title[title]["duration_minutes"]
+    return PricingEngine(prices, default=default, services=services, durations=durations)
+
+
+def load_engine(path=CATALOG_PATH):
+    """Load the pricing engine from the service catalog file."""
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return PricingEngine(FALLBACK_PRICES)
+    return build_engine(parse_catalog(text))
+
+
+@lru_cache(maxsize=None)
+def default_engine():
+    """Process-wide engine loaded from the default catalog path."""
+    return load_engine()
@@ -0,0 +1,309 @@
+"""
+Rerun profiler for the Dentsi dashboards.
+
+A Run is started at the top of each script rerun; sections and fetchers
+then record nested spans into it:
+
+    profiler.begin("dentsi_app", profiler.history(st.session_state))
+
+    @profiler.timed("fetch_clinics", cached=True)    # above the cache decorator
+    @sized_cache.cached(ttl=30)
+    def fetch_clinics():
+        with profiler.upstream("/clinics"):
+            r = requests.get(...)
+
+    with tab1, profiler.span("tab: Appointments"):
+        ...
+
+A cached fetch span is a miss when an upstream call ran inside it (the
+cached body executed) and a hit otherwise. The current run lives in a
+context variable, so it follows the script thread and costs nothing when
+no run was begun. Finished runs are kept in a small per-session ring for
+the debug panel (waterfall and JSON export).
+
+Each run is also a W3C trace: it has a trace id, every span a span id,
+and trace_headers() gives the traceparent header for the innermost open
+span, to be sent with backend requests (tracing.py exports the spans).
+
+Finished runs and every backend call (including calls made outside a
+run, e.g. from a worker thread) are also handed to the callbacks added
+with on_finish() / on_upstream(); metrics.py aggregates them.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+MAX_RUNS = 20
+
+HISTORY_KEY = "profiler_runs"
+
+_current = contextvars.ContextVar("profiler_run", default=None)
+
+_finish_hooks = []
+_upstream_hooks = []
+
+
+class Span:
+    """One timed block inside a run."""
+
+    __slots__ = ("name", "kind", "start", "end", "depth", "attrs", "span_id", "parent_id")
+
+    def __init__(self, name, kind, start, depth, attrs, parent_id):
+        self.name = name
+        self.kind = kind
+        self.start = start
+        self.end = None
+        self.depth = depth
+        self.attrs = attrs
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+
+    @property
+    def duration(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class Run:
+    """Spans recorded during one script rerun."""
+
+    def __init__(self, label):
+        self.id = uuid.uuid4().hex[:12]
+        self.trace_id = os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.label = label
+        self.wall = time.time()
+        self.start = time.perf_counter()
+        self.end = None
+        self.spans = []
+        self._stack = []
+
+    def open(self, name, kind, attrs):
+        parent = self._stack[-1].span_id if self._stack else self.span_id
+        span = Span(name, kind, time.perf_counter(), len(self._stack), attrs, parent)
+        self.spans.append(span)
+        self._stack.append(span)
+        return span
+
+    def close(self, span):
+        span.end = time.perf_counter()
+        if self._stack and self._stack[-1] is span:
+            self._stack.pop()
+        elif span in self._stack:
+            self._stack.remove(span)
+
+    def parent(self):
+        return self._stack[-1] if self._stack else None
+
+    def finish(self, end=None):
+        if self.end is None:
+            self.end = end or time.perf_counter()
+            for span in self._stack:
+                span.end = self.end
+            self._stack.clear()
+            for hook in _finish_hooks:
+                try:
+                    hook(self)
+                except Exception:
+                    pass
+        return self
+
+    def last_activity(self):
+        """Latest time anything was recorded (for runs that never reached finish)"""
+        return max([self.start] + [s.end if s.end is not None else s.start for s in self.spans])
+
+    @property
+    def duration(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "trace_id": self.trace_id,
+            "label": self.label,
+            "started_at": self.wall,
+            "duration_ms": round(self.duration * 1000, 3),
+            "spans": waterfall(self),
+        }
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+def history(state, maxlen=MAX_RUNS):
+    """The per-session ring of recent runs (created in state on first use)"""
+    runs = state.get(HISTORY_KEY)
+    if runs is None:
+        runs = deque(maxlen=maxlen)
+        state[HISTORY_KEY] = runs
+    return runs
+
+
+def begin(label, runs=None):
+    """Start recording a rerun; the previous run of this thread is finished"""
+    previous = _current.get()
+    if previous is not None:
+        previous.finish()
+    # Each rerun gets a fresh script thread, so a run cut short by
+    # st.rerun()/st.stop() is only found through the session's history
+    if runs and runs[-1].end is None:
+        abandoned = runs[-1]
+        abandoned.finish(abandoned.last_activity())
+    run = Run(label)
+    _current.set(run)
+    if runs is not None:
+        runs.append(run)
+    return run
+
+
+def current():
+    """The run being recorded, or None (fragment reruns do not begin a run)"""
+    run = _current.get()
+    return run if run is not None and run.end is None else None
+
+
+def finish():
+    """End the current run (spans still open are closed with it)"""
+    run = _current.get()
+    if run is not None:
+        run.finish()
+    return run
+
+
+@contextmanager
+def span(name, kind="section", **attrs):
+    run = current()
+    if run is None:
+        yield None
+        return
+    s = run.open(name, kind, attrs)
+    try:
+        yield s
+    finally:
+        run.close(s)
+
+
+def timed(name=None, kind="fetch", cached=False):
+    """Decorator: a span per call. cached=True for functions under
+    sized_cache.cached or st.cache_resource - put it above the cache decorator."""
+    def decorate(fn):
+        label = name or getattr(fn, "__name__", "call")
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            run = current()
+            if run is None:
+                return fn(*args, **kwargs)
+            s = run.open(label, kind, {"cache": "hit"} if cached else {})
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                run.close(s)
+
+        # Keep st.cache_* helpers such as .clear() reachable
+        if hasattr(fn, "clear"):
+            wrapper.clear = fn.clear
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def upstream(endpoint, method="GET"):
+    """Span for one backend request; marks the enclosing cached fetch as a miss"""
+    run = current()
+    if run is None:
+        # Outside a rerun (worker threads): only the callbacks see it
+        started, error = time.perf_counter(), None
+        try:
+            yield None
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            _notify_upstream(None, endpoint, method, time.perf_counter() - started, error)
+        return
+    parent = run.parent()
+    if parent is not None and parent.attrs.get("cache") == "hit":
+        parent.attrs["cache"] = "miss"
+    s = run.open(f"{method} {endpoint}", "upstream", {"endpoint": endpoint, "method": method})
+    try:
+        yield s
+    except Exception as e:
+        s.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        run.close(s)
+        _notify_upstream(run, endpoint, method, s.duration, s.attrs.get("error"))
+
+
+def trace_headers():
+    """{"traceparent": ...} naming the innermost open span as parent; {} outside a run"""
+    run = current()
+    if run is None:
+        return {}
+    parent = run.parent()
+    return {"traceparent": f"00-{run.trace_id}-{parent.span_id if parent else run.span_id}-01"}
+
+
+# ============================================================================
+# CALLBACKS
+# ============================================================================
+
+def on_finish(fn):
+    """Call fn(run) whenever a run finishes"""
+    if fn not in _finish_hooks:
+        _finish_hooks.append(fn)
+    return fn
+
+
+def on_upstream(fn):
+    """Call fn(run_or_None, endpoint, method, seconds, error) after every backend request"""
+    if fn not in _upstream_hooks:
+        _upstream_hooks.append(fn)
+    return fn
+
+
+def _notify_upstream(run, endpoint, method, seconds, error):
+    for hook in _upstream_hooks:
+        try:
+            hook(run, endpoint, method, seconds, error)
+        except Exception:
+            pass
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def waterfall(run):
+    """Spans as rows with start/duration in ms relative to the run start"""
+    return [{
+        "name": s.name,
+        "kind": s.kind,
+        "depth": s.depth,
+        "start_ms": round((s.start - run.start) * 1000, 3),
+        "duration_ms": round(s.duration * 1000, 3),
+        **s.attrs,
+    } for s in run.spans]
+
+
+def summary(run):
+    """Totals for a run: wall time, fetch time, upstream time and cache hits/misses"""
+    fetches = [s for s in run.spans if s.kind == "fetch"]
+    return {
+        "duration_ms": round(run.duration * 1000, 1),
+        "fetch_ms": round(sum(s.duration for s in fetches) * 1000, 1),
+        "upstream_ms": round(sum(s.duration for s in run.spans if s.kind == "upstream") * 1000, 1),
+        "cache_hits": sum(1 for s in fetches if s.attrs.get("cache") == "hit"),
+        "cache_misses": sum(1 for s in fetches if s.attrs.get("cache") == "miss"),
+    }
+
+
+def export_json(runs):
+    return json.dumps([run.to_dict() for run in runs], indent=2)
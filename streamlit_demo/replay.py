@@ -0,0 +1,107 @@
+"""
+Conversation replay for the Dentsi dashboards.
+
+Scripted demo conversations (and recorded call transcripts) are played
+back in the browser: the whole conversation is rendered once as a single
+HTML block in which each turn fades in after a CSS animation delay, with
+a progress bar and a closing banner on the same clock. Playback needs no
+sleeps, no reruns and no backend calls - the server emits one markdown
+element per play.
+"""
+
+import html
+import re
+
+DEFAULT_INTERVAL = 1.5
+
+STYLE = """
+<style>
+    @keyframes replay-in {
+        from { opacity: 0; transform: translateY(6px); }
+        to { opacity: 1; transform: none; }
+    }
+    @keyframes replay-fill {
+        from { width: 0; }
+        to { width: 100%; }
+    }
+    .replay-turn {
+        opacity: 0;
+        animation: replay-in 0.3s ease-out forwards;
+    }
+    .replay-progress {
+        height: 6px;
+        margin: 8px 0 12px 0;
+        border-radius: 3px;
+        background: rgba(148, 163, 184, 0.2);
+        overflow: hidden;
+    }
+    .replay-progress div {
+        height: 100%;
+        width: 0;
+        background: linear-gradient(90deg, #7c3aed, #00d4ff);
+        animation: replay-fill linear forwards;
+    }
+    .replay-done {
+        padding: 12px 16px;
+        border-radius: 8px;
+        background: rgba(16, 185, 129, 0.15);
+        color: #10b981;
+        font-weight: 600;
+    }
+</style>
+"""
+
+_SPEAKER_RE = re.compile(r"^\s*([A-Za-z][\w .]{0,30}):\s*(.*)$")
+
+
+def parse_transcript(text, ai_speakers=("Dentsi", "Dentra", "AI", "Assistant")):
+    """Turns (role, speaker, message) from a stored call transcript.
+
+    Calls are saved as "Dentsi: ..." / "Patient: ..." lines; lines without
+    a speaker prefix continue the previous turn.
+    """
+    turns = []
+    for line in (text or "").splitlines():
+        match = _SPEAKER_RE.match(line)
+        if match:
+            speaker, message = match.group(1).strip(), match.group(2).strip()
+            role = "ai" if speaker in ai_speakers else "user"
+            turns.append((role, speaker, message))
+        elif line.strip() and turns:
+            role, speaker, message = turns[-1]
+            turns[-1] = (role, speaker, f"{message} {line.strip()}")
+    return turns
+
+
+def _bubble(templates, role, speaker, message, escape):
+    template = templates.get(role) or templates["user"]
+    if escape:
+        speaker, message = html.escape(speaker), html.escape(message)
+    return template.format(speaker=speaker, message=message)
+
+
+def render(turns, templates, interval=DEFAULT_INTERVAL, done=None, play=0, escape=False):
+    """One HTML block that plays the conversation at `interval` seconds per turn.
+
+    templates maps a role to a format string with {speaker} and {message}.
+    interval=None renders the turns statically. `done` is shown once the last
+    turn is in; change `play` to restart the animation.
+    """
+    if interval is None:
+        return "".join(_bubble(templates, r, s, m, escape) for r, s, m in turns)
+
+    total = max(len(turns) - 1, 0) * interval
+    parts = [STYLE, f'<div class="replay" data-play="{play}">']
+    parts.append(f'<div class="replay-progress"><div style="animation-duration: {total:.2f}s;"></div></div>')
+    for i, (role, speaker, message) in enumerate(turns):
+        parts.append(
+            f'<div class="replay-turn" style="animation-delay: {i * interval:.2f}s;">'
+            f'{_bubble(templates, role, speaker, message, escape)}</div>'
+        )
+    if done:
+        parts.append(
+            f'<div class="replay-turn" style="animation-delay: {total + interval / 2:.2f}s;">'
+            f'<div class="replay-done">{done}</div></div>'
+        )
+    parts.append('</div>')
+    return "".join(parts)
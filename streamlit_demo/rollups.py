@@ -0,0 +1,197 @@
+"""
+Incrementally maintained revenue rollups for the Dentsi dashboards.
+
+Booked appointments are aggregated into (clinic, doctor, service, day)
+buckets holding revenue and appointment count; cancelled, no-show and
+rescheduled ones earn nothing. Each appointment's contribution is
+remembered, so when a fetch returns a new or edited appointment only the
+buckets it leaves and enters are touched; unchanged records cost one dict
+lookup, and appointments missing from a fetch are retracted from the
+clinic and date window that fetch covered. Charts then aggregate the
+(small) bucket table instead of the raw appointments.
+
+A rollup is meant to live for the whole process (st.cache_resource) and
+is safe to share between sessions.
+"""
+
+import threading
+from datetime import date, timedelta
+
+import pandas as pd
+
+import pricing
+
+BUCKET_COLUMNS = ["clinic", "doctor", "service", "day", "revenue", "appointments"]
+
+UNKNOWN = "Unknown"
+
+
+def _signature(apt):
+    """Fields that decide which bucket an appointment lands in and what it adds"""
+    return (
+        apt.get("updated_at"), apt.get("status"), apt.get("service_type"),
+        apt.get("appointment_date"), apt.get("doctor_id"), apt.get("clinic_id"),
+        bool(apt.get("patient")),
+    )
+
+
+def _clinic(apt):
+    return apt.get("clinic_id") or (apt.get("clinic") or {}).get("id") or UNKNOWN
+
+
+def _day(apt):
+    return (apt.get("appointment_date") or "")[:10] or UNKNOWN
+
+
+def _bucket(apt):
+    # Doctors are bucketed by id (names are joined on for display)
+    clinic = _clinic(apt)
+    doctor = apt.get("doctor_id") or (apt.get("doctor") or {}).get("name") or UNKNOWN
+    service = apt.get("service_type") or UNKNOWN
+    return (clinic, doctor, service, _day(apt))
+
+
+class RevenueRollup:
+    """Revenue and booking counts per (clinic, doctor, service, day) bucket."""
+
+    def __init__(self, engine=None):
+        self.engine = engine or pricing.default_engine()
+        self.version = 0
+        self._buckets = {}       # bucket -> [revenue, appointments]
+        self._contrib = {}       # appointment id -> (signature, bucket, revenue, clinic, day)
+        self._lock = threading.Lock()
+        self._frame = None
+        self._frame_version = -1
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _retract(self, apt_id):
+        _, bucket, revenue, _, _ = self._contrib.pop(apt_id)
+        if bucket is None:
+            return
+        totals = self._buckets[bucket]
+        totals[0] -= revenue
+        totals[1] -= 1
+        if totals[1] == 0:
+            del self._buckets[bucket]
+
+    def _apply(self, apt_id, apt, signature):
+        # Only booked, still-standing appointments carry revenue; the rest are
+        # remembered so an unchanged one is not re-examined on the next sync
+        if not apt.get("patient") or not pricing.earns_revenue(apt.get("status")):
+            self._contrib[apt_id] = (signature, None, 0, _clinic(apt), _day(apt))
+            return
+        bucket = _bucket(apt)
+        revenue = self.engine.price(apt.get("service_type"))
+        totals = self._buckets.setdefault(bucket, [0, 0])
+        totals[0] += revenue
+        totals[1] += 1
+        self._contrib[apt_id] = (signature, bucket, revenue, bucket[0], bucket[3])
+
+    def add(self, apt):
+        """Fold in one new or edited appointment. Returns True if a bucket changed."""
+        apt_id = apt.get("id")
+        if apt_id is None:
+            return False
+        signature = _signature(apt)
+        with self._lock:
+            previous = self._contrib.get(apt_id)
+            if previous is not None and previous[0] == signature:
+                return False
+            if previous is not None:
+                self._retract(apt_id)
+            self._apply(apt_id, apt, signature)
+            self.version += 1
+        return True
+
+    def remove(self, apt_id):
+        """Drop an appointment's contribution (e.g. after it was deleted)"""
+        with self._lock:
+            if apt_id not in self._contrib:
+                return False
+            self._retract(apt_id)
+            self.version += 1
+        return True
+
+    def sync(self, appointments, clinic=None, start=None, end=None):
+        """Bring the rollup in line with a fetched appointment list.
+
+        Only appointments that are new or whose signature changed are
+        re-bucketed. The list is taken as complete for `clinic` (every
+        clinic when None) and the days start..end (dates, open-ended when
+        None), so only a list fetched for exactly that window may be
+        passed: appointments remembered inside the window that are no
+        longer listed are retracted. Returns the number of appointments
+        applied or retracted.
+        """
+        changed = 0
+        seen = set()
+        for apt in appointments or []:
+            seen.add(apt.get("id"))
+            if self.add(apt):
+                changed += 1
+        first = start.isoformat() if start is not None else None
+        last = end.isoformat() if end is not None else None
+        with self._lock:
+            gone = [apt_id for apt_id, (_, _, _, apt_clinic, day) in self._contrib.items()
+                    if apt_id not in seen and (clinic is None or apt_clinic == clinic)
+                    and (first is None or day >= first) and (last is None or day <= last)]
+            for apt_id in gone:
+                self._retract(apt_id)
+            if gone:
+                self.version += 1
+        return changed + len(gone)
+
+    def frame(self):
+        """Bucket table as a DataFrame, rebuilt only when the rollup changed"""
+        with self._lock:
+            if self._frame_version != self.version:
+                rows = [key + tuple(totals) for key, totals in self._buckets.items()]
+                frame = pd.DataFrame(rows, columns=BUCKET_COLUMNS)
+                frame["day"] = pd.to_datetime(frame["day"], errors="coerce")
+                self._frame = frame
+                self._frame_version = self.version
+            return self._frame
+
+    def query(self, start=None, end=None, clinic=None):
+        """Buckets with start <= day <= end, optionally for one clinic id"""
+        frame = self.frame()
+        mask = pd.Series(True, index=frame.index)
+        if start is not None:
+            mask &= frame["day"] >= pd.Timestamp(start)
+        if end is not None:
+            mask &= frame["day"] <= pd.Timestamp(end)
+        if clinic is not None:
+            mask &= frame["clinic"] == clinic
+        return frame[mask]
+
+    def totals(self, start=None, end=None, clinic=None):
+        """(revenue, appointments) over a day range"""
+        buckets = self.query(start, end, clinic)
+        return int(buckets["revenue"].sum()), int(buckets["appointments"].sum())
+
+    def by(self, dimension, start=None, end=None, clinic=None):
+        """Revenue and appointments grouped by one bucket dimension"""
+        buckets = self.query(start, end, clinic)
+        return (
+            buckets.groupby(dimension, as_index=False)[["revenue", "appointments"]]
+            .sum()
+            .sort_values("revenue", ascending=False)
+        )
+
+    def daily(self, start, end, clinic=None):
+        """Revenue per day over [start, end], with zero-revenue days filled in"""
+        buckets = self.query(start, end, clinic)
+        days = pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq="D")
+        series = buckets.groupby("day")["revenue"].sum().reindex(days, fill_value=0)
+        return pd.DataFrame({"Date": days, "Revenue": series.to_numpy()})
+
+
+def period_bounds(days, today=None):
+    """(start, end, previous start, previous end) for the last `days` days"""
+    today = today or date.today()
+    start = today - timedelta(days=days - 1)
+    prev_end = start - timedelta(days=1)
+    prev_start = prev_end - timedelta(days=days - 1)
+    return start, today, prev_start, prev_end
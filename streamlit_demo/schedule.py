@@ -0,0 +1,169 @@
+"""
+Appointment interval index for the Dentsi dashboards.
+
+Each booked appointment becomes a [start, end) interval built from
+appointment_date, start_time and duration_minutes. Intervals are kept in
+sorted arrays per clinic and per (clinic, doctor), together with a
+running maximum of end times, so "what overlaps this window" and "what is
+on this day" are answered with two bisects plus a scan of the hits.
+Day, week and agenda views and availability checks are built on top.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+
+DEFAULT_START = time(9, 0)
+DEFAULT_DURATION = 60
+
+# Appointments in these states no longer occupy the chair
+INACTIVE_STATUSES = {"cancelled", "no-show", "rescheduled"}
+
+
+def parse_start(apt):
+    """Start datetime from appointment_date plus the optional "HH:MM" start_time"""
+    raw = apt.get("appointment_date")
+    if not raw:
+        return None
+    try:
+        day = date.fromisoformat(raw[:10])
+    except ValueError:
+        return None
+    start_time = apt.get("start_time")
+    if start_time:
+        try:
+            hours, minutes = start_time.split(":")[:2]
+            return datetime.combine(day, time(int(hours), int(minutes)))
+        except ValueError:
+            pass
+    # No start_time: fall back to the timestamp's own time unless it is midnight
+    if len(raw) >= 16 and raw[11:16] != "00:00":
+        try:
+            hours, minutes = int(raw[11:13]), int(raw[14:16])
+            return datetime.combine(day, time(hours, minutes))
+        except ValueError:
+            pass
+    return datetime.combine(day, DEFAULT_START)
+
+
+def to_interval(apt, doctor_names=None):
+    """{"start", "end", ...} view of a booked appointment, or None if it has no date
+
+    Dashboard payloads carry only doctor_id; doctor_names ({id: name}) names the doctor.
+    """
+    start = parse_start(apt)
+    if start is None:
+        return None
+    duration = apt.get("duration_minutes") or DEFAULT_DURATION
+    patient = apt.get("patient") or {}
+    doctor = apt.get("doctor") or {}
+    return {
+        "id": apt.get("id"),
+        "start": start,
+        "end": start + timedelta(minutes=int(duration)),
+        "clinic_id": apt.get("clinic_id"),
+        "doctor_id": apt.get("doctor_id"),
+        "doctor": doctor.get("name") or (doctor_names or {}).get(apt.get("doctor_id")) or "Unassigned",
+        "patient": patient.get("name") or "Unknown",
+        "service": apt.get("service_type") or "Appointment",
+        "status": (apt.get("status") or "scheduled").lower(),
+    }
+
+
+class IntervalIndex:
+    """Intervals sorted by start with a prefix maximum of end times."""
+
+    def __init__(self, intervals):
+        self.intervals = sorted(intervals, key=lambda i: (i["start"], i["end"]))
+        self.starts = [i["start"] for i in self.intervals]
+        self.max_end = []
+        running = None
+        for interval in self.intervals:
+            running = interval["end"] if running is None or interval["end"] > running else running
+            self.max_end.append(running)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def overlapping(self, start, end):
+        """Intervals with interval.start < end and interval.end > start"""
+        # Everything before `lo` ends at or before `start`; everything from
+        # `hi` on starts at or after `end`
+        lo = bisect_right(self.max_end, start)
+        hi = bisect_left(self.starts, end)
+        return [i for i in self.intervals[lo:hi] if i["end"] > start]
+
+
+class ScheduleIndex:
+    """Interval indexes per clinic and per (clinic, doctor)."""
+
+    def __init__(self, appointments, doctor_names=None):
+        intervals = []
+        for apt in appointments or []:
+            if not apt.get("patient"):
+                continue
+            interval = to_interval(apt, doctor_names)
+            if interval is not None:
+                intervals.append(interval)
+
+        by_clinic, by_doctor = {}, {}
+        for interval in intervals:
+            by_clinic.setdefault(interval["clinic_id"], []).append(interval)
+            by_doctor.setdefault((interval["clinic_id"], interval["doctor_id"]), []).append(interval)
+
+        self.all = IntervalIndex(intervals)
+        self.clinics = {k: IntervalIndex(v) for k, v in by_clinic.items()}
+        self.doctors = {k: IntervalIndex(v) for k, v in by_doctor.items()}
+        self.doctor_names = {
+            doctor_id: v[0]["doctor"] for (_, doctor_id), v in by_doctor.items() if doctor_id
+        }
+
+    def _index(self, clinic_id=None, doctor_id=None):
+        if doctor_id is not None:
+            if clinic_id is not None:
+                return self.doctors.get((clinic_id, doctor_id))
+            # Doctor without clinic: merge that doctor's indexes across clinics
+            parts = [idx.intervals for (_, d), idx in self.doctors.items() if d == doctor_id]
+            return IntervalIndex([i for part in parts for i in part])
+        if clinic_id is not None:
+            return self.clinics.get(clinic_id)
+        return self.all
+
+    def overlapping(self, start, end, clinic_id=None, doctor_id=None, include_inactive=False):
+        """Appointments overlapping [start, end), optionally for one clinic / doctor"""
+        index = self._index(clinic_id, doctor_id)
+        if index is None:
+            return []
+        hits = index.overlapping(start, end)
+        if not include_inactive:
+            hits = [i for i in hits if i["status"] not in INACTIVE_STATUSES]
+        return hits
+
+    def day(self, day, clinic_id=None, doctor_id=None):
+        """Appointments on one calendar day, in start order"""
+        start = datetime.combine(day, time.min)
+        return self.overlapping(start, start + timedelta(days=1), clinic_id, doctor_id)
+
+    def week(self, day, clinic_id=None, doctor_id=None):
+        """{date: [appointments]} for the Monday-Sunday week containing day"""
+        monday = day - timedelta(days=day.weekday())
+        return self.agenda(monday, 7, clinic_id, doctor_id)
+
+    def agenda(self, first_day, days, clinic_id=None, doctor_id=None):
+        """{date: [appointments]} for `days` consecutive days (empty days included)"""
+        start = datetime.combine(first_day, time.min)
+        result = {first_day + timedelta(days=n): [] for n in range(days)}
+        for interval in self.overlapping(start, start + timedelta(days=days), clinic_id, doctor_id):
+            # Attribute each appointment to the day it starts on (or the first
+            # day of the window if it began before)
+            key = max(interval["start"].date(), first_day)
+            if key in result:
+                result[key].append(interval)
+        return result
+
+    def conflicts(self, doctor_id, start, duration_minutes, clinic_id=None):
+        """Active appointments of a doctor that a new booking would overlap"""
+        end = start + timedelta(minutes=duration_minutes)
+        return self.overlapping(start, end, clinic_id, doctor_id)
+
+    def is_available(self, doctor_id, start, duration_minutes, clinic_id=None):
+        return not self.conflicts(doctor_id, start, duration_minutes, clinic_id)
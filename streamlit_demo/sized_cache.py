@@ -0,0 +1,238 @@
+"""
+Memory-bounded cache for the dashboards' API fetchers.
+
+st.cache_data keeps one entry per argument combination with no limit on
+their number or size, so a long-running replica grows with every clinic
+and page size it has ever served. Fetchers use this cache instead:
+
+    @sized_cache.cached(ttl=30)
+    def fetch_appointments(clinic_id=None, limit=50):
+        ...
+
+Values are frozen (frozen.py) and shared: every session gets the same
+read-only objects on a hit, with no unpickling or copying, and an
+accidental in-place change raises instead of leaking into other
+sessions. Sizes are estimated while freezing (frozen.freeze_sized).
+All fetchers share one process-wide budget; when it is exceeded the
+least recently used (or, with DENTSI_CACHE_POLICY=lfu, least frequently
+used) entries are evicted.
+stats() reports occupancy per fetcher, hits, misses and evictions.
+
+    DENTSI_CACHE_BUDGET_MB=1024  total budget (default 512)
+    DENTSI_CACHE_POLICY=lru      lru (default) or lfu
+"""
+
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+import frozen
+
+BUDGET_ENV = "DENTSI_CACHE_BUDGET_MB"
+POLICY_ENV = "DENTSI_CACHE_POLICY"
+
+DEFAULT_BUDGET_MB = 512
+POLICIES = ("lru", "lfu")
+
+# Bookkeeping per entry on top of the value (key tuple, entry record)
+ENTRY_OVERHEAD = 200
+
+
+def deep_size(obj, seen=None):
+    """Approximate retained size of obj in bytes (containers, objects, frames, arrays)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    memory_usage = getattr(obj, "memory_usage", None)
+    if callable(memory_usage) and hasattr(obj, "columns"):
+        try:
+            return int(memory_usage(deep=True).sum())
+        except Exception:
+            pass
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_size(item, seen) for item in obj)
+    else:
+        if hasattr(obj, "__dict__"):
+            size += deep_size(vars(obj), seen)
+        for slot in getattr(type(obj), "__slots__", ()):
+            size += deep_size(getattr(obj, slot, None), seen)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires", "hits", "used")
+
+    def __init__(self, value, size, expires):
+        self.value = value
+        self.size = size + ENTRY_OVERHEAD
+        self.expires = expires
+        self.hits = 0
+        self.used = time.monotonic()
+
+
+class SizedCache:
+    """Byte-budgeted LRU/LFU cache shared by many functions (namespaces)."""
+
+    def __init__(self, budget_bytes, policy="lru"):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown cache policy {policy!r} (expected one of {POLICIES})")
+        self.budget = budget_bytes
+        self.policy = policy
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.oversize = 0
+        self._entries = OrderedDict()   # (namespace, key) -> _Entry, least recently used first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, namespace, key):
+        """(True, value) on a hit, (False, None) on a miss or an expired entry"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None or (entry.expires is not None and entry.expires <= now):
+                if entry is not None:
+                    self._drop((namespace, key))
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end((namespace, key))
+            entry.hits += 1
+            entry.used = now
+            self.hits += 1
+            return True, entry.value
+
+    def put(self, namespace, key, value, ttl=None):
+        """Store value frozen; returns it, or None if it is larger than the whole budget"""
+        value, size = frozen.freeze_sized(value, deep_size)
+        entry = _Entry(value, size, time.monotonic() + ttl if ttl else None)
+        with self._lock:
+            if (namespace, key) in self._entries:
+                self._drop((namespace, key))
+            if entry.size > self.budget:
+                self.oversize += 1
+                return None
+            self._entries[(namespace, key)] = entry
+            self.bytes += entry.size
+            self._evict()
+        return value
+
+    def clear(self, namespace=None):
+        with self._lock:
+            for full_key in [k for k in self._entries if namespace is None or k[0] == namespace]:
+                self._drop(full_key)
+
+    def _drop(self, full_key):
+        self.bytes -= self._entries.pop(full_key).size
+
+    def _evict(self):
+        """Drop expired entries, then victims by policy, until within budget (lock held)"""
+        if self.bytes <= self.budget:
+            return
+        now = time.monotonic()
+        for full_key in [k for k, e in self._entries.items() if e.expires is not None and e.expires <= now]:
+            self._drop(full_key)
+        while self.bytes > self.budget and self._entries:
+            if self.policy == "lfu":
+                victim = min(self._entries, key=lambda k: (self._entries[k].hits, self._entries[k].used))
+            else:
+                victim = next(iter(self._entries))
+            self._drop(victim)
+            self.evictions += 1
+
+    def stats(self):
+        """Occupancy overall and per namespace, plus hit/miss/eviction counts"""
+        with self._lock:
+            namespaces = {}
+            for (namespace, _), entry in self._entries.items():
+                ns = namespaces.setdefault(namespace, {"entries": 0, "bytes": 0})
+                ns["entries"] += 1
+                ns["bytes"] += entry.size
+            total = self.hits + self.misses
+            return {
+                "policy": self.policy,
+                "budget_bytes": self.budget,
+                "bytes": self.bytes,
+                "occupancy": self.bytes / self.budget if self.budget else 0.0,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "oversize": self.oversize,
+                "namespaces": namespaces,
+            }
+
+
+# ============================================================================
+# PROCESS-WIDE CACHE
+# ============================================================================
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """The process-wide cache, sized from DENTSI_CACHE_BUDGET_MB / DENTSI_CACHE_POLICY"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                budget_mb = float(os.environ.get(BUDGET_ENV) or DEFAULT_BUDGET_MB)
+                policy = (os.environ.get(POLICY_ENV) or "lru").lower()
+                _cache = SizedCache(int(budget_mb * 2 ** 20), policy)
+    return _cache
+
+
+def clear():
+    """Empty the process-wide cache (every fetcher)"""
+    get_cache().clear()
+
+
+def stats():
+    return get_cache().stats()
+
+
+def cached(ttl=None, name=None):
+    """Decorator: memoize fn by its (bound) arguments in the process-wide cache.
+
+    The result is returned frozen, on a miss too. Arguments must be hashable. The namespace is the function's file and
+    name, so same-named fetchers of different apps do not share entries.
+    """
+    def decorate(fn):
+        signature = inspect.signature(fn)
+        namespace = name or f"{os.path.basename(fn.__code__.co_filename)}:{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+            cache = get_cache()
+            hit, value = cache.get(namespace, key)
+            if hit:
+                return value
+            value = fn(*args, **kwargs)
+            stored = cache.put(namespace, key, value, ttl)
+            return stored if stored is not None else frozen.freeze(value)
+
+        wrapper.clear = lambda: get_cache().clear(namespace)
+        wrapper.namespace = namespace
+        return wrapper
+    return decorate
@@ -0,0 +1,186 @@
+"""
+Free-slot finder for the Dentsi dashboards.
+
+Each doctor's weekly `available_hours` JSON ({"mon": ["9:00-12:00", ...]})
+is compiled once into a 7 x 96 bit integer, one bit per 15-minute slot.
+Booked appointments are compiled the same way into a mask per
+(doctor, date). A day's free slots are then `hours & ~booked`, and the
+start positions that fit a service of k slots are `free & free >> 1 &
+... & free >> (k-1)` - a handful of integer operations per doctor-day
+instead of walking the calendar minute by minute.
+"""
+
+import json
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+import schedule
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Used for doctors with no (or unparseable) available_hours, matching the
+# backend's 9am-5pm weekday slot generation
+DEFAULT_HOURS = {day: ["9:00-17:00"] for day in WEEKDAYS[:5]}
+
+HORIZON_DAYS = 60
+
+
+def _slot(hhmm):
+    hours, minutes = hhmm.strip().split(":")
+    return (int(hours) * 60 + int(minutes)) // SLOT_MINUTES
+
+
+def _range_mask(first, last):
+    """Bits first..last-1 set"""
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def compile_hours(available_hours):
+    """Weekly bitset from an available_hours JSON string or dict (bit = weekday * 96 + slot)"""
+    hours = available_hours
+    if isinstance(hours, str):
+        try:
+            hours = json.loads(hours)
+        except ValueError:
+            hours = None
+    if not hours:
+        hours = DEFAULT_HOURS
+
+    week = 0
+    for day, periods in hours.items():
+        key = day[:3].lower()
+        if key not in WEEKDAYS:
+            continue
+        offset = WEEKDAYS.index(key) * SLOTS_PER_DAY
+        for period in periods or []:
+            try:
+                start, end = period.split("-")
+                week |= _range_mask(_slot(start), min(_slot(end), SLOTS_PER_DAY)) << offset
+            except ValueError:
+                continue
+    return week
+
+
+def fits(free, length):
+    """Bits j where slots j..j+length-1 are all free"""
+    starts = free
+    for shift in range(1, length):
+        starts &= free >> shift
+    return starts
+
+
+def _bits(mask):
+    """Set bit positions, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class SlotEngine:
+    """Compiled weekly hours and booked masks for a set of doctors."""
+
+    def __init__(self, doctors, appointments=None):
+        self.doctors = {}
+        for doc in doctors or []:
+            if not doc.get("id") or doc.get("is_active") is False:
+                continue
+            self.doctors[doc["id"]] = {
+                "name": doc.get("name") or "Doctor",
+                "clinic_id": doc.get("clinic_id") or (doc.get("clinic") or {}).get("id"),
+                "week": compile_hours(doc.get("available_hours")),
+            }
+
+        self.booked = {}
+        for apt in appointments or []:
+            doctor_id = apt.get("doctor_id")
+            if doctor_id not in self.doctors or not apt.get("patient"):
+                continue
+            interval = schedule.to_interval(apt)
+            if interval is None or interval["status"] in schedule.INACTIVE_STATUSES:
+                continue
+            day = interval["start"].date()
+            start_minutes = interval["start"].hour * 60 + interval["start"].minute
+            end_minutes = start_minutes + int((interval["end"] - interval["start"]).total_seconds() // 60)
+            # Partially covered slots count as booked
+            mask = _range_mask(start_minutes // SLOT_MINUTES, min(-(-end_minutes // SLOT_MINUTES), SLOTS_PER_DAY))
+            key = (doctor_id, day)
+            self.booked[key] = self.booked.get(key, 0) | mask
+
+    def free_mask(self, doctor_id, day):
+        """Free 15-minute slots of one doctor on one date"""
+        doc = self.doctors.get(doctor_id)
+        if doc is None:
+            return 0
+        hours = (doc["week"] >> (day.weekday() * SLOTS_PER_DAY)) & DAY_MASK
+        return hours & ~self.booked.get((doctor_id, day), 0)
+
+    def next_free_slots(self, duration_minutes, n=5, after=None, doctor_id=None, clinic_id=None,
+                        weekdays=None, window=None, horizon_days=HORIZON_DAYS):
+        """The next n free starts (earliest first) that fit duration_minutes.
+
+        weekdays restricts to a set of weekday numbers (Mon=0); window is an
+        optional (start time, end time) the appointment must fit inside.
+        """
+        after = after or datetime.now()
+        length = max(1, -(-duration_minutes // SLOT_MINUTES))
+        window_mask = DAY_MASK
+        if window is not None:
+            lo = (window[0].hour * 60 + window[0].minute) // SLOT_MINUTES
+            hi = (window[1].hour * 60 + window[1].minute) // SLOT_MINUTES
+            window_mask = _range_mask(lo, hi)
+
+        doctor_ids = [
+            d for d, doc in self.doctors.items()
+            if (doctor_id is None or d == doctor_id) and (clinic_id is None or doc["clinic_id"] in (clinic_id, None))
+        ]
+        slots = []
+        for offset in range(horizon_days):
+            day = after.date() + timedelta(days=offset)
+            if weekdays is not None and day.weekday() not in weekdays:
+                continue
+            day_mask = window_mask
+            if offset == 0:
+                # Nothing that starts before `after`
+                first = -(-(after.hour * 60 + after.minute) // SLOT_MINUTES)
+                day_mask &= ~_range_mask(0, first)
+            day_slots = []
+            for d in doctor_ids:
+                starts = fits(self.free_mask(d, day) & day_mask, length)
+                # No doctor can contribute more than n slots to the answer
+                day_slots.extend((bit, d) for bit in islice(_bits(starts), n))
+            day_slots.sort()
+            for bit, d in day_slots:
+                start = datetime.combine(day, time()) + timedelta(minutes=bit * SLOT_MINUTES)
+                slots.append({
+                    "doctor_id": d,
+                    "doctor": self.doctors[d]["name"],
+                    "start": start,
+                    "end": start + timedelta(minutes=duration_minutes),
+                })
+                if len(slots) >= n:
+                    return slots
+        return slots
+
+
+def format_slot(slot, today=None):
+    """'Tuesday at 10:00 AM with Dr. Chen' (or 'today' / 'tomorrow')"""
+    today = today or date.today()
+    day = slot["start"].date()
+    if day == today:
+        when = "today"
+    elif day == today + timedelta(days=1):
+        when = "tomorrow"
+    elif day - today < timedelta(days=7):
+        when = WEEKDAY_NAMES[day.weekday()]
+    else:
+        when = f"{WEEKDAY_NAMES[day.weekday()]}, {day:%B} {day.day}"
+    clock = slot["start"].strftime("%I:%M %p").lstrip("0")
+    return f"{when} at {clock} with Dr. {slot['doctor'].split()[-1]}"
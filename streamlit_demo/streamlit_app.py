@@ -0,0 +1,22 @@
+"""
+Dentsi dashboards as one multipage app.
+
+    streamlit run streamlit_app.py
+
+Every view is a page in pages/ and all of them run in this one server
+process, sharing the dentsi_dashboard package: one warm fetcher cache,
+one backend connection pool and one set of engines for all views,
+instead of a server, a cold cache and a copy of the code per dashboard.
+"""
+
+import streamlit as st
+
+PAGES = [
+    st.Page("pages/dentsi_app.py", title="Operations", icon="✨", default=True),
+    st.Page("pages/dentsi_complete.py", title="Voice Demo", icon="📞"),
+    st.Page("pages/dentsi_overview.py", title="Overview", icon="🦷"),
+    st.Page("pages/dentra_app.py", title="DENTRA Showcase", icon="🤖"),
+    st.Page("pages/app.py", title="DENTRA Classic", icon="📋"),
+]
+
+st.navigation(PAGES).run()
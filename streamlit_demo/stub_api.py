@@ -0,0 +1,494 @@
+"""
+Local stand-in for the Dentsi backend, for offline runs and benchmarks.
+
+Serves the endpoints the dashboards call, with the response shapes of
+the NestJS controllers in nodejs_space/src, from a synthetic.py data set
+held in memory. Point an app at it with DENTSI_API_BASE:
+
+    python stub_api.py --rows 10000 --port 8765
+    DENTSI_API_BASE=http://127.0.0.1:8765 streamlit run streamlit_app.py
+
+--rows sets the number of appointments and calls (patients are a fifth
+of that); --clinics, --patients, --appointments and --calls override
+single tables. The browser demo endpoints (/webhook/demo, /start and
+/stream) answer from the pricing catalog and the knowledge base.
+
+Slow or flaky backends are emulated per request:
+
+    --latency lognormal:80,0.5   delay before each response (ms): a fixed
+                                 number, uniform:LO,HI, normal:MEAN,SD or
+                                 lognormal:MEDIAN,SIGMA
+    --error-rate 0.05            share of requests answered with a 500
+                                 (never /health)
+    --token-ms 40                delay between streamed reply tokens
+
+--log-requests prints each request with its status and the W3C
+traceparent the dashboards send (see tracing.py).
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+import knowledge
+import pricing
+import synthetic
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_ROWS = 1000
+
+# Encoded responses kept per (path, query); /calls alone is ~110 MB of JSON at 100k rows
+RESPONSE_CACHE_SIZE = 32
+
+
+def sizes_for(rows, **overrides):
+    """synthetic.generate sizes for a stub with `rows` appointments and calls"""
+    sizes = {"patients": max(rows // 5, 10), "appointments": rows, "calls": rows}
+    sizes.update({k: v for k, v in overrides.items() if v is not None})
+    return sizes
+
+
+def _records(df):
+    """JSON-ready rows: ISO timestamps like Prisma's, None for missing values"""
+    out = {}
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        values = values.astype(object)
+        out[column] = values.where(values.notna(), None).tolist()
+    columns = list(out)
+    return [dict(zip(columns, row)) for row in zip(*out.values())]
+
+
+def _timestamp(value):
+    """A query date/datetime in the records' ISO format, None if missing or invalid"""
+    if not value:
+        return None
+    try:
+        ts = pd.Timestamp(value)
+    except ValueError:
+        return None
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.strftime("%Y-%m-%dT%H:%M:%S.") + f"{ts.microsecond // 1000:03d}Z"
+
+
+def _int(query, name, default):
+    try:
+        return max(int(query.get(name, default)), 1)
+    except (TypeError, ValueError):
+        return default
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+class StubData:
+    """API payloads built from one synthetic data set."""
+
+    def __init__(self, rows=DEFAULT_ROWS, seed=synthetic.DEFAULT_SEED, end=None, **sizes):
+        self.rows = rows
+        self.pricing = pricing.load_engine()
+        tables = synthetic.generate(seed=seed, end=end, **sizes_for(rows, **sizes))
+        self.clinics = _records(tables["clinic"])
+        clinics = {c["id"]: c for c in self.clinics}
+        brief_clinics = {c["id"]: {"id": c["id"], "name": c["name"], "phone": c["phone"]} for c in self.clinics}
+
+        self.doctors = _records(tables["doctor"])
+        for doctor in self.doctors:
+            doctor["clinic"] = clinics[doctor["clinic_id"]]
+
+        patients = {p["id"]: p for p in _records(tables["patient"])}
+        brief_patients = {k: {"id": k, "name": p["name"], "phone": p["phone"]} for k, p in patients.items()}
+        appointment_counts = tables["appointment"]["patient_id"].value_counts()
+        call_counts = tables["call"]["patient_id"].value_counts()
+        self.patients = [
+            dict(p, _count={"appointments": int(appointment_counts.get(k, 0)), "calls": int(call_counts.get(k, 0))})
+            for k, p in patients.items()
+        ]
+
+        # Newest first, like the controllers' orderBy
+        self.calls = _records(tables["call"])[::-1]
+        self.appointments = _records(tables["appointment"].sort_values("appointment_date", kind="stable"))
+        # /calls includes whole clinic and patient rows, the dashboard endpoints a few fields
+        self._brief_calls = {}
+        for call in self.calls:
+            call["clinic"] = clinics.get(call["clinic_id"])
+            call["patient"] = patients.get(call["patient_id"])
+            self._brief_calls[call["id"]] = (brief_clinics.get(call["clinic_id"]), brief_patients.get(call["patient_id"]))
+        for apt in self.appointments:
+            apt["clinic"] = brief_clinics.get(apt["clinic_id"])
+            apt["patient"] = brief_patients.get(apt["patient_id"])
+
+        self._routes = self.routes()
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def _brief(self, call):
+        row = dict(call)
+        row["clinic"], row["patient"] = self._brief_calls[call["id"]]
+        return row
+
+    @staticmethod
+    def _page(rows, query):
+        page, limit = _int(query, "page", 1), _int(query, "limit", 20)
+        total = len(rows)
+        return {
+            "success": True,
+            "data": rows[(page - 1) * limit:page * limit],
+            "pagination": {"page": page, "limit": limit, "total": total, "totalPages": -(-total // limit)},
+        }
+
+    @staticmethod
+    def _where(rows, query, **fields):
+        """rows whose fields match the query parameters named in fields (field=param)"""
+        for field, param in fields.items():
+            value = query.get(param)
+            if value:
+                rows = [r for r in rows if r.get(field) == value]
+        return rows
+
+    def health(self, query):
+        return {"status": "ok", "service": "DENTRA Backend (stub)", "version": "1.0.0", "rows": self.rows}
+
+    def list_calls(self, query):
+        return self._where(self.calls, query, clinic_id="clinicId", intent="intent", status="status")
+
+    def stats(self, query):
+        calls = self._where(self.calls, query, clinic_id="clinicId")
+        appointments = self._where(self.appointments, query, clinic_id="clinicId")
+        count = lambda rows, *statuses: sum(1 for r in rows if r["status"] in statuses)
+        completed, confirmed = count(calls, "completed"), count(appointments, "confirmed")
+        return {"success": True, "data": {
+            "calls": {
+                "total": len(calls),
+                "completed": completed,
+                "failed": count(calls, "failed"),
+                "escalated": count(calls, "callback", "escalated"),
+                "successRate": round(completed / len(calls) * 100, 2) if calls else 0,
+            },
+            "appointments": {
+                "total": len(appointments),
+                "confirmed": confirmed,
+                "cancelled": count(appointments, "cancelled"),
+                "confirmationRate": round(confirmed / len(appointments) * 100, 2) if appointments else 0,
+            },
+            "revenue": {
+                "estimated": float(self.pricing.prices([a["service_type"] for a in appointments
+                                                        if a["status"] == "confirmed"]).sum()),
+                "currency": "USD",
+            },
+        }}
+
+    def dashboard_calls(self, query):
+        calls = self._where(self.calls, query, clinic_id="clinicId", status="status")
+        page = self._page(calls, query)
+        page["data"] = [self._brief(c) for c in page["data"]]
+        return page
+
+    def dashboard_appointments(self, query):
+        rows = self._where(self.appointments, query, clinic_id="clinicId", status="status")
+        # startDate/endDate bound appointment_date inclusively, like the Prisma gte/lte
+        # (a bare date is midnight UTC); rows are sorted by appointment_date
+        start, end = _timestamp(query.get("startDate")), _timestamp(query.get("endDate"))
+        if start or end:
+            rows = [r for r in rows if (not start or r["appointment_date"] >= start)
+                    and (not end or r["appointment_date"] <= end)]
+        return self._page(rows, query)
+
+    def escalations(self, query):
+        calls = [c for c in self._where(self.calls, query, clinic_id="clinicId")
+                 if c["status"] in ("callback", "escalated")][::-1]
+        page = self._page(calls, query)
+        page["data"] = [self._brief(c) for c in page["data"]]
+        return page
+
+    def routes(self):
+        return {
+            "/health": self.health,
+            "/clinics": lambda query: self.clinics,
+            "/admin/doctors": lambda query: self.doctors,
+            "/patients": lambda query: self.patients,
+            "/calls": self.list_calls,
+            "/api/dashboard/stats": self.stats,
+            "/api/dashboard/calls": self.dashboard_calls,
+            "/api/dashboard/appointments": self.dashboard_appointments,
+            "/api/dashboard/escalations": self.escalations,
+        }
+
+    def respond(self, path, query_string=""):
+        """(status, JSON body) for a GET; bodies are cached, the data never changes"""
+        key = (path, query_string)
+        with self._lock:
+            body = self._bodies.get(key)
+        if body is not None:
+            return 200, body
+        route = self._routes.get(path.rstrip("/") or "/")
+        if route is None:
+            return 404, json.dumps({"statusCode": 404, "message": f"Cannot GET {path}"}).encode("utf-8")
+        query = {k: v[-1] for k, v in parse_qs(query_string).items()}
+        body = json.dumps(route(query)).encode("utf-8")
+        with self._lock:
+            if len(self._bodies) >= RESPONSE_CACHE_SIZE:
+                self._bodies.pop(next(iter(self._bodies)))
+            self._bodies[key] = body
+        return 200, body
+
+
+# ============================================================================
+# DEMO CONVERSATIONS
+# ============================================================================
+
+class DemoAgent:
+    """Browser demo sessions answered offline (pricing catalog, then the knowledge base)."""
+
+    def __init__(self, data):
+        self.data = data
+        self.sessions = {}
+        self._knowledge = None
+        self._lock = threading.Lock()
+
+    def _clinic(self, clinic_id):
+        clinics = {c["id"]: c for c in self.data.clinics}
+        return clinics.get(clinic_id) or self.data.clinics[0]
+
+    def reply(self, message):
+        text = (message or "").lower()
+        service = self.data.pricing.match(text)
+        if service and any(w in text for w in ("how much", "cost", "price")):
+            return (f"A {service} is ${self.data.pricing.price(service):,} and takes about "
+                    f"{self.data.pricing.duration(service)} minutes. Would you like to book one?")
+        if self._knowledge is None:
+            self._knowledge = knowledge.get_index()
+        found = knowledge.answer(self._knowledge, message or "")
+        if found:
+            return found
+        if service:
+            return f"I'd be happy to help you schedule a {service}! What day works best for you?"
+        return "I understand. How can I assist you further?"
+
+    def start(self, body):
+        clinic = self._clinic(body.get("clinicId"))
+        session_id = f"demo-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self.sessions[session_id] = {"clinic_id": clinic["id"], "turns": 0}
+        return {
+            "success": True,
+            "sessionId": session_id,
+            "greeting": f"Thank you for calling {clinic['name']}! This is Dentsi. How can I help you today?",
+            "clinicName": clinic["name"],
+        }
+
+    def turn(self, body):
+        session_id = body.get("sessionId") or f"demo-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            session = self.sessions.setdefault(session_id, {"clinic_id": self._clinic(body.get("clinicId"))["id"],
+                                                            "turns": 0})
+            session["turns"] += 1
+        return {"success": True, "sessionId": session_id, "response": self.reply(body.get("userMessage"))}
+
+
+# ============================================================================
+# LATENCY
+# ============================================================================
+
+def latency_sampler(spec):
+    """rng -> seconds for a --latency spec (milliseconds): "80", "uniform:20,200",
+    "normal:80,20" or "lognormal:80,0.5" (median, sigma)"""
+    spec = (spec or "0").strip()
+    kind, _, args = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+    try:
+        values = [float(v) for v in args.split(",")]
+    except ValueError:
+        raise ValueError(f"bad latency spec {spec!r}") from None
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(*values) / 1000
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(rng.gauss(*values), 0) / 1000
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: values[0] * rng.lognormvariate(0, values[1]) / 1000
+    raise ValueError(f"bad latency spec {spec!r}")
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class StubHandler(BaseHTTPRequestHandler):
+    data = None
+    demo = None
+    latency = staticmethod(latency_sampler("0"))
+    error_rate = 0.0
+    token_delay = 0.0
+    rng = random.Random()
+    log_requests = False
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def log_request(self, code="-", size="-"):
+        if self.log_requests:
+            print(f"{self.command} {self.path} {code} traceparent={self.headers.get('traceparent', '-')}",
+                  file=sys.stderr, flush=True)
+
+    def _send(self, status, body, content_type="application/json; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode("utf-8"))
+
+    def _emulate(self, path):
+        """Sleep for the latency model; True if this request should fail instead"""
+        delay = self.latency(self.rng)
+        if delay > 0:
+            time.sleep(delay)
+        if path != "/health" and self.error_rate and self.rng.random() < self.error_rate:
+            self._send_json(500, {"statusCode": 500, "message": "Internal server error"})
+            return True
+        return False
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if not self._emulate(url.path):
+            self._send(*self.data.respond(url.path, url.query))
+
+    def do_POST(self):
+        path = urlsplit(self.path).path.rstrip("/")
+        body = self._body()
+        if self._emulate(path):
+            return
+        if path == "/webhook/demo/start":
+            self._send_json(200, self.demo.start(body))
+        elif path == "/webhook/demo":
+            self._send_json(200, self.demo.turn(body))
+        elif path == "/webhook/demo/stream":
+            self._stream(self.demo.turn(body))
+        elif path == "/admin/set-active-clinic":
+            self._send_json(200, self.set_active_clinic(body))
+        else:
+            self._send_json(404, {"statusCode": 404, "message": f"Cannot POST {path}"})
+
+    def set_active_clinic(self, body):
+        """The backend's reply shape; the client sends clinic_id"""
+        clinic = next((c for c in self.data.clinics if c["id"] == body.get("clinic_id")), None)
+        if clinic is None:
+            return {"success": False, "error": "Clinic not found"}
+        return {
+            "success": True,
+            "active_clinic": {k: clinic.get(k) for k in ("id", "name", "phone", "address")},
+            "message": f"AI agent will now represent {clinic['name']}",
+        }
+
+    def do_PATCH(self):
+        path = urlsplit(self.path).path.rstrip("/")
+        body = self._body()
+        if self._emulate(path):
+            return
+        parts = path.split("/")
+        if len(parts) == 4 and parts[1] == "clinics" and parts[3] == "phone":
+            self._send_json(200, {"success": True, "clinicId": parts[2], "phone": body.get("phone")})
+        else:
+            self._send_json(404, {"statusCode": 404, "message": f"Cannot PATCH {path}"})
+
+    def _stream(self, result):
+        """The reply as Server-Sent Events: a token event per word, then done"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        words = result["response"].split(" ")
+        for i, word in enumerate(words):
+            delta = word if i == len(words) - 1 else word + " "
+            self.wfile.write(f"event: token\ndata: {json.dumps({'text': delta})}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if self.token_delay:
+                time.sleep(self.token_delay)
+        self.wfile.write(f"event: done\ndata: {json.dumps(result)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+def make_server(data, host=DEFAULT_HOST, port=DEFAULT_PORT, latency="0", error_rate=0.0, token_ms=0.0, seed=None,
+                log_requests=False):
+    """HTTP server for `data` (port 0 picks a free port: see server.server_address)"""
+    handler = type("Handler", (StubHandler,), {
+        "data": data,
+        "demo": DemoAgent(data),
+        "latency": staticmethod(latency_sampler(latency)),
+        "error_rate": error_rate,
+        "token_delay": token_ms / 1000,
+        "rng": random.Random(seed),
+        "log_requests": log_requests,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve_in_thread(data, host=DEFAULT_HOST, port=0, **knobs):
+    """Start a server on a background thread; returns (server, base_url)"""
+    server = make_server(data, host, port, **knobs)
+    threading.Thread(target=server.serve_forever, name="stub-api", daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stub of the Dentsi backend API")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="appointments and calls to serve")
+    for table in ("clinics", "patients", "appointments", "calls"):
+        parser.add_argument(f"--{table}", type=int, default=None, help=f"override the number of {table}")
+    parser.add_argument("--seed", type=int, default=synthetic.DEFAULT_SEED)
+    parser.add_argument("--latency", default="0", help="response delay in ms, e.g. 50, uniform:20,200, lognormal:80,0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with a 500")
+    parser.add_argument("--token-ms", type=float, default=0.0, help="delay between streamed reply tokens")
+    parser.add_argument("--log-requests", action="store_true", help="print each request with its traceparent")
+    args = parser.parse_args(argv)
+
+    try:
+        latency_sampler(args.latency)
+    except ValueError as e:
+        parser.error(str(e))
+    data = StubData(args.rows, args.seed, clinics=args.clinics, patients=args.patients,
+                    appointments=args.appointments, calls=args.calls)
+    server = make_server(data, args.host, args.port, latency=args.latency, error_rate=args.error_rate,
+                         token_ms=args.token_ms, seed=args.seed, log_requests=args.log_requests)
+    host, port = server.server_address[:2]
+    print(f"Stub API with {args.rows} rows on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,516 @@
+"""
+Seeded synthetic data for the Dentsi dashboards, load tests and benchmarks.
+
+Generates clinics, doctors, patients, appointments and calls with the
+columns of the matching models in nodejs_space/prisma/schema.prisma.
+Every column is drawn with vectorized NumPy operations (ids and phone
+numbers are assembled as byte matrices, repeated strings are taken from
+small pools), so millions of rows take seconds. The same seed, sizes and
+end date always give the same tables.
+
+Write a data set to Parquet (needs pyarrow) with
+
+    python synthetic.py --patients 1000000 --appointments 5000000 --calls 5000000 --out data/
+
+String columns are built straight into Arrow buffers when pyarrow is
+installed. The summary helpers at the bottom turn the tables into the small frames
+the dashboards chart (daily call volume, revenue by service, calls by
+hour, patient counts).
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import pricing
+
+try:
+    import pyarrow as pa
+except ImportError:  # string columns fall back to Python objects (much slower at scale)
+    pa = None
+
+DEFAULT_SEED = 42
+
+# Default sizes: a few clinics with about a year of history
+DEFAULT_SIZES = {
+    "clinics": 3,
+    "doctors_per_clinic": 4,
+    "patients": 1250,
+    "appointments": 6000,
+    "calls": 14000,
+    "days": 365,
+}
+
+TABLES = ["clinic", "doctor", "patient", "appointment", "call"]
+
+CLINIC_NAMES = ["SmileCare Dental", "Bright Teeth", "Downtown Dental"]
+CLINIC_PREFIXES = ["Riverside", "Lakeview", "Maple", "Summit", "Harbor", "Oak Park", "Northside", "Cedar"]
+CLINIC_SUFFIXES = ["Dental", "Family Dentistry", "Dental Care", "Smiles"]
+STREETS = ["Main St", "Oak Ave", "Elm St", "Park Blvd", "Lake Rd", "Cedar Ln", "Pine St", "Market St"]
+CITIES = ["Springfield", "Madison", "Franklin", "Greenville", "Fairview", "Salem"]
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth",
+    "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Daniel", "Nancy", "Matthew", "Lisa", "Anthony", "Betty", "Mark", "Sandra", "Steven", "Ashley",
+    "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle", "Kevin", "Carol", "Brian", "Amanda",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Chen",
+]
+
+SPECIALTIES = (["General Dentistry", "Orthodontics", "Oral Surgery", "Pediatric Dentistry", "Endodontics",
+                "Cosmetic Dentistry"], [0.5, 0.1, 0.1, 0.1, 0.1, 0.1])
+DOCTOR_HOURS = [
+    {"mon": ["9:00-12:00", "13:00-17:00"], "tue": ["9:00-12:00", "13:00-17:00"], "wed": ["9:00-12:00"],
+     "thu": ["9:00-12:00", "13:00-17:00"], "fri": ["9:00-15:00"]},
+    {"mon": ["10:00-12:00", "14:00-17:00"], "wed": ["9:00-12:00", "13:00-17:00"], "fri": ["9:00-14:00"]},
+    {"tue": ["9:00-12:00", "13:00-17:00"], "thu": ["9:00-12:00", "13:00-17:00"]},
+    {day: ["8:00-16:00"] for day in ["mon", "tue", "wed", "thu", "fri"]},
+]
+CLINIC_HOURS = json.dumps({"mon": "9-5", "tue": "9-5", "wed": "9-5", "thu": "9-5", "fri": "9-3"})
+
+INSURANCE = (["Delta Dental", "Cigna", "Aetna", "MetLife", None], [0.35, 0.15, 0.12, 0.1, 0.28])
+PREFERRED_TIMES = (["morning", "afternoon", "evening", None], [0.4, 0.35, 0.05, 0.2])
+COMMUNICATION = (["phone", "sms", "email"], [0.5, 0.35, 0.15])
+LANGUAGES = (["en", "es"], [0.85, 0.15])
+
+# Booking-flow service names (see pricing.SERVICE_ALIASES) and how often they are booked
+SERVICES = (
+    ["Cleaning", "Checkup", "Filling", "Extraction", "Whitening", "Crown", "Root Canal", "Deep Cleaning",
+     "Implant", "Emergency"],
+    [0.32, 0.14, 0.15, 0.08, 0.07, 0.06, 0.05, 0.05, 0.03, 0.05],
+)
+START_TIMES = [f"{h:02d}:{m:02d}" for h in range(9, 17) for m in (0, 30)]
+
+PAST_STATUSES = (["completed", "cancelled", "no-show", "rescheduled"], [0.8, 0.1, 0.05, 0.05])
+FUTURE_STATUSES = (["scheduled", "confirmed", "cancelled"], [0.6, 0.32, 0.08])
+
+# Relative call volume by weekday (Mon=0) and by hour of day (8am-7pm)
+WEEKDAY_WEIGHTS = [1.0, 1.0, 1.0, 1.0, 0.9, 0.4, 0.15]
+CALL_HOURS = list(range(8, 20))
+HOUR_WEIGHTS = [12, 28, 45, 52, 48, 35, 42, 55, 48, 32, 18, 8]
+
+INTENTS = (["new_appointment", "reschedule", "inquiry", "emergency", "cancel"], [450, 120, 180, 45, 35])
+# Outcome mix per intent
+OUTCOMES = {
+    "new_appointment": (["booked", "info_provided", "escalated", "dropped"], [0.78, 0.12, 0.05, 0.05]),
+    "reschedule": (["rescheduled", "escalated", "dropped"], [0.85, 0.05, 0.1]),
+    "inquiry": (["info_provided", "booked", "escalated"], [0.9, 0.05, 0.05]),
+    "emergency": (["booked", "escalated"], [0.6, 0.4]),
+    "cancel": (["cancelled", "rescheduled"], [0.9, 0.1]),
+}
+
+
+def _normalized(weights):
+    weights = np.asarray(weights, dtype=np.float64)
+    return weights / weights.sum()
+
+
+def _codes(rng, weights, n):
+    return rng.choice(len(weights), size=n, p=_normalized(weights))
+
+
+def _category(codes, values):
+    """Categorical of values[codes] without building per-row strings.
+
+    A code of -1 or a None value is missing; values may be a prebuilt
+    CategoricalDtype so large key sets are hashed once.
+    """
+    if isinstance(values, pd.CategoricalDtype):
+        return pd.Categorical.from_codes(codes, dtype=values)
+    values = list(values)
+    if None not in values:
+        return pd.Categorical.from_codes(codes, categories=values)
+    keep = [v for v in values if v is not None]
+    remap = np.cumsum([v is not None for v in values]) - 1
+    remap[[v is None for v in values]] = -1
+    return pd.Categorical.from_codes(remap[codes], categories=keep)
+
+
+def _pick(rng, choices, n):
+    """n values drawn from a (values, weights) pair"""
+    values, weights = choices
+    return _category(_codes(rng, weights, n), values)
+
+
+def _union_codes(rng, choices, n, union):
+    """Like _pick, but as codes into the `union` list of values"""
+    values, weights = choices
+    return np.array([union.index(v) for v in values])[_codes(rng, weights, n)]
+
+
+_DIGIT_GROUPS = np.frombuffer("".join(f"{i:04d}" for i in range(10000)).encode("ascii"), dtype=np.uint8).reshape(-1, 4)
+
+
+def _chars(prefix, values, width, suffix=""):
+    """prefix + zero-padded decimal values + suffix as rows of an ASCII byte matrix"""
+    values = np.asarray(values, dtype=np.int64)
+    head = np.frombuffer(prefix.encode("ascii"), dtype=np.uint8)
+    tail = np.frombuffer(suffix.encode("ascii"), dtype=np.uint8)
+    raw = np.empty((len(values), len(head) + width + len(tail)), dtype=np.uint8)
+    raw[:, :len(head)] = head
+    # Four digits per pass, looked up from a table of "0000".."9999"
+    stop = len(head) + width
+    while stop > len(head):
+        values, group = np.divmod(values, 10000)
+        start = max(len(head), stop - 4)
+        raw[:, start:stop] = _DIGIT_GROUPS[group, 4 - (stop - start):]
+        stop = start
+    raw[:, len(head) + width:] = tail
+    return raw
+
+
+def _strings(chars, valid=None):
+    """String column from a byte matrix (one row per value), missing where valid is False"""
+    n, width = chars.shape
+    if pa is None:
+        strings = chars.view(f"S{width}").ravel().astype(str).astype(object)
+        if valid is not None:
+            strings[~valid] = None
+        return strings
+    # Fixed-width rows: the matrix is the Arrow data buffer as it is
+    offsets = np.arange(n + 1, dtype=np.int64) * width
+    bitmap = None if valid is None else pa.py_buffer(np.packbits(valid, bitorder="little"))
+    array = pa.LargeStringArray.from_buffers(
+        n, pa.py_buffer(offsets), pa.py_buffer(np.ascontiguousarray(chars)), bitmap
+    )
+    return array.to_pandas()
+
+
+def _ids(prefix, n):
+    return _strings(_chars(prefix, np.arange(1, n + 1), max(6, len(str(n)))))
+
+
+def _phones(rng, n, area=555):
+    """Unique +1 numbers in one area code, as a byte matrix"""
+    if n > 10 ** 7:
+        raise ValueError("at most 10 million unique phone numbers per area code")
+    return _chars(f"+1{area}", rng.choice(10 ** 7, size=n, replace=False), 7)
+
+
+def _names(rng, n, title=""):
+    pool = [f"{title}{f} {l}" for f in FIRST_NAMES for l in LAST_NAMES]
+    return _category(rng.integers(0, len(pool), size=n), pool)
+
+
+def _clinic_names(n):
+    """The seed clinics first, then prefix x suffix combinations (numbered once they run out)"""
+    extra = [f"{p} {s}" for s in CLINIC_SUFFIXES for p in CLINIC_PREFIXES]
+    names = CLINIC_NAMES[:n]
+    for i in range(n - len(names)):
+        names.append(extra[i % len(extra)] + (f" {i // len(extra) + 1}" if i >= len(extra) else ""))
+    return names
+
+
+def _days(start, count):
+    return np.datetime64(start, "D") + np.arange(count)
+
+
+def _weekday(days):
+    """Mon=0 weekday of datetime64[D] values (1970-01-01 was a Thursday)"""
+    return (days.astype(np.int64) + 3) % 7
+
+
+def generate(seed=DEFAULT_SEED, end=None, clinics=None, doctors_per_clinic=None, patients=None,
+             appointments=None, calls=None, days=None, engine=None):
+    """{table name: DataFrame} for the clinic, doctor, patient, appointment and call models.
+
+    History covers `days` days up to `end` (today by default); upcoming
+    appointments run a further 30 days past it. Low-cardinality and foreign
+    key columns are categoricals.
+    """
+    sizes = dict(DEFAULT_SIZES)
+    sizes.update({k: v for k, v in {
+        "clinics": clinics, "doctors_per_clinic": doctors_per_clinic, "patients": patients,
+        "appointments": appointments, "calls": calls, "days": days,
+    }.items() if v is not None})
+    engine = engine or pricing.default_engine()
+    end = end or date.today()
+    rng = np.random.default_rng(seed)
+
+    n_clinics = sizes["clinics"]
+    per_clinic = sizes["doctors_per_clinic"]
+    n_doctors = n_clinics * per_clinic
+    n_patients = sizes["patients"]
+    n_days = sizes["days"]
+    first_day = np.datetime64(end - timedelta(days=n_days - 1), "D")
+    today = np.datetime64(end, "D")
+
+    # ------------------------------------------------------------------ clinics
+    clinic_ids = list(_ids("clinic-", n_clinics))
+    clinic = pd.DataFrame({
+        "id": clinic_ids,
+        "name": _clinic_names(n_clinics),
+        "phone": _strings(_phones(rng, n_clinics, area=920)),
+        "address": [f"{100 + i * 7} {STREETS[i % len(STREETS)]}, {CITIES[i % len(CITIES)]}" for i in range(n_clinics)],
+        "hours": CLINIC_HOURS,
+        "timezone": "America/New_York",
+        "is_active": True,
+        "created_at": (first_day - np.timedelta64(365, "D")).astype("datetime64[s]"),
+    }, copy=False)
+
+    # ------------------------------------------------------------------ doctors
+    doctor_clinic = np.repeat(np.arange(n_clinics), per_clinic)
+    doctor_ids = list(_ids("doctor-", n_doctors))
+    doctor = pd.DataFrame({
+        "id": doctor_ids,
+        "clinic_id": _category(doctor_clinic, clinic_ids),
+        "name": _names(rng, n_doctors, title="Dr. "),
+        "specialty": _pick(rng, SPECIALTIES, n_doctors),
+        "phone": _strings(_phones(rng, n_doctors, area=921)),
+        "email": _strings(_chars("doctor", np.arange(1, n_doctors + 1), 4, suffix="@clinic.example")),
+        "available_hours": _category(rng.integers(0, len(DOCTOR_HOURS), size=n_doctors),
+                                     [json.dumps(h) for h in DOCTOR_HOURS]),
+        "is_active": rng.random(n_doctors) < 0.95,
+        "created_at": clinic["created_at"].iloc[0],
+    }, copy=False)
+
+    # ----------------------------------------------------------------- patients
+    patient_clinic = rng.integers(0, n_clinics, size=n_patients)
+    patient_ids = _ids("patient-", n_patients)
+    patient_keys = pd.CategoricalDtype(patient_ids)
+    patient_phones = _phones(rng, n_patients)
+    insurance_codes = _codes(rng, INSURANCE[1], n_patients)
+    insured = np.array([v is not None for v in INSURANCE[0]])[insurance_codes]
+    # Patients who signed up before the window are spread over the year before it
+    created = first_day + rng.integers(-365, n_days, size=n_patients)
+    preferred = patient_clinic * per_clinic + rng.integers(0, per_clinic, size=n_patients)
+    patient = pd.DataFrame({
+        "id": patient_ids,
+        "clinic_id": _category(patient_clinic, clinic_ids),
+        "name": _names(rng, n_patients),
+        "phone": _strings(patient_phones),
+        "email": _strings(_chars("patient", np.arange(1, n_patients + 1), 7, suffix="@mail.example"),
+                          valid=rng.random(n_patients) < 0.7),
+        "date_of_birth": (today - rng.integers(4 * 365, 85 * 365, size=n_patients)).astype("datetime64[s]"),
+        "insurance_provider": _category(insurance_codes, INSURANCE[0]),
+        "insurance_id": _strings(_chars("MBR", rng.integers(0, 10 ** 8, size=n_patients), 8), valid=insured),
+        "insurance_verified": insured & (rng.random(n_patients) < 0.8),
+        "preferred_doctor_id": _category(np.where(rng.random(n_patients) < 0.6, preferred, -1), doctor_ids),
+        "preferred_time": _pick(rng, PREFERRED_TIMES, n_patients),
+        "communication_pref": _pick(rng, COMMUNICATION, n_patients),
+        "language": _pick(rng, LANGUAGES, n_patients),
+        "is_active": True,
+        "created_at": created.astype("datetime64[s]"),
+    }, copy=False)
+
+    # ------------------------------------------------------------- appointments
+    n_apts = sizes["appointments"]
+    apt_patient = rng.integers(0, n_patients, size=n_apts)
+    apt_clinic = patient_clinic[apt_patient]
+    apt_doctor = apt_clinic * per_clinic + rng.integers(0, per_clinic, size=n_apts)
+    # Weekdays only
+    open_days = _days(first_day, n_days + 30)
+    open_days = open_days[_weekday(open_days) < 5]
+    apt_day = open_days[rng.integers(0, len(open_days), size=n_apts)]
+    start_codes = rng.integers(0, len(START_TIMES), size=n_apts)
+    service_codes = _codes(rng, SERVICES[1], n_apts)
+    durations = np.array([engine.duration(s) for s in SERVICES[0]], dtype=np.int64)
+
+    statuses = PAST_STATUSES[0] + [s for s in FUTURE_STATUSES[0] if s not in PAST_STATUSES[0]]
+    status_codes = np.where(
+        apt_day < today,
+        _union_codes(rng, PAST_STATUSES, n_apts, statuses),
+        _union_codes(rng, FUTURE_STATUSES, n_apts, statuses),
+    )
+    appointment_date = apt_day.astype("datetime64[m]") + (9 * 60 + start_codes * 30).astype("timedelta64[m]")
+    booked_ahead = rng.integers(1, 30, size=n_apts).astype("timedelta64[D]")
+    appointment = pd.DataFrame({
+        "id": _ids("apt-", n_apts),
+        "clinic_id": _category(apt_clinic, clinic_ids),
+        "patient_id": _category(apt_patient, patient_keys),
+        "doctor_id": _category(apt_doctor, doctor_ids),
+        "call_id": None,
+        "appointment_date": appointment_date.astype("datetime64[s]"),
+        "start_time": _category(start_codes, START_TIMES),
+        "duration_minutes": durations[service_codes],
+        "service_type": _category(service_codes, SERVICES[0]),
+        "status": _category(status_codes, statuses),
+        "created_at": (appointment_date - booked_ahead).astype("datetime64[s]"),
+    }, copy=False)
+
+    # Visit history on the patient rows, derived from their appointments
+    completed = status_codes == statuses.index("completed")
+    patient["total_visits"] = np.bincount(apt_patient[completed], minlength=n_patients)
+    patient["no_show_count"] = np.bincount(apt_patient[status_codes == statuses.index("no-show")], minlength=n_patients)
+    last_visit = np.full(n_patients, np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(last_visit, apt_patient[completed], apt_day[completed].astype(np.int64))
+    last_visit = last_visit.astype("datetime64[D]")   # the int64 minimum is NaT
+    patient["last_visit_date"] = last_visit.astype("datetime64[s]")
+    patient["next_recall_date"] = (last_visit + np.timedelta64(182, "D")).astype("datetime64[s]")
+
+    # -------------------------------------------------------------------- calls
+    n_calls = sizes["calls"]
+    window = _days(first_day, n_days)
+    day_weights = np.array(WEEKDAY_WEIGHTS)[_weekday(window)]
+    call_day = window[_codes(rng, day_weights, n_calls)]
+    call_hour = np.array(CALL_HOURS)[_codes(rng, HOUR_WEIGHTS, n_calls)]
+    created_at = np.sort(call_day.astype("datetime64[s]")
+                         + (call_hour * 3600 + rng.integers(0, 3600, size=n_calls)).astype("timedelta64[s]"))
+
+    intent_codes = _codes(rng, INTENTS[1], n_calls)
+    outcomes = []
+    for values, _ in OUTCOMES.values():
+        outcomes.extend(v for v in values if v not in outcomes)
+    outcome_codes = np.empty(n_calls, dtype=np.int64)
+    for i, name in enumerate(INTENTS[0]):
+        mask = intent_codes == i
+        outcome_codes[mask] = _union_codes(rng, OUTCOMES[name], int(mask.sum()), outcomes)
+    escalated = outcome_codes == outcomes.index("escalated")
+    call_statuses = ["completed", "escalated", "failed"]
+    status_codes = np.where(escalated, 1, np.where(outcome_codes == outcomes.index("dropped"), 2, 0))
+
+    # Most callers are known patients; the rest call from unknown numbers
+    known = rng.random(n_calls) < 0.8
+    call_patient = rng.integers(0, n_patients, size=n_calls)
+    call_clinic = np.where(known, patient_clinic[call_patient], rng.integers(0, n_clinics, size=n_calls))
+    unknown_phones = _chars("+1555", rng.integers(0, 10 ** 7, size=n_calls), 7)
+    duration = np.clip(rng.lognormal(np.log(150), 0.5, size=n_calls), 20, 1800).astype(np.int64)
+    sentiment = np.clip(rng.normal(0.45, 0.3, size=n_calls) - 0.5 * escalated, -1, 1)
+    # A random high part keeps SIDs unguessable, the call number keeps them unique
+    width = len(str(n_calls))
+    sid = rng.integers(0, 10 ** (18 - width), size=n_calls) * 10 ** width + np.arange(n_calls)
+    call = pd.DataFrame({
+        "id": _ids("call-", n_calls),
+        "clinic_id": _category(call_clinic, clinic_ids),
+        "patient_id": _category(np.where(known, call_patient, -1), patient_keys),
+        "call_sid": _strings(_chars("CA", sid, 18)),
+        "caller_phone": _strings(np.where(known[:, None], patient_phones[call_patient], unknown_phones)),
+        "intent": _category(intent_codes, INTENTS[0]),
+        "duration": duration,
+        "talk_time": (duration * rng.uniform(0.6, 0.9, size=n_calls)).astype(np.int64),
+        "hold_time": np.where(rng.random(n_calls) < 0.1, rng.integers(5, 90, size=n_calls), 0),
+        "status": _category(status_codes, call_statuses),
+        "outcome": _category(outcome_codes, outcomes),
+        "sentiment_score": sentiment.round(2),
+        "satisfaction_score": np.where(rng.random(n_calls) < 0.3, np.clip(np.rint(3 + sentiment * 2), 1, 5), np.nan),
+        "created_at": created_at,
+    }, copy=False)
+
+    return {"clinic": clinic, "doctor": doctor, "patient": patient, "appointment": appointment, "call": call}
+
+
+# ============================================================================
+# PARQUET
+# ============================================================================
+
+def write_parquet(tables, directory, compression="snappy"):
+    """One <table>.parquet file per table; returns the paths"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, df in tables.items():
+        path = directory / f"{name}.parquet"
+        try:
+            df.to_parquet(path, index=False, compression=compression)
+        except ImportError as e:
+            raise RuntimeError("Writing Parquet needs pyarrow (pip install pyarrow)") from e
+        paths.append(path)
+    return paths
+
+
+def read_parquet(directory, tables=TABLES):
+    """Tables written by write_parquet (missing files are skipped)"""
+    directory = Path(directory)
+    return {name: pd.read_parquet(directory / f"{name}.parquet") for name in tables
+            if (directory / f"{name}.parquet").exists()}
+
+
+# ============================================================================
+# DASHBOARD SUMMARIES
+# ============================================================================
+
+def daily_calls(call, days=30, end=None):
+    """Calls per day for the last `days` days: total, booked, inquiries, emergencies, escalated"""
+    end = np.datetime64(end or date.today(), "D")
+    start = end - (days - 1)
+    day = call["created_at"].to_numpy().astype("datetime64[D]")
+    in_window = (day >= start) & (day <= end)
+    offset = (day[in_window] - start).astype(np.int64)
+
+    def per_day(column=None, value=None):
+        if column is None:
+            return np.bincount(offset, minlength=days)
+        return np.bincount(offset[(call[column] == value).to_numpy()[in_window]], minlength=days)
+
+    return pd.DataFrame({
+        "date": pd.to_datetime(_days(start, days)),
+        "total_calls": per_day(),
+        "booked": per_day("outcome", "booked"),
+        "inquiries": per_day("intent", "inquiry"),
+        "emergencies": per_day("intent", "emergency"),
+        "escalated": per_day("outcome", "escalated"),
+    })
+
+
+def revenue_by_service(appointment, engine=None):
+    """Revenue and appointment count per service over completed and upcoming appointments"""
+    engine = engine or pricing.default_engine()
+    kept = appointment["status"].isin(["completed", "scheduled", "confirmed"])
+    # Count first, then price each distinct service once
+    counts = appointment.loc[kept, "service_type"].astype(object).value_counts()
+    df = pd.DataFrame({
+        "service": counts.index.to_numpy(),
+        "revenue": engine.prices(counts.index) * counts.to_numpy(),
+        "appointments": counts.to_numpy(),
+    })
+    return df.sort_values("revenue", ascending=False, ignore_index=True)
+
+
+def hourly_calls(call, hours=CALL_HOURS):
+    """Calls per hour of day"""
+    hour = call["created_at"].dt.hour.to_numpy()
+    counts = np.bincount(hour, minlength=24)
+    return pd.DataFrame({"hour": list(hours), "calls": counts[list(hours)]})
+
+
+def patient_summary(patient, end=None):
+    """Headline patient counts"""
+    end = np.datetime64(end or date.today(), "s")
+    new = int((patient["created_at"].to_numpy() >= end - np.timedelta64(30, "D")).sum())
+    recall = patient["next_recall_date"].to_numpy()
+    return {
+        "total": len(patient),
+        "new_this_month": new,
+        "returning": len(patient) - new,
+        "with_insurance": int(patient["insurance_provider"].notna().sum()),
+        "overdue_cleaning": int((recall < end).sum()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic Dentsi data set")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="last day of history (YYYY-MM-DD)")
+    for name, value in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=value)
+    parser.add_argument("--out", default=None, help="directory for the Parquet files")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    tables = generate(
+        seed=args.seed, end=args.end, clinics=args.clinics, doctors_per_clinic=args.doctors_per_clinic,
+        patients=args.patients, appointments=args.appointments, calls=args.calls, days=args.days,
+    )
+    print(f"Generated in {time.perf_counter() - started:.2f}s")
+    for name, df in tables.items():
+        print(f"  {name:<12} {len(df):>10,} rows")
+    if args.out:
+        started = time.perf_counter()
+        paths = write_parquet(tables, args.out)
+        print(f"Wrote {len(paths)} files to {args.out} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import time
+from datetime import date
+
+import calendar_view
+import pricing
+
+ENGINE = pricing.PricingEngine({"Cleaning": 100, "Crown": 1000}, default=50)
+
+
+def appointment(day, name="Pat", service="Cleaning"):
+    return {"appointment_date": f"{day}T09:00:00.000Z", "service_type": service,
+            "patient": {"name": name, "phone": "+15550001234"}}
+
+
+def test_month_helpers():
+    assert calendar_view.shift_month(2026, 12, 1) == (2027, 1)
+    assert calendar_view.shift_month(2026, 1, -13) == (2024, 12)
+    assert calendar_view.month_bounds(2028, 2) == (date(2028, 2, 1), date(2028, 2, 29))
+    assert calendar_view.week_bounds(date(2026, 10, 8)) == (date(2026, 10, 5), date(2026, 10, 11))
+
+
+def test_date_index_range_queries():
+    index = calendar_view.DateIndex([
+        appointment("2026-10-02", "B", "Crown"), appointment("2026-10-01", "A"),
+        appointment("2026-11-01", "C"), {"appointment_date": "2026-10-01T10:00:00.000Z", "patient": None},
+    ], ENGINE)
+    assert len(index) == 3
+    assert index.count(date(2026, 10, 1), date(2026, 10, 31)) == 2
+    assert [(d, e["patient"], e["price"]) for d, e in index.range("2026-10-01", "2026-10-02")] == [
+        ("2026-10-01", "A", 100), ("2026-10-02", "B", 1000),
+    ]
+    assert list(index.by_day(date(2026, 11, 1), date(2026, 11, 30))) == ["2026-11-01"]
+    assert index.range(date(2026, 12, 1), date(2026, 12, 31)) == []
+
+
+def test_render_month_caps_appointments_per_day():
+    index = calendar_view.DateIndex([appointment("2026-10-01", f"P{n}") for n in range(5)], ENGINE)
+    html = calendar_view.render_month(index, 2026, 10, today=date(2026, 10, 1))
+    assert html.count('class="calendar-apt') == calendar_view.MAX_PER_DAY
+    assert "+2 more" in html
+    assert html.count("calendar-day-today") == 1
+
+
+def test_renderer_caches_and_prefetches_neighbours():
+    renderer = calendar_view.CalendarRenderer(size=4)
+    index = calendar_view.DateIndex([appointment("2026-10-01")], ENGINE)
+    first = renderer.render(index, "c1", 1, 2026, 10, date(2026, 10, 1))
+    assert renderer.render(None, "c1", 1, 2026, 10, date(2026, 10, 1)) is first
+
+    loaded = []
+
+    def load(year, month):
+        loaded.append((year, month))
+        return calendar_view.DateIndex([], ENGINE), 0
+
+    renderer.prefetch(load, "c1", 2026, 12, date(2026, 10, 1))
+    deadline = time.monotonic() + 5
+    while len(renderer._cache) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(loaded) == [(2026, 11), (2027, 1)]
+    assert renderer._get(("c1", 0, 2027, 1, date(2026, 10, 1))) is not None
@@ -0,0 +1,48 @@
+import copy
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+import frozen
+
+DATA = {"id": 1, "patient": {"name": "Pat"}, "tags": ["a", "b"], "pair": ({"x": 1}, 2)}
+
+
+def test_freeze_is_deep_and_read_only():
+    data = frozen.freeze(DATA)
+    assert data == DATA
+    assert isinstance(data["patient"], frozen.FrozenDict) and isinstance(data["tags"], frozen.FrozenList)
+    for change in (lambda: data.update(id=2), lambda: data["patient"].pop("name"),
+                   lambda: data["tags"].append("c"), lambda: data["pair"][0].clear()):
+        with pytest.raises(frozen.ReadOnlyError):
+            change()
+    assert frozen.freeze(data) is data
+
+
+def test_frozen_data_behaves_like_json():
+    data = frozen.freeze(DATA)
+    assert json.loads(json.dumps(data)) == json.loads(json.dumps(DATA))
+    assert pickle.loads(pickle.dumps(data)) == data
+    assert copy.deepcopy(data) is data
+
+
+def test_thaw_gives_a_mutable_copy():
+    data = frozen.thaw(frozen.freeze(DATA))
+    data["tags"].append("c")
+    assert type(data) is dict and type(data["tags"]) is list
+
+
+def test_freeze_sized_counts_shared_records_once():
+    record = {"name": "Pat"}
+    single, single_size = frozen.freeze_sized([record])
+    shared, shared_size = frozen.freeze_sized([record, record])
+    assert shared[0] is shared[1]
+    assert shared_size - single_size < frozen.freeze_sized(record)[1]
+
+
+def test_arrays_become_read_only():
+    array = frozen.freeze(np.arange(3))
+    with pytest.raises(ValueError):
+        array[0] = 5
@@ -0,0 +1,54 @@
+import kpis
+import pricing
+
+ENGINE = pricing.PricingEngine({"Cleaning": 100, "Crown": 1000}, default=50)
+
+
+def appointment(apt_id, service="Cleaning", status="scheduled", patient=True):
+    return {"id": apt_id, "service_type": service, "status": status,
+            "appointment_date": "2026-10-01T09:00:00.000Z", "patient": {"name": "Pat"} if patient else None}
+
+
+def call(call_id, outcome, status="completed", sentiment=None):
+    return {"id": call_id, "outcome": outcome, "status": status, "duration": 60, "sentiment_score": sentiment}
+
+
+def test_appointment_kpis():
+    kpi = kpis.compute_kpis([
+        appointment(1), appointment(2, "Crown", "confirmed"), appointment(3, "Crown", "cancelled"),
+        appointment(4, patient=False),
+    ], engine=ENGINE)
+    assert (kpi["appointments"], kpi["booked"], kpi["confirmed"], kpi["cancelled"]) == (4, 3, 1, 1)
+    # The cancelled crown earns nothing; the open slot only counts in the _all figures
+    assert (kpi["revenue"], kpi["avg_ticket"]) == (1100, 550)
+    assert (kpi["revenue_all"], kpi["avg_ticket_all"]) == (1200, 400)
+
+
+def test_call_kpis():
+    kpi = kpis.compute_kpis(calls=[
+        call(1, "booked", sentiment=0.9), call(2, "escalated", "escalated"), call(3, "booked", "failed"),
+        call(4, None),
+    ])
+    assert (kpi["calls"], kpi["booked_calls"], kpi["escalated_calls"], kpi["completed_calls"]) == (4, 2, 1, 2)
+    assert (kpi["booking_rate"], kpi["success_rate"]) == (50, 50)
+    assert kpi["outcome_counts"]["unknown"] == 1
+    # Missing sentiment counts as neutral
+    assert round(kpi["avg_sentiment"], 3) == 0.6
+
+
+def test_empty_inputs():
+    kpi = kpis.compute_kpis()
+    assert (kpi["booked"], kpi["revenue"], kpi["avg_ticket"], kpi["calls"], kpi["booking_rate"]) == (0, 0, 0, 0, 0)
+    assert kpi["avg_sentiment"] == 0.5
+
+
+def test_data_version_tracks_edits():
+    records = [appointment(1)]
+    assert kpis.data_version(records) == kpis.data_version([appointment(1)])
+    assert kpis.data_version(records) != kpis.data_version([appointment(1, status="cancelled")])
+    assert kpis.data_version(None) == kpis.data_version([]) == 0
+
+
+def test_results_are_memoized_by_data_version():
+    records = [appointment(1), appointment(2, "Crown")]
+    assert kpis.compute_kpis(records, engine=ENGINE) is kpis.compute_kpis(list(records), engine=ENGINE)
@@ -0,0 +1,61 @@
+import pricing
+
+CATALOG = """
+=== PREVENTIVE CARE ===
+
+Regular Cleaning (Prophylaxis)
+- Price: $120
+- Duration: 45 minutes
+
+Deep Cleaning (Scaling & Root Planing)
+- Price: $200-$300 per quadrant
+- Duration: 60 minutes
+
+Custom Treatment
+- Price: Varies
+"""
+
+
+def test_parse_catalog_prices_ranges_at_midpoint_and_skips_unpriced():
+    services = pricing.parse_catalog(CATALOG)
+    assert [(s["name"], s["price"], s["duration_minutes"]) for s in services] == [
+        ("Regular Cleaning (Prophylaxis)", 120, 45),
+        ("Deep Cleaning (Scaling & Root Planing)", 250, 60),
+    ]
+    assert services[0]["category"] == "Preventive Care"
+
+
+def test_longest_catalog_name_wins():
+    engine = pricing.build_engine(pricing.parse_catalog(CATALOG), aliases={})
+    assert engine.price("Deep Cleaning") == 250
+    assert engine.price("regular cleaning follow-up") == 120
+    assert engine.price("Something else") == pricing.DEFAULT_PRICE
+    assert engine.duration("Deep Cleaning") == 60
+    assert engine.duration("Something else") == pricing.DEFAULT_DURATION
+
+
+def test_dental_implant_is_priced_as_a_single_implant():
+    # "Implant" used to alias the complete package (implant + abutment + crown)
+    engine = pricing.default_engine()
+    assert engine.price("Dental Implant") == engine.price("Single Dental Implant") == 2000
+    assert engine.price("Implant") == 2000
+    assert engine.price("Complete Implant Package") > 2000
+
+
+def test_prices_match_each_distinct_service_once():
+    engine = pricing.PricingEngine({"Cleaning": 100, "Crown": 1000}, default=50)
+    assert engine.prices(["Cleaning", None, "Crown", "Cleaning", "Other"]).tolist() == [100, 50, 1000, 100, 50]
+    assert engine.prices([]).tolist() == []
+    assert engine.total(["Crown", "Crown"]) == 2000
+
+
+def test_load_engine_falls_back_without_a_catalog(tmp_path):
+    engine = pricing.load_engine(tmp_path / "missing.txt")
+    assert engine.price("Root Canal") == pricing.FALLBACK_PRICES["Root Canal"]
+
+
+def test_earns_revenue():
+    assert pricing.earns_revenue("scheduled")
+    assert pricing.earns_revenue(None)
+    assert not pricing.earns_revenue("Cancelled")
+    assert not pricing.earns_revenue("no-show")
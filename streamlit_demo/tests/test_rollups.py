@@ -0,0 +1,71 @@
+from datetime import date
+
+import kpis
+import pricing
+import rollups
+
+ENGINE = pricing.PricingEngine({"Cleaning": 100, "Crown": 1000}, default=50)
+
+
+def appointment(apt_id, service="Cleaning", status="scheduled", clinic="c1", patient=True, day="2026-10-01"):
+    return {
+        "id": apt_id,
+        "clinic_id": clinic,
+        "doctor_id": "d1",
+        "service_type": service,
+        "status": status,
+        "appointment_date": f"{day}T09:00:00Z",
+        "patient": {"name": "Pat"} if patient else None,
+    }
+
+
+def test_sync_buckets_booked_appointments():
+    rollup = rollups.RevenueRollup(ENGINE)
+    assert rollup.sync([appointment(1), appointment(2, "Crown"), appointment(3, patient=False)]) == 3
+    assert rollup.totals() == (1100, 2)
+    assert rollup.sync([appointment(1), appointment(2, "Crown"), appointment(3, patient=False)]) == 0
+
+
+def test_cancelled_and_no_show_earn_nothing():
+    rollup = rollups.RevenueRollup(ENGINE)
+    rollup.sync([appointment(1, status="cancelled"), appointment(2, status="No-Show"), appointment(3)])
+    assert rollup.totals() == (100, 1)
+
+    # Cancelling a booked appointment retracts its revenue
+    rollup.sync([appointment(1, status="cancelled"), appointment(2, status="No-Show"), appointment(3, status="cancelled")])
+    assert rollup.totals() == (0, 0)
+    assert len(rollup) == 0
+
+
+def test_sync_retracts_deleted_appointments():
+    rollup = rollups.RevenueRollup(ENGINE)
+    rollup.sync([appointment(1), appointment(2, "Crown"), appointment(3, patient=False)])
+    assert rollup.sync([appointment(1)]) == 2
+    assert rollup.totals() == (100, 1)
+    assert set(rollup._contrib) == {1}
+
+
+def test_sync_for_one_clinic_keeps_the_others():
+    rollup = rollups.RevenueRollup(ENGINE)
+    rollup.sync([appointment(1, clinic="c1"), appointment(2, "Crown", clinic="c2")])
+    rollup.sync([], clinic="c1")
+    assert rollup.totals() == (1000, 1)
+    assert rollup.totals(clinic="c2") == (1000, 1)
+
+
+def test_sync_only_retracts_inside_the_fetched_window():
+    rollup = rollups.RevenueRollup(ENGINE)
+    rollup.sync([appointment(1, day="2026-01-05"), appointment(2, "Crown", day="2026-10-01")])
+    # A fetch of October alone says nothing about January
+    rollup.sync([], clinic="c1", start=date(2026, 10, 1), end=date(2026, 10, 31))
+    assert rollup.totals() == (100, 1)
+    rollup.sync([], clinic="c1", start=date(2026, 1, 1), end=date(2026, 1, 31))
+    assert rollup.totals() == (0, 0)
+
+
+def test_rollup_and_kpis_agree_on_revenue():
+    apts = [appointment(1), appointment(2, "Crown", status="cancelled"), appointment(3, status="no-show"),
+            appointment(4, "Crown", status="completed"), appointment(5, patient=False)]
+    rollup = rollups.RevenueRollup(ENGINE)
+    rollup.sync(apts)
+    assert kpis.compute_kpis(apts, engine=ENGINE)["revenue"] == rollup.totals()[0] == 1100
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+
+import schedule
+
+
+def appointment(apt_id, doctor_id, start="2026-10-05T09:00:00.000Z", minutes=60, status="scheduled"):
+    return {
+        "id": apt_id, "clinic_id": "c1", "doctor_id": doctor_id, "appointment_date": start,
+        "start_time": start[11:16], "duration_minutes": minutes, "status": status,
+        "service_type": "Cleaning", "patient": {"name": "Pat"},
+    }
+
+
+def test_doctor_names_are_joined_by_id():
+    index = schedule.ScheduleIndex(
+        [appointment(1, "d1"), appointment(2, "d2"), appointment(3, "d3")],
+        {"d1": "Dr. Chen", "d2": "Dr. Chen"},
+    )
+    # Same name, different doctors: still two entries; unknown ids stay unassigned
+    assert index.doctor_names == {"d1": "Dr. Chen", "d2": "Dr. Chen", "d3": "Unassigned"}
+    assert [a["doctor"] for a in index.day(date(2026, 10, 5), doctor_id="d1")] == ["Dr. Chen"]
+
+
+def test_conflicts_only_count_active_overlaps():
+    index = schedule.ScheduleIndex([
+        appointment(1, "d1"),
+        appointment(2, "d1", start="2026-10-05T11:00:00.000Z", status="cancelled"),
+    ])
+    assert not index.is_available("d1", datetime(2026, 10, 5, 9, 30), 30)
+    assert index.is_available("d1", datetime(2026, 10, 5, 10, 0), 30)
+    assert index.is_available("d1", datetime(2026, 10, 5, 11, 0), 60)
+    assert index.is_available("d2", datetime(2026, 10, 5, 9, 0), 60)
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+import frozen
+import sized_cache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = sized_cache.SizedCache(10_000)
+    monkeypatch.setattr(sized_cache, "_cache", cache)
+    return cache
+
+
+def test_cached_memoizes_by_bound_arguments(cache):
+    calls = []
+
+    @sized_cache.cached()
+    def fetch(clinic_id=None, limit=20):
+        calls.append((clinic_id, limit))
+        return [{"clinic": clinic_id}]
+
+    first = fetch("c1")
+    assert fetch("c1", limit=20) is first
+    assert fetch(clinic_id="c1", limit=50) is not first
+    assert calls == [("c1", 20), ("c1", 50)]
+    assert isinstance(first, frozen.FrozenList)
+    with pytest.raises(frozen.ReadOnlyError):
+        first[0]["clinic"] = "c2"
+
+    fetch.clear()
+    fetch("c1")
+    assert len(calls) == 3
+
+
+def test_entries_expire_after_ttl(cache):
+    cache.put("ns", "k", "value", ttl=0.01)
+    assert cache.get("ns", "k") == (True, "value")
+    time.sleep(0.02)
+    assert cache.get("ns", "k") == (False, None)
+    assert cache.bytes == 0
+
+
+def test_lru_eviction_keeps_within_budget(cache):
+    for n in range(3):
+        cache.put("ns", n, "x" * 3000)
+    cache.get("ns", 0)
+    cache.put("ns", 3, "x" * 3000)
+    assert cache.bytes <= cache.budget
+    assert cache.get("ns", 1) == (False, None)
+    assert cache.get("ns", 0)[0]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lfu_evicts_the_least_used():
+    cache = sized_cache.SizedCache(10_000, policy="lfu")
+    for n in range(3):
+        cache.put("ns", n, "x" * 3000)
+    cache.get("ns", 0)
+    cache.get("ns", 2)
+    cache.put("ns", 3, "x" * 3000)
+    assert cache.get("ns", 1) == (False, None)
+
+
+def test_oversize_values_are_not_stored(cache):
+    assert cache.put("ns", "big", "x" * 20_000) is None
+    assert len(cache) == 0 and cache.stats()["oversize"] == 1
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        sized_cache.SizedCache(1, policy="fifo")
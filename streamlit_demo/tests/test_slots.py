@@ -0,0 +1,54 @@
+from datetime import date, datetime, time
+
+import slots
+
+MONDAY = date(2026, 10, 5)
+
+DOCTORS = [
+    {"id": "d1", "name": "Dr. Amy Chen", "clinic_id": "c1", "available_hours": '{"mon": ["9:00-10:00"]}'},
+    {"id": "d2", "name": "Dr. Bo Diaz", "clinic_id": "c2", "available_hours": {"tuesday": ["13:00-14:00"]}},
+    {"id": "d3", "name": "Dr. Off", "clinic_id": "c1", "is_active": False},
+]
+
+
+def booking(start, minutes, status="scheduled"):
+    return {
+        "id": start, "doctor_id": "d1", "appointment_date": f"{MONDAY}T{start}:00.000Z", "start_time": start,
+        "duration_minutes": minutes, "status": status, "patient": {"name": "Pat"},
+    }
+
+
+def test_compile_hours():
+    week = slots.compile_hours('{"mon": ["9:00-9:30"], "bad": ["1:00-2:00"]}')
+    assert list(slots._bits(week)) == [36, 37]
+    # Unparseable hours fall back to weekdays 9-5
+    assert slots.compile_hours("not json") == slots.compile_hours(slots.DEFAULT_HOURS)
+
+
+def test_fits():
+    assert slots.fits(0b1110111, 3) == 0b0010001
+
+
+def test_booked_slots_are_not_free():
+    engine = slots.SlotEngine(DOCTORS, [booking("09:15", 20), booking("09:45", 15, status="cancelled")])
+    assert "d3" not in engine.doctors
+    # 9:15-9:35 covers two slots; the cancelled booking frees its slot again
+    assert list(slots._bits(engine.free_mask("d1", MONDAY))) == [36, 39]
+
+
+def test_next_free_slots():
+    engine = slots.SlotEngine(DOCTORS, [booking("09:15", 15)])
+    found = engine.next_free_slots(30, n=3, after=datetime.combine(MONDAY, time(8)))
+    assert [(s["doctor_id"], s["start"]) for s in found] == [
+        ("d1", datetime(2026, 10, 5, 9, 30)),
+        ("d2", datetime(2026, 10, 6, 13, 0)),
+        ("d2", datetime(2026, 10, 6, 13, 15)),
+    ]
+    assert engine.next_free_slots(30, n=1, after=datetime.combine(MONDAY, time(8)), clinic_id="c2")[0]["doctor_id"] == "d2"
+    assert engine.next_free_slots(30, after=datetime.combine(MONDAY, time(9, 40)), weekdays={0}, horizon_days=7) == []
+
+
+def test_format_slot():
+    slot = {"start": datetime(2026, 10, 6, 13, 0), "doctor": "Dr. Bo Diaz"}
+    assert slots.format_slot(slot, today=MONDAY) == "tomorrow at 1:00 PM with Dr. Diaz"
+    assert slots.format_slot(slot, today=date(2026, 9, 1)) == "Tuesday, October 6 at 1:00 PM with Dr. Diaz"
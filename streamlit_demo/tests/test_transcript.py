@@ -0,0 +1,23 @@
+import os
+import time
+
+import transcript
+
+
+def test_turns_are_escaped():
+    ai = transcript.render_turn({"role": "ai", "message": "<img src=x onerror=alert(1)>\nBye"})
+    user = transcript.render_turn({"role": "user", "message": "<b>hi</b>"})
+    assert "<img" not in ai and "&lt;img" in ai and "<br>Bye" in ai
+    assert "<b>" not in user and "&lt;b&gt;hi" in user
+
+
+def test_archive_prunes_idle_and_excess_files(tmp_path):
+    archive = transcript.TranscriptArchive(tmp_path, max_age=60, max_files=2)
+    for key in ("a", "b", "c", "d"):
+        archive.append(key, {"role": "user", "message": key})
+    now = time.time()
+    os.utime(tmp_path / "a.jsonl", (now - 120, now - 120))
+    os.utime(tmp_path / "b.jsonl", (now - 30, now - 30))
+    os.utime(tmp_path / "c.jsonl", (now - 20, now - 20))
+    assert archive.prune(now) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["c.jsonl", "d.jsonl"]
@@ -0,0 +1,202 @@
+"""
+Trace export for the Dentsi dashboards.
+
+Every profiler run is one trace: the rerun is the root span, sections,
+fetchers and backend requests are its children, and the backend receives
+the W3C traceparent of its request span (profiler.trace_headers()), so
+its logs can be joined with the rerun that caused them.
+
+Finished runs are exported as OTLP/JSON (ExportTraceServiceRequest):
+
+    DENTSI_TRACE_FILE=traces.jsonl      one request per line (the OpenTelemetry
+                                        Collector file exporter's format)
+    DENTSI_OTLP_ENDPOINT=http://localhost:4318
+                                        POSTed to {endpoint}/v1/traces from a
+                                        background thread
+
+    python tracing.py traces.jsonl      # print the traces in a file as trees
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import urllib.request
+
+import profiler
+
+FILE_ENV = "DENTSI_TRACE_FILE"
+OTLP_ENV = "DENTSI_OTLP_ENDPOINT"
+
+SERVICE_NAME = "dentsi-streamlit"
+
+# OTLP SpanKind: backend requests are CLIENT spans, everything else INTERNAL
+SPAN_KIND = {"upstream": 3}
+SPAN_KIND_INTERNAL = 1
+STATUS_ERROR = 2
+
+# Traces waiting for the OTLP thread; dropped (not blocking reruns) when full
+QUEUE_SIZE = 256
+
+
+def _attribute(key, value):
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _unix_nano(run, t):
+    return str(int((run.wall + (t - run.start)) * 1e9))
+
+
+def to_otlp(run):
+    """One run as an OTLP/JSON ExportTraceServiceRequest"""
+    spans = [{
+        "traceId": run.trace_id,
+        "spanId": run.span_id,
+        "name": f"rerun {run.label}",
+        "kind": SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": _unix_nano(run, run.start),
+        "endTimeUnixNano": _unix_nano(run, run.start + run.duration),
+        "attributes": [_attribute("dentsi.app", run.label)],
+    }]
+    for s in run.spans:
+        span = {
+            "traceId": run.trace_id,
+            "spanId": s.span_id,
+            "parentSpanId": s.parent_id,
+            "name": s.name,
+            "kind": SPAN_KIND.get(s.kind, SPAN_KIND_INTERNAL),
+            "startTimeUnixNano": _unix_nano(run, s.start),
+            "endTimeUnixNano": _unix_nano(run, s.start + s.duration),
+            "attributes": [_attribute("dentsi.kind", s.kind)]
+                          + [_attribute(f"dentsi.{k}", v) for k, v in s.attrs.items()],
+        }
+        if "error" in s.attrs:
+            span["status"] = {"code": STATUS_ERROR, "message": str(s.attrs["error"])}
+        spans.append(span)
+    return {"resourceSpans": [{
+        "resource": {"attributes": [_attribute("service.name", SERVICE_NAME),
+                                    _attribute("process.pid", os.getpid())]},
+        "scopeSpans": [{"scope": {"name": "profiler"}, "spans": spans}],
+    }]}
+
+
+# ============================================================================
+# EXPORTERS
+# ============================================================================
+
+class FileExporter:
+    """Appends one OTLP/JSON line per trace to a file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, request):
+        line = json.dumps(request, separators=(",", ":")) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class OTLPExporter:
+    """POSTs traces to an OTLP/HTTP collector from a daemon thread."""
+
+    def __init__(self, endpoint, timeout=5):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+        self.queue = queue.Queue(QUEUE_SIZE)
+        threading.Thread(target=self._send_forever, name="dentsi-otlp", daemon=True).start()
+
+    def export(self, request):
+        try:
+            self.queue.put_nowait(request)
+        except queue.Full:
+            pass
+
+    def _send_forever(self):
+        while True:
+            request = self.queue.get()
+            body = json.dumps(request).encode("utf-8")
+            req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+            try:
+                urllib.request.urlopen(req, timeout=self.timeout).close()
+            except Exception:
+                pass
+
+
+_exporters = None
+_lock = threading.Lock()
+
+
+def start():
+    """Set up the exporters named in the environment once per process; returns them"""
+    global _exporters
+    if _exporters is not None:
+        return _exporters
+    with _lock:
+        if _exporters is None:
+            exporters = []
+            if os.environ.get(FILE_ENV):
+                exporters.append(FileExporter(os.environ[FILE_ENV]))
+            if os.environ.get(OTLP_ENV):
+                exporters.append(OTLPExporter(os.environ[OTLP_ENV]))
+            _exporters = exporters
+    return _exporters
+
+
+def export_run(run):
+    if not _exporters:
+        return
+    request = to_otlp(run)
+    for exporter in _exporters:
+        try:
+            exporter.export(request)
+        except Exception:
+            pass
+
+
+profiler.on_finish(export_run)
+
+
+# ============================================================================
+# OFFLINE VIEWER
+# ============================================================================
+
+def print_traces(path, out=sys.stdout):
+    """Each trace in an OTLP/JSON lines file as an indented tree with ms timings"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for resource in json.loads(line)["resourceSpans"]:
+                spans = [s for scope in resource["scopeSpans"] for s in scope["spans"]]
+                children = {}
+                for s in spans:
+                    children.setdefault(s.get("parentSpanId") or None, []).append(s)
+                roots = children.get(None, [])
+                start = min(int(s["startTimeUnixNano"]) for s in spans)
+
+                def show(span, depth):
+                    began = (int(span["startTimeUnixNano"]) - start) / 1e6
+                    took = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+                    flag = "  !" if span.get("status", {}).get("code") == STATUS_ERROR else ""
+                    print(f"{began:9.1f} {took:9.1f} ms  {'  ' * depth}{span['name']}{flag}", file=out)
+                    for child in sorted(children.get(span["spanId"], []), key=lambda s: int(s["startTimeUnixNano"])):
+                        show(child, depth + 1)
+
+                for root in roots:
+                    print(f"trace {root['traceId']}", file=out)
+                    show(root, 0)
+                    print(file=out)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python tracing.py TRACE_FILE")
+    print_traces(sys.argv[1])
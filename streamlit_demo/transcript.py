@@ -0,0 +1,178 @@
+"""
+Bounded chat transcript for the browser demo.
+
+The last MAX_TURNS turns of a conversation are kept in a ring buffer in
+session state; turns that fall off the front are appended to a
+TranscriptArchive (one JSON-lines file per conversation), so a long demo
+session holds a fixed amount of memory. Archive files of conversations
+idle for ARCHIVE_MAX_AGE are deleted, and at most ARCHIVE_MAX_FILES are
+kept.
+
+Each turn is rendered to HTML once, when it is appended, and the joined
+transcript is cached per version, so a rerun emits a single markdown
+element and only new turns are ever rendered.
+"""
+
+import hashlib
+import html
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+
+import chat_cache
+
+MAX_TURNS = 40
+
+ARCHIVE_DIR = Path(tempfile.gettempdir()) / "dentsi-transcripts"
+ARCHIVE_MAX_AGE = 24 * 3600
+ARCHIVE_MAX_FILES = 1000
+# Old files are looked for at most this often
+ARCHIVE_PRUNE_INTERVAL = 10 * 60
+
+TURN_HTML = {
+    "ai": '<div class="chat-bubble-ai"><strong>🦷 Dentsi:</strong> {message}</div>',
+    "user": '<div class="chat-bubble-user"><strong>You:</strong> {message}</div>',
+}
+
+
+def render_turn(turn):
+    """HTML bubble for one turn (text is escaped, newlines become <br>)"""
+    message = html.escape(turn["message"]).replace("\n", "<br>")
+    return TURN_HTML.get(turn["role"], TURN_HTML["user"]).format(message=message)
+
+
+class TranscriptArchive:
+    """Turns evicted from transcripts, stored as JSON lines per conversation."""
+
+    def __init__(self, directory=ARCHIVE_DIR, max_age=ARCHIVE_MAX_AGE, max_files=ARCHIVE_MAX_FILES):
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._pruned = 0.0
+
+    def _path(self, key):
+        return self.directory / f"{key}.jsonl"
+
+    def prune(self, now=None):
+        """Delete archives idle for max_age, then the oldest beyond max_files; returns the count"""
+        now = now or time.time()
+        files = []
+        for path in self.directory.glob("*.jsonl"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        files.sort(reverse=True)
+        removed = 0
+        for i, (mtime, path) in enumerate(files):
+            if i >= self.max_files or now - mtime > self.max_age:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def append(self, key, turn):
+        with self._lock:
+            now = time.time()
+            if now - self._pruned > ARCHIVE_PRUNE_INTERVAL:
+                self._pruned = now
+                self.prune(now)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), "a", encoding="utf-8") as f:
+                f.write(json.dumps(turn) + "\n")
+
+    def load(self, key):
+        """Archived turns of a conversation, oldest first"""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            return []
+
+    def discard(self, key):
+        with self._lock:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+
+class Transcript:
+    """Ring buffer of recent turns with incrementally rendered HTML."""
+
+    def __init__(self, turns=None, maxlen=MAX_TURNS, archive=None):
+        self.key = uuid.uuid4().hex
+        self.archive = archive
+        self.archived = 0
+        self.version = 0
+        self._turns = deque(maxlen=maxlen)
+        self._parts = deque(maxlen=maxlen)
+        # Running chat_cache.state_fingerprint over every user turn, archived ones included
+        self._digest = hashlib.sha1()
+        self._html = (None, "")
+        for turn in turns or []:
+            self.append(turn["role"], turn["message"])
+
+    def __len__(self):
+        return len(self._turns)
+
+    def __iter__(self):
+        return iter(self._turns)
+
+    def append(self, role, message):
+        turn = {"role": role, "message": message}
+        if len(self._turns) == self._turns.maxlen:
+            oldest = self._turns[0]
+            if self.archive is not None:
+                self.archive.append(self.key, oldest)
+            self.archived += 1
+        self._turns.append(turn)
+        self._parts.append(render_turn(turn))
+        if role == "user":
+            self._digest.update(chat_cache.normalize_utterance(message).encode("utf-8"))
+            self._digest.update(b"\0")
+        self.version += 1
+
+    def replace(self, index, message):
+        """Rewrite the AI turn numbered `index` (archived turns included); False once archived"""
+        position = index - self.archived
+        if not 0 <= position < len(self._turns) or self._turns[position]["role"] != "ai":
+            return False
+        turn = {"role": "ai", "message": message}
+        self._turns[position] = turn
+        self._parts[position] = render_turn(turn)
+        self.version += 1
+        return True
+
+    def fingerprint(self):
+        return self._digest.copy().hexdigest()
+
+    def html(self):
+        """The transcript as one HTML block, rebuilt only when a turn was added"""
+        version, cached = self._html
+        if version != self.version:
+            note = ""
+            if self.archived:
+                note = (f'<div style="text-align: center; color: #9CA3AF; font-size: 0.8rem;">'
+                        f'{self.archived} earlier turns archived</div>')
+            cached = f'<div class="chat-container">{note}{"".join(self._parts)}</div>'
+            self._html = (self.version, cached)
+        return cached
+
+    def archived_turns(self):
+        if self.archive is None:
+            return []
+        return self.archive.load(self.key)
+
+    def discard(self):
+        """Drop the archived turns (the conversation is being replaced)"""
+        if self.archive is not None:
+            self.archive.discard(self.key)